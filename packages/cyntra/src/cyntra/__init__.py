@@ -6,6 +6,26 @@ This package provides:
 - cyntra.agents: Agent framework with DSPy, LangGraph, memory, tools
 """
 
+import asyncio
+
 from cyntra import agents, commons
 
-__all__ = ["agents", "commons"]
+
+def use_uvloop() -> bool:
+    """Install uvloop as the asyncio event loop policy, if available.
+
+    Call once at app startup, before asyncio.run(). Requires the 'uvloop'
+    extra: pip install cyntra[uvloop]
+
+    Returns:
+        True if uvloop was installed, False if it is not available.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+__all__ = ["agents", "commons", "use_uvloop"]
@@ -12,72 +12,121 @@ apps/backend is responsible for exposing these agents over HTTP.
 
 __version__ = "0.1.0"
 
-# Configuration
-from cyntra.agents.config import (
-    DEFAULT_SETTINGS,
-    AgentBehaviorConfig,
-    AgentFeatureFlags,
-    AgentSettings,
-    CheckpointStoreConfig,
-    CheckpointStoreType,
-    get_coach_deployment,
-    get_glyph_deployment,
-    get_planner_deployment,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING
 
-# Graphs
-from cyntra.agents.graphs import (
-    GlyphEntrypoint,
-    GlyphMode,
-    GraphRouter,
-)
+if TYPE_CHECKING:
+    from cyntra.agents.config import (
+        DEFAULT_SETTINGS,
+        AgentBehaviorConfig,
+        AgentFeatureFlags,
+        AgentSettings,
+        CheckpointStoreConfig,
+        CheckpointStoreType,
+        LookupCacheConfig,
+        SemanticCacheConfig,
+        get_coach_deployment,
+        get_default_settings,
+        get_glyph_deployment,
+        get_planner_deployment,
+    )
+    from cyntra.agents.graphs import GlyphEntrypoint, GlyphMode, GraphRouter
+    from cyntra.agents.memory import (
+        BlocksRepository,
+        EpisodesRepository,
+        GraphRepository,
+        InMemoryBlocksRepository,
+        InMemoryEpisodesRepository,
+        InMemoryGraphRepository,
+        InMemoryMissionsRepository,
+        InMemorySemanticMemory,
+        InMemoryUserProfileRepository,
+        MissionsRepository,
+        RepositoryBundle,
+        SemanticMemory,
+        UserProfileRepository,
+        create_in_memory_repos,
+    )
+    from cyntra.agents.schemas import (
+        AgentMessage,
+        AgentResponse,
+        Block,
+        BlockStatus,
+        ChatRequest,
+        ChatResponse,
+        Episode,
+        EpisodeKind,
+        Mission,
+        MissionKind,
+        MissionStatus,
+        PlanMissionRequest,
+        PlanMissionResponse,
+        ReflectPeriodKind,
+        ReflectPeriodRequest,
+        ReflectPeriodResponse,
+        RunSessionRequest,
+        RunSessionResponse,
+        SurfaceType,
+        UserProfile,
+    )
+    from cyntra.agents.service import GlyphAgentService, KernelOrchestratorService, Telemetry
 
-# Memory interfaces and implementations
-from cyntra.agents.memory import (
-    # Interfaces
-    BlocksRepository,
-    EpisodesRepository,
-    GraphRepository,
-    # In-memory implementations
-    InMemoryBlocksRepository,
-    InMemoryEpisodesRepository,
-    InMemoryGraphRepository,
-    InMemoryMissionsRepository,
-    InMemorySemanticMemory,
-    InMemoryUserProfileRepository,
-    MissionsRepository,
-    RepositoryBundle,
-    SemanticMemory,
-    UserProfileRepository,
-    create_in_memory_repos,
-)
-
-# Schemas (re-export commonly used ones)
-from cyntra.agents.schemas import (
-    # API models
-    AgentMessage,
-    AgentResponse,
-    # Core models
-    Block,
-    BlockStatus,
-    ChatRequest,
-    ChatResponse,
-    Episode,
-    EpisodeKind,
-    Mission,
-    MissionKind,
-    MissionStatus,
-    PlanMissionRequest,
-    PlanMissionResponse,
-    ReflectPeriodKind,
-    ReflectPeriodRequest,
-    ReflectPeriodResponse,
-    RunSessionRequest,
-    RunSessionResponse,
-    SurfaceType,
-    UserProfile,
-)
-from cyntra.agents.service import GlyphAgentService, KernelOrchestratorService, Telemetry
+# Public names are resolved on first access so that importing a single
+# schema does not pull in LangGraph, DSPy, and the service layer.
+_LAZY: dict[str, str] = {
+    "GlyphAgentService": "cyntra.agents.service",
+    "KernelOrchestratorService": "cyntra.agents.service",
+    "Telemetry": "cyntra.agents.service",
+    "AgentBehaviorConfig": "cyntra.agents.config",
+    "AgentFeatureFlags": "cyntra.agents.config",
+    "AgentSettings": "cyntra.agents.config",
+    "CheckpointStoreConfig": "cyntra.agents.config",
+    "CheckpointStoreType": "cyntra.agents.config",
+    "DEFAULT_SETTINGS": "cyntra.agents.config",
+    "LookupCacheConfig": "cyntra.agents.config",
+    "SemanticCacheConfig": "cyntra.agents.config",
+    "get_coach_deployment": "cyntra.agents.config",
+    "get_default_settings": "cyntra.agents.config",
+    "get_glyph_deployment": "cyntra.agents.config",
+    "get_planner_deployment": "cyntra.agents.config",
+    "BlocksRepository": "cyntra.agents.memory",
+    "EpisodesRepository": "cyntra.agents.memory",
+    "GraphRepository": "cyntra.agents.memory",
+    "MissionsRepository": "cyntra.agents.memory",
+    "RepositoryBundle": "cyntra.agents.memory",
+    "SemanticMemory": "cyntra.agents.memory",
+    "UserProfileRepository": "cyntra.agents.memory",
+    "InMemoryBlocksRepository": "cyntra.agents.memory",
+    "InMemoryEpisodesRepository": "cyntra.agents.memory",
+    "InMemoryGraphRepository": "cyntra.agents.memory",
+    "InMemoryMissionsRepository": "cyntra.agents.memory",
+    "InMemorySemanticMemory": "cyntra.agents.memory",
+    "InMemoryUserProfileRepository": "cyntra.agents.memory",
+    "create_in_memory_repos": "cyntra.agents.memory",
+    "Block": "cyntra.agents.schemas",
+    "BlockStatus": "cyntra.agents.schemas",
+    "Episode": "cyntra.agents.schemas",
+    "EpisodeKind": "cyntra.agents.schemas",
+    "Mission": "cyntra.agents.schemas",
+    "MissionKind": "cyntra.agents.schemas",
+    "MissionStatus": "cyntra.agents.schemas",
+    "UserProfile": "cyntra.agents.schemas",
+    "AgentMessage": "cyntra.agents.schemas",
+    "AgentResponse": "cyntra.agents.schemas",
+    "ChatRequest": "cyntra.agents.schemas",
+    "ChatResponse": "cyntra.agents.schemas",
+    "PlanMissionRequest": "cyntra.agents.schemas",
+    "PlanMissionResponse": "cyntra.agents.schemas",
+    "ReflectPeriodKind": "cyntra.agents.schemas",
+    "ReflectPeriodRequest": "cyntra.agents.schemas",
+    "ReflectPeriodResponse": "cyntra.agents.schemas",
+    "RunSessionRequest": "cyntra.agents.schemas",
+    "RunSessionResponse": "cyntra.agents.schemas",
+    "SurfaceType": "cyntra.agents.schemas",
+    "GlyphEntrypoint": "cyntra.agents.graphs",
+    "GlyphMode": "cyntra.agents.graphs",
+    "GraphRouter": "cyntra.agents.graphs",
+}
 
 __all__ = [
     # Version
@@ -93,7 +142,10 @@ __all__ = [
     "CheckpointStoreConfig",
     "CheckpointStoreType",
     "DEFAULT_SETTINGS",
+    "LookupCacheConfig",
+    "SemanticCacheConfig",
     "get_coach_deployment",
+    "get_default_settings",
     "get_glyph_deployment",
     "get_planner_deployment",
     # Memory interfaces
@@ -139,3 +191,17 @@ __all__ = [
     "GlyphMode",
     "GraphRouter",
 ]
+
+
+def __getattr__(name: str) -> object:
+    """Lazily import public names from their defining submodule."""
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(__all__)
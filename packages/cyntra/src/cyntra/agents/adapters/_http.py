@@ -0,0 +1,69 @@
+"""Shared pooled HTTP client for adapters.
+
+Requires the 'http' extra: pip install cyntra[http]
+"""
+
+from typing import Any, Self
+
+
+class PooledHTTPAdapter:
+    """Base for adapters backed by an HTTP service.
+
+    connect() opens a single long-lived httpx.AsyncClient whose keep-alive
+    pool is reused by every call until disconnect(). Without a configured
+    base_url the adapter stays disconnected and serves local data only.
+
+    Config keys: base_url, timeout_seconds, max_connections,
+    max_keepalive_connections, keepalive_seconds.
+    """
+
+    def __init__(self, config: dict[str, Any] | None = None) -> None:
+        self._config = config or {}
+        self._connected = False
+        self._client: Any | None = None
+
+    async def connect(self) -> bool:
+        """Open the pooled client. Returns False when no base_url is configured."""
+        if self._client is not None:
+            return True
+        base_url = self._config.get("base_url")
+        if not base_url:
+            return False
+
+        try:
+            import httpx
+        except ImportError as e:
+            raise ImportError(
+                "httpx is required for adapter connections. Install with: pip install cyntra[http]"
+            ) from e
+
+        self._client = httpx.AsyncClient(
+            base_url=base_url,
+            timeout=self._config.get("timeout_seconds", 10.0),
+            limits=httpx.Limits(
+                max_connections=self._config.get("max_connections", 50),
+                max_keepalive_connections=self._config.get("max_keepalive_connections", 10),
+                keepalive_expiry=self._config.get("keepalive_seconds", 60.0),
+            ),
+        )
+        self._connected = True
+        return True
+
+    async def disconnect(self) -> None:
+        """Close the pooled client."""
+        client, self._client = self._client, None
+        self._connected = False
+        if client is not None:
+            await client.aclose()
+
+    @property
+    def is_connected(self) -> bool:
+        """Check if connected."""
+        return self._connected
+
+    async def __aenter__(self) -> Self:
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        await self.disconnect()
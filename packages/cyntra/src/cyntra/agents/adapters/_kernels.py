@@ -0,0 +1,114 @@
+"""Aggregation kernels over column-oriented event buffers.
+
+Adapters keep buffered events as parallel typed arrays (timestamps,
+integer codes, durations) instead of lists of dataclasses. These helpers
+reduce over those columns in a single pass without touching per-event
+Python objects.
+"""
+
+from array import array
+from collections.abc import Sequence
+from datetime import UTC, datetime
+
+
+def to_ns(ts: datetime) -> int:
+    """Convert a datetime to integer nanoseconds since the epoch.
+
+    Whole seconds and microseconds are converted separately so the result
+    is exact; naive datetimes are taken as local time, like timestamp().
+    """
+    return int(ts.replace(microsecond=0).timestamp()) * 1_000_000_000 + ts.microsecond * 1000
+
+
+def from_ns(ns: int) -> datetime:
+    """Convert integer nanoseconds since the epoch to an aware UTC datetime."""
+    return datetime.fromtimestamp(ns // 1_000_000_000, tz=UTC).replace(microsecond=ns // 1000 % 1_000_000)
+
+
+def rows_since(timestamps_ns: array, since_ns: int) -> list[int]:
+    """Get the indices of rows at or after since_ns."""
+    return [i for i, ts in enumerate(timestamps_ns) if ts >= since_ns]
+
+
+def take[C: (array, list)](column: C, rows: Sequence[int]) -> C:
+    """Select rows from a column, keeping its type (typed array or list)."""
+    if isinstance(column, array):
+        return array(column.typecode, (column[i] for i in rows))
+    return [column[i] for i in rows]
+
+
+def sum_by_code(
+    timestamps_ns: array,
+    codes: array,
+    weights: array,
+    since_ns: int,
+    size: int,
+) -> list[int]:
+    """Sum weights per integer code for rows at or after since_ns.
+
+    Args:
+        timestamps_ns: Event timestamps (int64 nanoseconds)
+        codes: Dense integer code per event, in range(size)
+        weights: Value to accumulate per event (e.g. duration seconds)
+        since_ns: Lower bound on timestamps to include
+        size: Number of distinct codes
+
+    Returns:
+        List of length size with the summed weight for each code.
+    """
+    out = [0] * size
+    for ts, code, weight in zip(timestamps_ns, codes, weights, strict=True):
+        if ts >= since_ns:
+            out[code] += weight
+    return out
+
+
+def sum_since(timestamps_ns: array, weights: array, since_ns: int) -> int:
+    """Sum weights for rows at or after since_ns."""
+    return sum(weight for ts, weight in zip(timestamps_ns, weights, strict=True) if ts >= since_ns)
+
+
+def any_code_in(timestamps_ns: array, codes: array, since_ns: int, code_set: frozenset[int]) -> bool | None:
+    """Check whether any row at or after since_ns has a code in code_set.
+
+    Returns None when no rows fall in the window.
+    """
+    seen = False
+    for ts, code in zip(timestamps_ns, codes, strict=True):
+        if ts >= since_ns:
+            if code in code_set:
+                return True
+            seen = True
+    return False if seen else None
+
+
+class Vocab:
+    """Interns strings to dense integer codes for column storage."""
+
+    __slots__ = ("_codes", "_values")
+
+    def __init__(self, initial: Sequence[str] = ()) -> None:
+        self._codes: dict[str, int] = {}
+        self._values: list[str] = []
+        for value in initial:
+            self.encode(value)
+
+    def encode(self, value: str) -> int:
+        """Get the code for a value, assigning a new one if unseen."""
+        code = self._codes.get(value)
+        if code is None:
+            code = len(self._values)
+            self._codes[value] = code
+            self._values.append(value)
+        return code
+
+    def lookup(self, value: str) -> int | None:
+        """Get the code for a value without assigning one."""
+        return self._codes.get(value)
+
+    def decode(self, code: int) -> str:
+        """Get the value for a code."""
+        return self._values[code]
+
+    def __len__(self) -> int:
+        return len(self._values)
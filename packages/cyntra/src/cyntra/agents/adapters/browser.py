@@ -4,12 +4,20 @@ Will integrate with Sideglyph browser extension to track
 browsing activity and detect leaks.
 """
 
+import time
+from array import array
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 
+from ._http import PooledHTTPAdapter
+from ._kernels import Vocab, any_code_in, from_ns, rows_since, sum_by_code, take, to_ns
 
-@dataclass
+CATEGORIES = ("in_scope", "leak", "neutral")
+
+
+@dataclass(slots=True, frozen=True)
 class BrowsingEvent:
     """A browsing event from Sideglyph."""
 
@@ -21,29 +29,58 @@ class BrowsingEvent:
     category: str  # 'in_scope', 'leak', 'neutral'
 
 
-class BrowserAdapter:
-    """Adapter for browser/Sideglyph integration.
+class _BrowsingBuffer:
+    """Per-user browsing events stored column-wise."""
 
-    MVP: Stub implementation that returns empty data.
-    """
+    __slots__ = ("ts_ns", "cat", "dur", "domain_id", "urls", "titles")
 
-    def __init__(self, config: dict[str, Any] | None = None) -> None:
-        self._config = config or {}
-        self._connected = False
+    def __init__(self) -> None:
+        self.ts_ns = array("q")
+        self.cat = array("b")
+        self.dur = array("l")
+        self.domain_id = array("l")
+        self.urls: list[str] = []
+        self.titles: list[str] = []
 
-    async def connect(self) -> bool:
-        """Connect to Sideglyph service."""
-        # Stub - always returns False (not connected)
-        return False
+    def trim(self, since_ns: int) -> None:
+        """Drop rows older than since_ns."""
+        rows = rows_since(self.ts_ns, since_ns)
+        for name in self.__slots__:
+            setattr(self, name, take(getattr(self, name), rows))
 
-    async def disconnect(self) -> None:
-        """Disconnect from Sideglyph service."""
-        self._connected = False
 
-    @property
-    def is_connected(self) -> bool:
-        """Check if connected to Sideglyph."""
-        return self._connected
+class BrowserAdapter(PooledHTTPAdapter):
+    """Adapter for browser/Sideglyph integration.
+
+    MVP: Serves aggregates from events pushed via record_events().
+    Buffered events older than config["retention_minutes"] (default 60,
+    the longest default query window) are dropped as new events arrive.
+    """
+
+    def __init__(self, config: dict[str, Any] | None = None) -> None:
+        super().__init__(config)
+        self._buffers: dict[str, _BrowsingBuffer] = {}
+        self._categories = Vocab(CATEGORIES)
+        self._domains = Vocab()
+        self._retention_ns = self._config.get("retention_minutes", 60) * 60_000_000_000
+
+    def record_events(self, user_id: str, events: Iterable[BrowsingEvent]) -> None:
+        """Buffer browsing events pushed from Sideglyph."""
+        buf = self._buffers.get(user_id)
+        if buf is None:
+            buf = self._buffers[user_id] = _BrowsingBuffer()
+        for event in events:
+            buf.ts_ns.append(to_ns(event.timestamp))
+            buf.cat.append(self._categories.encode(event.category))
+            buf.dur.append(event.duration_seconds)
+            buf.domain_id.append(self._domains.encode(event.domain))
+            buf.urls.append(event.url)
+            buf.titles.append(event.title)
+
+        # Drop expired rows once the oldest buffered row falls out of retention
+        since_ns = time.time_ns() - self._retention_ns
+        if buf.ts_ns and buf.ts_ns[0] < since_ns:
+            buf.trim(since_ns)
 
     async def get_recent_events(
         self,
@@ -51,8 +88,22 @@ class BrowserAdapter:
         minutes: int = 30,
     ) -> list[BrowsingEvent]:
         """Get recent browsing events."""
-        # Stub - returns empty list
-        return []
+        buf = self._buffers.get(user_id)
+        if buf is None:
+            return []
+        since_ns = time.time_ns() - minutes * 60_000_000_000
+        return [
+            BrowsingEvent(
+                timestamp=from_ns(ts),
+                domain=self._domains.decode(buf.domain_id[i]),
+                url=buf.urls[i],
+                title=buf.titles[i],
+                duration_seconds=buf.dur[i],
+                category=self._categories.decode(buf.cat[i]),
+            )
+            for i, ts in enumerate(buf.ts_ns)
+            if ts >= since_ns
+        ]
 
     async def get_current_domain(self, user_id: str) -> str | None:
         """Get the domain the user is currently on."""
@@ -64,19 +115,31 @@ class BrowserAdapter:
         user_id: str,
         minutes: int = 60,
     ) -> dict[str, int]:
-        """Get time spent by category in the last N minutes."""
-        # Stub
-        return {
-            "in_scope": 0,
-            "leak": 0,
-            "neutral": 0,
-        }
+        """Get seconds spent by category in the last N minutes."""
+        buf = self._buffers.get(user_id)
+        if buf is None:
+            return dict.fromkeys(CATEGORIES, 0)
+        since_ns = time.time_ns() - minutes * 60_000_000_000
+        totals = sum_by_code(buf.ts_ns, buf.cat, buf.dur, since_ns, len(self._categories))
+        return {self._categories.decode(code): total for code, total in enumerate(totals)}
 
     async def is_in_scope(
         self,
         user_id: str,
         mission_domains: list[str] | None = None,
+        minutes: int = 5,
     ) -> bool:
-        """Check if current browsing is in-scope for the mission."""
-        # Stub - assume in scope
-        return True
+        """Check if current browsing is in-scope for the mission.
+
+        Browsing is in scope when any event in the last N minutes is on a
+        mission domain. With no mission domains or no recent events, the
+        user is assumed to be in scope.
+        """
+        buf = self._buffers.get(user_id)
+        if not mission_domains or buf is None:
+            return True
+        # Compare interned domain ids rather than strings per event
+        scope_ids = frozenset(code for domain in mission_domains if (code := self._domains.lookup(domain)) is not None)
+        since_ns = time.time_ns() - minutes * 60_000_000_000
+        in_scope = any_code_in(buf.ts_ns, buf.domain_id, since_ns, scope_ids)
+        return True if in_scope is None else in_scope
@@ -6,10 +6,11 @@ user availability.
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any
 
+from ._http import PooledHTTPAdapter
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class CalendarEvent:
     """A calendar event."""
 
@@ -22,7 +23,7 @@ class CalendarEvent:
     is_busy: bool  # vs. free/tentative
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TimeSlot:
     """A time slot (free or busy)."""
 
@@ -31,30 +32,12 @@ class TimeSlot:
     is_free: bool
 
 
-class CalendarAdapter:
+class CalendarAdapter(PooledHTTPAdapter):
     """Adapter for calendar integration.
 
     MVP: Stub implementation that returns empty data.
     """
 
-    def __init__(self, config: dict[str, Any] | None = None) -> None:
-        self._config = config or {}
-        self._connected = False
-
-    async def connect(self) -> bool:
-        """Connect to calendar service."""
-        # Stub
-        return False
-
-    async def disconnect(self) -> None:
-        """Disconnect from calendar."""
-        self._connected = False
-
-    @property
-    def is_connected(self) -> bool:
-        """Check if connected."""
-        return self._connected
-
     async def get_events(
         self,
         user_id: str,
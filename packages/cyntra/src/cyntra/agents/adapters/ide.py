@@ -4,12 +4,18 @@ Will integrate with VS Code extension or similar to track
 coding activity.
 """
 
+import time
+from array import array
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 
+from ._http import PooledHTTPAdapter
+from ._kernels import Vocab, from_ns, rows_since, sum_by_code, sum_since, take, to_ns
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class CodingEvent:
     """A coding activity event."""
 
@@ -22,29 +28,60 @@ class CodingEvent:
     duration_seconds: int
 
 
-class IDEAdapter:
-    """Adapter for IDE/coding activity integration.
+class _CodingBuffer:
+    """Per-user coding events stored column-wise."""
 
-    MVP: Stub implementation that returns empty data.
-    """
+    __slots__ = ("ts_ns", "lang", "dur", "lines", "removed", "project_id", "file_paths")
 
-    def __init__(self, config: dict[str, Any] | None = None) -> None:
-        self._config = config or {}
-        self._connected = False
+    def __init__(self) -> None:
+        self.ts_ns = array("q")
+        self.lang = array("l")
+        self.dur = array("l")
+        self.lines = array("l")
+        self.removed = array("l")
+        self.project_id = array("l")
+        self.file_paths: list[str] = []
 
-    async def connect(self) -> bool:
-        """Connect to IDE tracking service."""
-        # Stub
-        return False
+    def trim(self, since_ns: int) -> None:
+        """Drop rows older than since_ns."""
+        rows = rows_since(self.ts_ns, since_ns)
+        for name in self.__slots__:
+            setattr(self, name, take(getattr(self, name), rows))
 
-    async def disconnect(self) -> None:
-        """Disconnect from IDE tracking."""
-        self._connected = False
 
-    @property
-    def is_connected(self) -> bool:
-        """Check if connected."""
-        return self._connected
+class IDEAdapter(PooledHTTPAdapter):
+    """Adapter for IDE/coding activity integration.
+
+    MVP: Serves aggregates from events pushed via record_events().
+    Buffered events older than config["retention_minutes"] (default 60,
+    the longest default query window) are dropped as new events arrive.
+    """
+
+    def __init__(self, config: dict[str, Any] | None = None) -> None:
+        super().__init__(config)
+        self._buffers: dict[str, _CodingBuffer] = {}
+        self._languages = Vocab()
+        self._projects = Vocab()
+        self._retention_ns = self._config.get("retention_minutes", 60) * 60_000_000_000
+
+    def record_events(self, user_id: str, events: Iterable[CodingEvent]) -> None:
+        """Buffer coding events pushed from the IDE extension."""
+        buf = self._buffers.get(user_id)
+        if buf is None:
+            buf = self._buffers[user_id] = _CodingBuffer()
+        for event in events:
+            buf.ts_ns.append(to_ns(event.timestamp))
+            buf.lang.append(self._languages.encode(event.language))
+            buf.dur.append(event.duration_seconds)
+            buf.lines.append(event.lines_added)
+            buf.removed.append(event.lines_removed)
+            buf.project_id.append(self._projects.encode(event.project))
+            buf.file_paths.append(event.file_path)
+
+        # Drop expired rows once the oldest buffered row falls out of retention
+        since_ns = time.time_ns() - self._retention_ns
+        if buf.ts_ns and buf.ts_ns[0] < since_ns:
+            buf.trim(since_ns)
 
     async def get_recent_events(
         self,
@@ -52,8 +89,23 @@ class IDEAdapter:
         minutes: int = 30,
     ) -> list[CodingEvent]:
         """Get recent coding events."""
-        # Stub
-        return []
+        buf = self._buffers.get(user_id)
+        if buf is None:
+            return []
+        since_ns = time.time_ns() - minutes * 60_000_000_000
+        return [
+            CodingEvent(
+                timestamp=from_ns(ts),
+                project=self._projects.decode(buf.project_id[i]),
+                file_path=buf.file_paths[i],
+                language=self._languages.decode(buf.lang[i]),
+                lines_added=buf.lines[i],
+                lines_removed=buf.removed[i],
+                duration_seconds=buf.dur[i],
+            )
+            for i, ts in enumerate(buf.ts_ns)
+            if ts >= since_ns
+        ]
 
     async def get_current_project(self, user_id: str) -> str | None:
         """Get the project the user is currently working on."""
@@ -70,9 +122,13 @@ class IDEAdapter:
         user_id: str,
         minutes: int = 60,
     ) -> dict[str, int]:
-        """Get coding time by language."""
-        # Stub
-        return {}
+        """Get coding seconds by language."""
+        buf = self._buffers.get(user_id)
+        if buf is None:
+            return {}
+        since_ns = time.time_ns() - minutes * 60_000_000_000
+        totals = sum_by_code(buf.ts_ns, buf.lang, buf.dur, since_ns, len(self._languages))
+        return {self._languages.decode(code): total for code, total in enumerate(totals) if total}
 
     async def get_lines_written(
         self,
@@ -80,5 +136,8 @@ class IDEAdapter:
         minutes: int = 60,
     ) -> int:
         """Get total lines written in the period."""
-        # Stub
-        return 0
+        buf = self._buffers.get(user_id)
+        if buf is None:
+            return 0
+        since_ns = time.time_ns() - minutes * 60_000_000_000
+        return sum_since(buf.ts_ns, buf.lines, since_ns)
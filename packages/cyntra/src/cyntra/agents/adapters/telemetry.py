@@ -4,11 +4,21 @@ Provides structured logging and metrics collection.
 """
 
 import logging
-from datetime import datetime
+import time
 from typing import Any
 
 logger = logging.getLogger("cyntra.agents")
 
+# level name -> (level number, bound logger method), resolved once
+_LOG_FUNCS = {
+    "debug": (logging.DEBUG, logger.debug),
+    "info": (logging.INFO, logger.info),
+    "warning": (logging.WARNING, logger.warning),
+    "error": (logging.ERROR, logger.error),
+    "exception": (logging.ERROR, logger.exception),
+    "critical": (logging.CRITICAL, logger.critical),
+}
+
 
 class TelemetryAdapter:
     """Adapter for telemetry, logging, and tracing.
@@ -25,6 +35,8 @@ class TelemetryAdapter:
         self._service_name = service_name
         self._config = config or {}
         self._enabled = self._config.get("enabled", True)
+        # Keys present on every record, merged with dict | per call
+        self._base: dict[str, Any] = {"service": service_name}
 
     def log_event(
         self,
@@ -35,16 +47,16 @@ class TelemetryAdapter:
         """Log a structured event."""
         if not self._enabled:
             return
+        levelno, log_func = _LOG_FUNCS.get(level, _LOG_FUNCS["info"])
+        # Skip building the payload when the record would be discarded
+        if not logger.isEnabledFor(levelno):
+            return
 
-        log_data = {
-            "service": self._service_name,
-            "event": event_name,
-            "timestamp": datetime.now().isoformat(),
-            **(data or {}),
-        }
+        log_data = self._base | {"event": event_name}
+        if data:
+            log_data |= data
 
-        log_func = getattr(logger, level, logger.info)
-        log_func(f"{event_name}: {log_data}")
+        log_func("%s: %s", event_name, log_data)
 
     def log_error(
         self,
@@ -52,18 +64,14 @@ class TelemetryAdapter:
         context: dict[str, Any] | None = None,
     ) -> None:
         """Log an error with context."""
-        if not self._enabled:
+        if not self._enabled or not logger.isEnabledFor(logging.ERROR):
             return
 
-        log_data = {
-            "service": self._service_name,
-            "error_type": type(error).__name__,
-            "error_message": str(error),
-            "timestamp": datetime.now().isoformat(),
-            **(context or {}),
-        }
+        log_data = self._base | {"error_type": type(error).__name__, "error_message": str(error)}
+        if context:
+            log_data |= context
 
-        logger.error(f"Error: {log_data}", exc_info=True)
+        logger.error("Error: %s", log_data, exc_info=True)
 
     def start_span(self, name: str) -> "TelemetrySpan":
         """Start a telemetry span for tracing."""
@@ -76,11 +84,11 @@ class TelemetryAdapter:
         tags: dict[str, str] | None = None,
     ) -> None:
         """Record a metric value."""
-        if not self._enabled:
+        if not self._enabled or not logger.isEnabledFor(logging.DEBUG):
             return
 
         # MVP: Just log the metric
-        logger.debug(f"Metric {name}={value} tags={tags}")
+        logger.debug("Metric %s=%s tags=%s", name, value, tags)
 
 
 class TelemetrySpan:
@@ -89,7 +97,7 @@ class TelemetrySpan:
     def __init__(self, adapter: TelemetryAdapter, name: str) -> None:
         self._adapter = adapter
         self._name = name
-        self._start_time = datetime.now()
+        self._start_ns = time.monotonic_ns()
         self._attributes: dict[str, Any] = {}
 
     def set_attribute(self, key: str, value: Any) -> None:
@@ -98,7 +106,9 @@ class TelemetrySpan:
 
     def end(self) -> None:
         """End the span."""
-        duration_ms = (datetime.now() - self._start_time).total_seconds() * 1000
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        duration_ms = (time.monotonic_ns() - self._start_ns) / 1e6
         self._adapter.log_event(
             f"span.{self._name}",
             {
@@ -1,5 +1,6 @@
 """Configuration settings for the agents package."""
 
+import functools
 from enum import Enum
 
 from pydantic_settings import SettingsConfigDict
@@ -22,6 +23,23 @@ class CheckpointStoreConfig(BaseSchema):
     connection_string: str | None = None
 
 
+class LookupCacheConfig(BaseSchema):
+    """Configuration for caching repository reads made by graph nodes."""
+
+    enabled: bool = False
+    ttl_seconds: int = 60
+    max_entries: int = 2048
+
+
+class SemanticCacheConfig(BaseSchema):
+    """Configuration for the embedding-keyed chat response and similar-mission caches."""
+
+    enabled: bool = False
+    threshold: float = 0.92  # Minimum cosine similarity for a hit
+    ttl_seconds: int = 600
+    max_entries: int = 2048
+
+
 class AgentBehaviorConfig(BaseSchema):
     """Agent-specific behavior tuning."""
 
@@ -30,6 +48,13 @@ class AgentBehaviorConfig(BaseSchema):
     reflection_prompt_delay_seconds: int = 300  # 5 minutes after block ends
     temperature: float = 0.7
     max_tokens: int = 4096
+    batch_max_concurrency: int = 8  # in-flight requests for GlyphAgentService.run_batch
+    enable_parallel_tool_execution: bool = True  # gather independent tool calls concurrently
+    memoize_embeddings: bool = True  # reuse embeddings for repeated prompt text
+    embedding_memo_size: int = 256
+    # Conversation session storage: ":memory:" gives each session a private
+    # database; a file path shares one WAL-mode database across sessions
+    session_db_path: str = ":memory:"
 
 
 class AgentFeatureFlags(BaseSchema):
@@ -39,6 +64,7 @@ class AgentFeatureFlags(BaseSchema):
     enable_browser_signals: bool = False
     enable_ide_signals: bool = False
     enable_calendar_signals: bool = False
+    use_uvloop: bool = True  # Run run_batch() on uvloop when it is installed
 
 
 class AgentSettings(BaseSettings):
@@ -67,6 +93,12 @@ class AgentSettings(BaseSettings):
     # Behavior tuning
     behavior: AgentBehaviorConfig = AgentBehaviorConfig()
 
+    # Repository read caching (period stats, profiles, today's blocks)
+    lookup_cache: LookupCacheConfig = LookupCacheConfig()
+
+    # Semantic chat response caching
+    semantic_cache: SemanticCacheConfig = SemanticCacheConfig()
+
 
 # Convenience accessor for the main Glyph deployment
 def get_glyph_deployment(settings: AgentSettings) -> LLMDeployment:
@@ -84,5 +116,18 @@ def get_coach_deployment(settings: AgentSettings) -> LLMDeployment:
     return settings.llm.get_deployment("coach")
 
 
-# Default settings for development/testing
-DEFAULT_SETTINGS = AgentSettings()
+@functools.cache
+def get_default_settings() -> AgentSettings:
+    """Get the default settings for development/testing.
+
+    Built on first call so importing this module does not read the
+    environment.
+    """
+    return AgentSettings()
+
+
+def __getattr__(name: str) -> object:
+    """Resolve DEFAULT_SETTINGS lazily via get_default_settings()."""
+    if name == "DEFAULT_SETTINGS":
+        return get_default_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
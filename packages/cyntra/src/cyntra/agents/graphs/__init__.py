@@ -2,14 +2,10 @@
 
 from .archivist_graph import ArchivistGraph, run_archivist
 from .base import (
-    GlyphContext,
     GlyphMode,
-    GlyphState,
     GlyphStateDict,
     create_initial_state,
-    dict_to_state,
     get_state_schema,
-    state_to_dict,
 )
 from .coach_graph import CoachGraph, run_coach
 from .planner_graph import PlannerGraph, run_planner
@@ -17,14 +13,10 @@ from .router import GlyphEntrypoint, GraphRouter
 
 __all__ = [
     # Base types
-    "GlyphContext",
     "GlyphMode",
-    "GlyphState",
     "GlyphStateDict",
     "create_initial_state",
-    "dict_to_state",
     "get_state_schema",
-    "state_to_dict",
     # Graphs
     "ArchivistGraph",
     "CoachGraph",
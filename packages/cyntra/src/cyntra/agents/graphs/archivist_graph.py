@@ -3,11 +3,14 @@
 Helps users reflect on sessions, days, and missions.
 """
 
+import asyncio
 from datetime import date, datetime, timedelta
-from typing import Any
+from typing import ClassVar
 
 from langgraph.graph import END, StateGraph
+from langgraph.graph.state import CompiledStateGraph
 
+from cyntra.agents.memory.cache import LookupCache, read_through
 from cyntra.agents.memory.interfaces import RepositoryBundle
 from cyntra.agents.schemas import (
     Episode,
@@ -16,11 +19,24 @@ from cyntra.agents.schemas import (
     ReflectPeriodKind,
     ReflectPeriodRequest,
     ReflectPeriodResponse,
-    UserProfile,
 )
-from cyntra.agents.tools import MemoryTools, MissionTools, TimelineTools
 
-from .base import GlyphStateDict
+from .base import GlyphStateDict, bound_node, graph_run_config, none_result, repo_tools
+
+# Precomputed value -> member lookup; unknown values fall back to a default
+# instead of raising from the Enum constructor.
+_EPISODE_KIND_MAP = {k.value: k for k in EpisodeKind}
+
+# How far back each reflection period looks from today
+_PERIOD_LOOKBACK = {
+    ReflectPeriodKind.BLOCK: timedelta(0),
+    ReflectPeriodKind.DAY: timedelta(0),
+    ReflectPeriodKind.WEEK: timedelta(days=7),
+    ReflectPeriodKind.MISSION: timedelta(days=30),  # Look back a month
+}
+
+# Request-independent part of the initial state; copied and filled per run.
+_ARCHIVIST_STATE_TEMPLATE: GlyphStateDict = {"mode": "archivist", "scratchpad": ""}
 
 
 class ArchivistGraph:
@@ -29,168 +45,171 @@ class ArchivistGraph:
     Nodes:
     1. load_period_data - Load relevant data for the reflection period
     2. compute_stats - Calculate statistics for the period
-    3. identify_patterns - Look for patterns and insights
-    4. write_episode - Create the reflection episode
-    5. update_profile - Update user profile stats
+    3. analyze - Look for patterns and insights, build the summary
+    4. persist - Save the reflection episode and update user profile stats
     """
 
+    _compiled_graph: ClassVar[CompiledStateGraph | None] = None
+
     def __init__(
         self,
         repos: RepositoryBundle,
+        *,
+        lookup_cache: LookupCache | None = None,
     ) -> None:
         self._repos = repos
-        self._memory_tools = MemoryTools(repos.episodes, repos.profiles, repos.semantic_memory)
-        self._mission_tools = MissionTools(repos.missions, repos.semantic_memory)
-        self._timeline_tools = TimelineTools(repos.blocks, repos.missions)
+        self._lookup_cache = lookup_cache
+        tools = repo_tools(repos)
+        self._memory_tools = tools.memory
+        self._mission_tools = tools.missions
+        self._timeline_tools = tools.timeline
 
     async def _load_period_data(self, state: GlyphStateDict) -> GlyphStateDict:
         """Load data for the reflection period."""
-        context = state.get("context", {})
-        user_id = context.get("user_id", "")
-        request_data = state.get("outputs", {}).get("request", {})
+        user_id = state["context"]["user_id"]
+        outputs = state["outputs"]
+        request: ReflectPeriodRequest = outputs["request"]
 
-        kind = ReflectPeriodKind(request_data.get("kind", "session"))
+        kind = request.kind
 
         # Determine date range based on kind
         end_date = date.today()
-        if kind == ReflectPeriodKind.BLOCK:
-            start_date = end_date
-        elif kind == ReflectPeriodKind.DAY:
-            start_date = end_date
-        elif kind == ReflectPeriodKind.WEEK:
-            start_date = end_date - timedelta(days=7)
-        else:  # MISSION
-            start_date = end_date - timedelta(days=30)  # Look back a month
+        start_date = end_date - _PERIOD_LOOKBACK[kind]
 
         # Override with request dates if provided
-        if request_data.get("start_date"):
-            start_date = date.fromisoformat(request_data["start_date"])
-        if request_data.get("end_date"):
-            end_date = date.fromisoformat(request_data["end_date"])
-
-        # Load block if reflecting on a specific block
-        block_data = None
-        if request_data.get("block_id"):
-            block = await self._timeline_tools.get_block(request_data["block_id"])
-            if block:
-                block_data = block.model_dump()
-
-        # Load mission if specified
-        mission_data = None
-        if request_data.get("mission_id"):
-            mission = await self._mission_tools.get_mission(request_data["mission_id"])
-            if mission:
-                mission_data = mission.model_dump()
-
-        # Load episodes for the period
-        episodes = await self._memory_tools.get_episodes_for_period(user_id, start_date, end_date)
-
-        # Load user profile
-        profile = await self._memory_tools.get_user_profile(user_id)
-
-        state["outputs"]["period"] = {
+        if request.start_date:
+            start_date = request.start_date
+        if request.end_date:
+            end_date = request.end_date
+
+        # Independent lookups run concurrently
+        block, mission, episodes, profile = await asyncio.gather(
+            self._timeline_tools.get_block(request.block_id) if request.block_id else none_result(),
+            self._mission_tools.get_mission(request.mission_id) if request.mission_id else none_result(),
+            self._memory_tools.get_episodes_for_period(user_id, start_date, end_date),
+            read_through(
+                self._lookup_cache, user_id, ("profile",), lambda: self._memory_tools.get_user_profile(user_id)
+            ),
+        )
+        outputs["period"] = {
             "kind": kind.value,
-            "start_date": start_date.isoformat(),
-            "end_date": end_date.isoformat(),
+            "start_date": start_date,
+            "end_date": end_date,
         }
-        state["outputs"]["block"] = block_data
-        state["outputs"]["mission"] = mission_data
-        state["outputs"]["period_episodes"] = [e.model_dump() for e in episodes]
-        state["outputs"]["profile"] = profile.model_dump()
+        # Models are kept as-is in state; serialization happens at the API boundary
+        outputs["block"] = block
+        outputs["mission"] = mission
+        outputs["period_episodes"] = episodes
+        outputs["profile"] = profile
 
         return state
 
     async def _compute_stats(self, state: GlyphStateDict) -> GlyphStateDict:
         """Compute statistics for the period."""
-        context = state.get("context", {})
-        user_id = context.get("user_id", "")
-        outputs = state.get("outputs", {})
+        user_id = state["context"]["user_id"]
+        outputs = state["outputs"]
         period = outputs.get("period", {})
 
-        start_date = date.fromisoformat(period["start_date"])
-        end_date = date.fromisoformat(period["end_date"])
+        start_date = period["start_date"]
+        end_date = period["end_date"]
 
         # Compute stats
-        stats = await self._memory_tools.compute_period_stats(user_id, start_date, end_date)
+        stats = await read_through(
+            self._lookup_cache,
+            user_id,
+            ("period_stats", start_date, end_date),
+            lambda: self._memory_tools.compute_period_stats(user_id, start_date, end_date),
+        )
 
-        # Add completion rate
+        # Add completion rate (on a copy - stats may be shared via the lookup cache)
         if stats["blocks_completed"] > 0:
             # Rough estimate - would need more data for accurate calculation
-            stats["completion_rate"] = min(1.0, stats["blocks_completed"] / 5)  # Assume 5 planned
+            stats = {**stats, "completion_rate": min(1.0, stats["blocks_completed"] / 5)}  # Assume 5 planned
 
-        state["outputs"]["stats"] = stats
+        outputs["stats"] = stats
         return state
 
-    def _identify_patterns(self, state: GlyphStateDict) -> GlyphStateDict:
-        """Identify patterns from the data."""
-        outputs = state.get("outputs", {})
+    def _analyze(self, state: GlyphStateDict) -> GlyphStateDict:
+        """Identify patterns from the stats and build the summary message."""
+        outputs = state["outputs"]
         stats = outputs.get("stats", {})
 
-        patterns: list[dict[str, Any]] = []
-        highlights: list[str] = []
-        challenges: list[str] = []
-
         # Analyze stats
-        focused = stats.get("total_focused_minutes", 0)
-        leaked = stats.get("total_leaked_minutes", 0)
-        blocks = stats.get("blocks_completed", 0)
+        get = stats.get
+        focused = get("total_focused_minutes", 0)
+        leaked = get("total_leaked_minutes", 0)
+        blocks = get("blocks_completed", 0)
+        avg_focus = get("avg_focus_score", 0)
+        avg_energy = get("avg_energy_score", 0)
 
+        highlights: list[str] = []
         if blocks > 0:
             highlights.append(f"Completed {blocks} focus blocks")
-
         if focused > 60:
             highlights.append(f"Total focus time: {focused} minutes")
 
-        if leaked > 30:
-            challenges.append(f"Leak time: {leaked} minutes")
+        challenges = [f"Leak time: {leaked} minutes"] if leaked > 30 else []
 
         # Simple pattern detection
-        avg_focus = stats.get("avg_focus_score", 0)
+        patterns: list[PatternInsight] = []
         if avg_focus >= 4:
             patterns.append(
-                {
-                    "description": "Your focus has been strong this period",
-                    "confidence": 0.7,
-                    "supporting_data": f"Average focus score: {avg_focus:.1f}/5",
-                }
+                PatternInsight(
+                    description="Your focus has been strong this period",
+                    confidence=0.7,
+                    supporting_data=f"Average focus score: {avg_focus:.1f}/5",
+                )
             )
-        elif avg_focus > 0 and avg_focus < 3:
+        elif 0 < avg_focus < 3:
             patterns.append(
-                {
-                    "description": "Focus has been challenging - consider shorter blocks",
-                    "confidence": 0.6,
-                    "suggested_action": "Try 25-minute blocks instead of longer ones",
-                }
+                PatternInsight(
+                    description="Focus has been challenging - consider shorter blocks",
+                    confidence=0.6,
+                    suggested_action="Try 25-minute blocks instead of longer ones",
+                )
             )
 
         # Energy patterns
-        avg_energy = stats.get("avg_energy_score", 0)
-        if avg_energy > 0 and avg_energy < 3:
+        if 0 < avg_energy < 3:
             patterns.append(
-                {
-                    "description": "Energy levels have been lower than usual",
-                    "confidence": 0.5,
-                    "suggested_action": "Consider rest or lighter sessions",
-                }
+                PatternInsight(
+                    description="Energy levels have been lower than usual",
+                    confidence=0.5,
+                    suggested_action="Consider rest or lighter sessions",
+                )
             )
 
-        state["outputs"]["patterns"] = patterns
-        state["outputs"]["highlights"] = highlights
-        state["outputs"]["challenges"] = challenges
+        # Build summary message
+        summary_parts = []
+        if highlights:
+            summary_parts.append("Highlights: " + ", ".join(highlights))
+        if challenges:
+            summary_parts.append("Challenges: " + ", ".join(challenges))
+
+        outputs["patterns"] = patterns
+        outputs["highlights"] = highlights
+        outputs["challenges"] = challenges
+        outputs["final_summary"] = ". ".join(summary_parts) if summary_parts else "Reflection complete."
+        outputs["suggestions"] = [p.suggested_action for p in patterns if p.suggested_action]
 
         return state
 
-    async def _write_episode(self, state: GlyphStateDict) -> GlyphStateDict:
-        """Create the reflection episode."""
-        context = state.get("context", {})
-        user_id = context.get("user_id", "")
-        outputs = state.get("outputs", {})
-        request_data = outputs.get("request", {})
+    async def _persist(self, state: GlyphStateDict) -> GlyphStateDict:
+        """Save the reflection episode and update profile stats.
+
+        Both writes depend only on stats already in state, so they are
+        issued concurrently.
+        """
+        user_id = state["context"]["user_id"]
+        outputs = state["outputs"]
+        request: ReflectPeriodRequest = outputs["request"]
         period = outputs.get("period", {})
         stats = outputs.get("stats", {})
 
         kind_str = period.get("kind", "session")
-        kind = EpisodeKind(kind_str)
+        # Block and week periods have no EpisodeKind of their own and are
+        # recorded as session episodes.
+        kind = _EPISODE_KIND_MAP.get(kind_str, EpisodeKind.SESSION)
 
         # Build summary
         summary_parts = []
@@ -201,157 +220,115 @@ class ArchivistGraph:
 
         summary = ". ".join(summary_parts) if summary_parts else "Reflection recorded"
 
-        # Get user-provided scores
-        focus_score = request_data.get("focus_score")
-        energy_score = request_data.get("energy_score")
-
-        # Create episode
-        episode = await self._memory_tools.save_episode(
-            user_id=user_id,
-            kind=kind,
-            summary=summary,
-            mission_id=request_data.get("mission_id"),
-            block_id=request_data.get("block_id"),
-            reflection=request_data.get("user_reflection"),
-            focus_score=focus_score,
-            energy_score=energy_score,
-            time_focused_minutes=stats.get("total_focused_minutes"),
-            time_leaked_minutes=stats.get("total_leaked_minutes"),
-            tags=[kind_str] + (["has_reflection"] if request_data.get("user_reflection") else []),
+        episode, updated_profile = await asyncio.gather(
+            self._memory_tools.save_episode(
+                user_id=user_id,
+                kind=kind,
+                summary=summary,
+                mission_id=request.mission_id,
+                block_id=request.block_id,
+                reflection=request.user_reflection,
+                focus_score=request.focus_score,
+                energy_score=request.energy_score,
+                time_focused_minutes=stats.get("total_focused_minutes"),
+                time_leaked_minutes=stats.get("total_leaked_minutes"),
+                tags=[kind_str, "has_reflection"] if request.user_reflection else [kind_str],
+            ),
+            self._memory_tools.update_user_stats(
+                user_id,
+                blocks_completed_delta=stats.get("blocks_completed", 0),
+                focused_minutes_delta=stats.get("total_focused_minutes", 0),
+            ),
         )
 
-        state["outputs"]["episode"] = episode.model_dump()
-        return state
-
-    async def _update_profile(self, state: GlyphStateDict) -> GlyphStateDict:
-        """Update user profile with new stats."""
-        context = state.get("context", {})
-        user_id = context.get("user_id", "")
-        outputs = state.get("outputs", {})
-        stats = outputs.get("stats", {})
-
-        # Update incremental stats
-        updated_profile = await self._memory_tools.update_user_stats(
-            user_id,
-            blocks_completed_delta=stats.get("blocks_completed", 0),
-            focused_minutes_delta=stats.get("total_focused_minutes", 0),
-        )
+        # The new episode and stats make cached reads for this user stale
+        if self._lookup_cache is not None:
+            self._lookup_cache.invalidate(user_id)
 
-        state["outputs"]["updated_profile"] = updated_profile.model_dump()
+        outputs["episode"] = episode
+        outputs["updated_profile"] = updated_profile
         return state
 
-    def _build_summary(self, state: GlyphStateDict) -> GlyphStateDict:
-        """Build the final summary message."""
-        outputs = state.get("outputs", {})
-        highlights = outputs.get("highlights", [])
-        challenges = outputs.get("challenges", [])
-        patterns = outputs.get("patterns", [])
-
-        # Build summary message
-        summary_parts = []
-        if highlights:
-            summary_parts.append("Highlights: " + ", ".join(highlights))
-        if challenges:
-            summary_parts.append("Challenges: " + ", ".join(challenges))
+    @classmethod
+    def build(cls) -> StateGraph:
+        """Build the LangGraph StateGraph.
 
-        summary = ". ".join(summary_parts) if summary_parts else "Reflection complete."
-
-        # Build suggestions from patterns
-        suggestions = []
-        for p in patterns:
-            if p.get("suggested_action"):
-                suggestions.append(p["suggested_action"])
-
-        state["outputs"]["final_summary"] = summary
-        state["outputs"]["suggestions"] = suggestions
-
-        return state
-
-    def build(self) -> StateGraph:
-        """Build the LangGraph StateGraph."""
+        Nodes are dispatched to the instance passed via graph_run_config().
+        """
         graph = StateGraph(dict)
 
         # Add nodes
-        graph.add_node("load_period_data", self._load_period_data)
-        graph.add_node("compute_stats", self._compute_stats)
-        graph.add_node("identify_patterns", self._identify_patterns)
-        graph.add_node("write_episode", self._write_episode)
-        graph.add_node("update_profile", self._update_profile)
-        graph.add_node("build_summary", self._build_summary)
+        graph.add_node("load_period_data", bound_node("_load_period_data"))
+        graph.add_node("compute_stats", bound_node("_compute_stats"))
+        graph.add_node("analyze", bound_node("_analyze"))
+        graph.add_node("persist", bound_node("_persist"))
 
         # Define edges
         graph.set_entry_point("load_period_data")
         graph.add_edge("load_period_data", "compute_stats")
-        graph.add_edge("compute_stats", "identify_patterns")
-        graph.add_edge("identify_patterns", "write_episode")
-        graph.add_edge("write_episode", "update_profile")
-        graph.add_edge("update_profile", "build_summary")
-        graph.add_edge("build_summary", END)
+        graph.add_edge("compute_stats", "analyze")
+        graph.add_edge("analyze", "persist")
+        graph.add_edge("persist", END)
 
         return graph
 
+    @classmethod
+    def compile(cls) -> CompiledStateGraph:
+        """Compile the graph once per class; later calls return the shared runnable."""
+        if cls._compiled_graph is None:
+            cls._compiled_graph = cls.build().compile()
+        return cls._compiled_graph
+
 
 async def run_archivist(
     repos: RepositoryBundle,
     user_id: str,
     request: ReflectPeriodRequest,
+    *,
+    lookup_cache: LookupCache | None = None,
+    archivist: ArchivistGraph | None = None,
 ) -> ReflectPeriodResponse:
-    """Run the archivist graph and return a response."""
-    archivist = ArchivistGraph(repos)
-    graph = archivist.build().compile()
+    """Run the archivist graph and return a response.
+
+    Pass a long-lived archivist to reuse its tools and caches across requests.
+    """
+    if archivist is None:
+        archivist = ArchivistGraph(repos, lookup_cache=lookup_cache)
+    graph = archivist.compile()
 
     # Build initial state
-    initial_state: GlyphStateDict = {
-        "context": {
-            "user_id": user_id,
-            "surface": request.surface.value,
-            "mission_id": request.mission_id,
-            "block_id": request.block_id,
-        },
-        "mode": "archivist",
-        "messages": [],
-        "scratchpad": "",
-        "outputs": {
-            "request": {
-                "kind": request.kind.value,
-                "mission_id": request.mission_id,
-                "block_id": request.block_id,
-                "start_date": request.start_date.isoformat() if request.start_date else None,
-                "end_date": request.end_date.isoformat() if request.end_date else None,
-                "user_reflection": request.user_reflection,
-                "focus_score": request.focus_score,
-                "energy_score": request.energy_score,
-            }
-        },
-        "errors": [],
+    initial_state = _ARCHIVIST_STATE_TEMPLATE.copy()
+    initial_state["context"] = {
+        "user_id": user_id,
+        "surface": request.surface.value,
+        "mission_id": request.mission_id,
+        "block_id": request.block_id,
     }
+    initial_state["messages"] = []
+    # Nodes read the validated request model directly
+    initial_state["outputs"] = {"request": request}
+    initial_state["errors"] = []
 
     # Run the graph
-    final_state = await graph.ainvoke(initial_state)
+    final_state = await graph.ainvoke(initial_state, config=graph_run_config(archivist))
 
     # Build response
-    outputs = final_state.get("outputs", {})
-    episode_data = outputs.get("episode", {})
-    patterns_data = outputs.get("patterns", [])
+    outputs = final_state["outputs"]
+    patterns = outputs.get("patterns", [])
     stats = outputs.get("stats", {})
-    profile_data = outputs.get("updated_profile")
-
-    episode = (
-        Episode(**episode_data)
-        if episode_data
-        else Episode(
-            id="",
-            user_id=user_id,
-            kind=request.kind,
-            created_at=datetime.now(),
-            summary="Reflection recorded",
-        )
+    updated_profile = outputs.get("updated_profile")
+
+    episode = outputs.get("episode") or Episode(
+        id="",
+        user_id=user_id,
+        kind=_EPISODE_KIND_MAP.get(request.kind.value, EpisodeKind.SESSION),
+        created_at=datetime.now(),
+        summary="Reflection recorded",
     )
 
-    patterns = [PatternInsight(**p) for p in patterns_data]
-    updated_profile = UserProfile(**profile_data) if profile_data else None
-
-    return ReflectPeriodResponse(
+    # Every field is either a model validated when it was created or a value
+    # computed by the graph nodes, so skip a second validation pass.
+    return ReflectPeriodResponse.model_construct(
         episode=episode,
         summary=outputs.get("final_summary", ""),
         highlights=outputs.get("highlights", []),
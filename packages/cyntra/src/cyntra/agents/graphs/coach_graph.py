@@ -3,19 +3,33 @@
 Helps users start and navigate focus sessions.
 """
 
+import asyncio
+from datetime import date
+from typing import ClassVar
+
 from langgraph.graph import END, StateGraph
+from langgraph.graph.state import CompiledStateGraph
 
+from cyntra.agents.memory.cache import LookupCache, read_through
 from cyntra.agents.memory.interfaces import RepositoryBundle
 from cyntra.agents.schemas import (
     Block,
     BlockStatus,
+    Mission,
     RunSessionRequest,
     RunSessionResponse,
     SessionAction,
 )
-from cyntra.agents.tools import MissionTools, TimelineTools, UITools
+from cyntra.agents.tools import UITools
+
+from .base import GlyphStateDict, bound_node, graph_run_config, repo_tools
 
-from .base import GlyphStateDict
+# Today's blocks and the active mission change as sessions start and end,
+# so coach reads use a shorter TTL than the lookup cache default.
+_SESSION_LOOKUP_TTL_SECONDS = 15
+
+# Request-independent part of the initial state; copied and filled per run.
+_COACH_STATE_TEMPLATE: GlyphStateDict = {"mode": "coach", "scratchpad": ""}
 
 
 class CoachGraph:
@@ -28,136 +42,146 @@ class CoachGraph:
     4. start_session - Start the block and focus mode
     """
 
+    _compiled_graph: ClassVar[CompiledStateGraph | None] = None
+
     def __init__(
         self,
         repos: RepositoryBundle,
+        *,
+        lookup_cache: LookupCache | None = None,
     ) -> None:
         self._repos = repos
-        self._mission_tools = MissionTools(repos.missions, repos.semantic_memory)
-        self._timeline_tools = TimelineTools(repos.blocks, repos.missions)
-        self._ui_tools = UITools()
+        self._lookup_cache = lookup_cache
+        tools = repo_tools(repos)
+        self._mission_tools = tools.missions
+        self._timeline_tools = tools.timeline
 
     async def _load_context(self, state: GlyphStateDict) -> GlyphStateDict:
         """Load relevant context for the session."""
-        context = state.get("context", {})
-        user_id = context.get("user_id", "")
-        request_data = state.get("outputs", {}).get("request", {})
-
-        # Load specified mission or active mission
-        mission_id = request_data.get("mission_id")
-        mission = None
-        if mission_id:
-            mission = await self._mission_tools.get_mission(mission_id)
-        else:
-            mission = await self._mission_tools.get_active_mission(user_id)
+        user_id = state["context"]["user_id"]
+        outputs = state["outputs"]
+        request: RunSessionRequest = outputs["request"]
 
-        # Load specified block or current block
-        block_id = request_data.get("block_id")
-        block = None
-        if block_id:
-            block = await self._timeline_tools.get_block(block_id)
-        else:
-            block = await self._timeline_tools.get_current_block(user_id)
+        mission_id = request.mission_id
+        block_id = request.block_id
 
-        # Get today's blocks
-        today_blocks = await self._timeline_tools.get_today_blocks(user_id)
+        async def _load_mission_and_next_block() -> tuple[Mission | None, Block | None]:
+            # Speculatively fetch the next planned block for the mission that
+            # _decide_block would use; discarded if a block is in progress.
+            if mission_id:
+                mission = await self._mission_tools.get_mission(mission_id)
+            else:
+                mission = await read_through(
+                    self._lookup_cache,
+                    user_id,
+                    ("active_mission",),
+                    lambda: self._mission_tools.get_active_mission(user_id),
+                    ttl_seconds=_SESSION_LOOKUP_TTL_SECONDS,
+                )
+            next_block = await self._timeline_tools.get_next_planned_block(user_id, mission.id if mission else None)
+            return mission, next_block
+
+        # Load mission (+ next planned block), specified or current block,
+        # and today's blocks concurrently
+        (mission, next_block), block, today_blocks = await asyncio.gather(
+            _load_mission_and_next_block(),
+            self._timeline_tools.get_block(block_id) if block_id else self._timeline_tools.get_current_block(user_id),
+            read_through(
+                self._lookup_cache,
+                user_id,
+                ("today_blocks", date.today()),
+                lambda: self._timeline_tools.get_today_blocks(user_id),
+                ttl_seconds=_SESSION_LOOKUP_TTL_SECONDS,
+            ),
+        )
 
-        state["outputs"]["mission"] = mission.model_dump() if mission else None
-        state["outputs"]["current_block"] = block.model_dump() if block else None
-        state["outputs"]["today_blocks"] = [b.model_dump() for b in today_blocks]
+        # Models are kept as-is in state; serialization happens at the API boundary
+        outputs["mission"] = mission
+        outputs["current_block"] = block
+        outputs["today_blocks"] = today_blocks
+        outputs["_prefetched_next_block"] = next_block
 
         return state
 
     async def _decide_block(self, state: GlyphStateDict) -> GlyphStateDict:
         """Decide which block to work on."""
-        context = state.get("context", {})
-        user_id = context.get("user_id", "")
-        outputs = state.get("outputs", {})
-        request_data = outputs.get("request", {})
+        user_id = state["context"]["user_id"]
+        outputs = state["outputs"]
+        request: RunSessionRequest = outputs["request"]
 
         current_block = outputs.get("current_block")
-        mission_data = outputs.get("mission")
+        mission = outputs.get("mission")
 
         # If there's already an in-progress block, use it
-        if current_block and current_block.get("status") == BlockStatus.IN_PROGRESS.value:
-            state["outputs"]["selected_block"] = current_block
-            state["outputs"]["is_continuation"] = True
+        if current_block and current_block.status == BlockStatus.IN_PROGRESS:
+            outputs["selected_block"] = current_block
+            outputs["is_continuation"] = True
             return state
 
-        # If a specific block was requested
-        if request_data.get("block_id"):
-            block = await self._timeline_tools.get_block(request_data["block_id"])
-            if block:
-                state["outputs"]["selected_block"] = block.model_dump()
-                state["outputs"]["is_continuation"] = False
-                return state
+        # If a specific block was requested, _load_context already loaded it
+        if request.block_id and current_block:
+            outputs["selected_block"] = current_block
+            outputs["is_continuation"] = False
+            return state
 
-        # Get next planned block
-        mission_id = mission_data.get("id") if mission_data else None
-        next_block = await self._timeline_tools.get_next_planned_block(user_id, mission_id)
+        # Next planned block, prefetched by _load_context
+        mission_id = mission.id if mission else None
+        if "_prefetched_next_block" in outputs:
+            next_block = outputs["_prefetched_next_block"]
+        else:
+            next_block = await self._timeline_tools.get_next_planned_block(user_id, mission_id)
 
         if next_block:
-            state["outputs"]["selected_block"] = next_block.model_dump()
-            state["outputs"]["is_continuation"] = False
+            outputs["selected_block"] = next_block
+            outputs["is_continuation"] = False
         else:
             # Need to create a new block
             if mission_id:
-                duration = request_data.get("available_minutes") or 25
+                duration = request.available_minutes or 25
                 new_block = await self._timeline_tools.create_block(
                     user_id=user_id,
                     mission_id=mission_id,
                     planned_duration_minutes=duration,
                 )
-                state["outputs"]["selected_block"] = new_block.model_dump()
-                state["outputs"]["is_continuation"] = False
+                if self._lookup_cache is not None:
+                    self._lookup_cache.invalidate(user_id)
+                outputs["selected_block"] = new_block
+                outputs["is_continuation"] = False
             else:
-                state["errors"] = state.get("errors", []) + ["No mission or block available"]
+                state.setdefault("errors", []).append("No mission or block available")
 
         return state
 
     def _generate_brief(self, state: GlyphStateDict) -> GlyphStateDict:
         """Generate the session brief and actions."""
-        outputs = state.get("outputs", {})
-        block_data = outputs.get("selected_block")
-        mission_data = outputs.get("mission")
+        outputs = state["outputs"]
+        block = outputs.get("selected_block")
+        mission = outputs.get("mission")
 
-        if not block_data:
-            state["outputs"]["brief"] = "Let's get you started. What would you like to work on?"
-            state["outputs"]["actions"] = []
+        if not block:
+            outputs["brief"] = "Let's get you started. What would you like to work on?"
+            outputs["actions"] = []
             return state
 
-        # Build brief message
-        mission_title = mission_data.get("title", "your work") if mission_data else "your work"
-        block_title = block_data.get("title", "Focus session")
-        duration = block_data.get("planned_duration_minutes", 25)
-
-        is_continuation = outputs.get("is_continuation", False)
+        # Build brief message and primary action
+        mission_title = mission.title if mission else "your work"
+        duration = block.planned_duration_minutes
+        plan_note = block.plan_note
 
-        if is_continuation:
+        if outputs.get("is_continuation", False):
             brief = f"Continuing your session on {mission_title}. You've got this."
+        elif plan_note:
+            brief = f"Let's do a {duration}-minute block on {mission_title}. Focus: {plan_note}"
         else:
             brief = f"Let's do a {duration}-minute block on {mission_title}."
-            if block_data.get("plan_note"):
-                brief += f" Focus: {block_data['plan_note']}"
 
-        # Generate actions
-        actions = []
-        if block_data.get("plan_note"):
-            # Split plan note into actions
-            actions.append(
-                SessionAction(
-                    description=block_data["plan_note"],
-                    estimated_minutes=duration,
-                )
-            )
-        else:
-            # Default action
-            actions.append(
-                SessionAction(
-                    description=f"Work on {block_title}",
-                    estimated_minutes=duration,
-                )
+        # The plan note doubles as the main action; otherwise work on the block
+        actions = [
+            SessionAction(
+                description=plan_note or f"Work on {block.title}",
+                estimated_minutes=duration,
             )
+        ]
 
         # Add stretch goal if there's time
         if duration >= 40:
@@ -169,50 +193,60 @@ class CoachGraph:
                 )
             )
 
-        state["outputs"]["brief"] = brief
-        state["outputs"]["actions"] = [a.model_dump() for a in actions]
-        state["outputs"]["recommended_duration"] = duration
+        outputs["brief"] = brief
+        outputs["actions"] = actions
+        outputs["recommended_duration"] = duration
 
         return state
 
     async def _start_session(self, state: GlyphStateDict) -> GlyphStateDict:
         """Start the block and focus mode."""
-        outputs = state.get("outputs", {})
-        block_data = outputs.get("selected_block")
+        outputs = state["outputs"]
+        block = outputs.get("selected_block")
 
-        if not block_data:
+        if not block:
             return state
 
         # Start the block if not already in progress
-        if block_data.get("status") != BlockStatus.IN_PROGRESS.value:
-            block = await self._timeline_tools.start_block(block_data["id"])
-            if block:
-                state["outputs"]["selected_block"] = block.model_dump()
-
-        # Activate focus mode
+        if block.status != BlockStatus.IN_PROGRESS:
+            started = await self._timeline_tools.start_block(block.id)
+            if started:
+                outputs["selected_block"] = started
+            if self._lookup_cache is not None:
+                self._lookup_cache.invalidate(block.user_id)
+
+        # Activate focus mode. UITools holds mutable UI state and this graph is
+        # shared across users, so each run gets its own and copies the result
+        # into the run's state.
         duration = outputs.get("recommended_duration", 25)
-        self._ui_tools.focus_mode_on(
-            block_id=block_data["id"],
+        ui_tools = UITools()
+        ui_tools.focus_mode_on(
+            block_id=block.id,
             duration_minutes=duration,
         )
 
-        state["outputs"]["ui_state"] = {
-            "focus_mode_active": True,
-            "timer_running": True,
-            "timer_remaining_seconds": duration * 60,
+        ui = ui_tools.state
+        outputs["ui_state"] = {
+            "focus_mode_active": ui.focus_mode_active,
+            "timer_running": ui.timer_running,
+            "timer_remaining_seconds": ui.timer_remaining_seconds,
         }
 
         return state
 
-    def build(self) -> StateGraph:
-        """Build the LangGraph StateGraph."""
+    @classmethod
+    def build(cls) -> StateGraph:
+        """Build the LangGraph StateGraph.
+
+        Nodes are dispatched to the instance passed via graph_run_config().
+        """
         graph = StateGraph(dict)
 
         # Add nodes
-        graph.add_node("load_context", self._load_context)
-        graph.add_node("decide_block", self._decide_block)
-        graph.add_node("generate_brief", self._generate_brief)
-        graph.add_node("start_session", self._start_session)
+        graph.add_node("load_context", bound_node("_load_context"))
+        graph.add_node("decide_block", bound_node("_decide_block"))
+        graph.add_node("generate_brief", bound_node("_generate_brief"))
+        graph.add_node("start_session", bound_node("_start_session"))
 
         # Define edges
         graph.set_entry_point("load_context")
@@ -223,52 +257,53 @@ class CoachGraph:
 
         return graph
 
+    @classmethod
+    def compile(cls) -> CompiledStateGraph:
+        """Compile the graph once per class; later calls return the shared runnable."""
+        if cls._compiled_graph is None:
+            cls._compiled_graph = cls.build().compile()
+        return cls._compiled_graph
+
 
 async def run_coach(
     repos: RepositoryBundle,
     user_id: str,
     request: RunSessionRequest,
+    *,
+    lookup_cache: LookupCache | None = None,
+    coach: CoachGraph | None = None,
 ) -> RunSessionResponse:
-    """Run the coach graph and return a response."""
-    coach = CoachGraph(repos)
-    graph = coach.build().compile()
+    """Run the coach graph and return a response.
+
+    Pass a long-lived coach to reuse its tools and caches across requests.
+    """
+    if coach is None:
+        coach = CoachGraph(repos, lookup_cache=lookup_cache)
+    graph = coach.compile()
 
     # Build initial state
-    initial_state: GlyphStateDict = {
-        "context": {
-            "user_id": user_id,
-            "surface": request.surface.value,
-            "mission_id": request.mission_id,
-            "block_id": request.block_id,
-        },
-        "mode": "coach",
-        "messages": [],
-        "scratchpad": "",
-        "outputs": {
-            "request": {
-                "mission_id": request.mission_id,
-                "block_id": request.block_id,
-                "available_minutes": request.available_minutes,
-                "energy_level": (request.energy_level.value if request.energy_level else None),
-                "mood_note": request.mood_note,
-                "is_continuation": request.is_continuation,
-            }
-        },
-        "errors": [],
+    initial_state = _COACH_STATE_TEMPLATE.copy()
+    initial_state["context"] = {
+        "user_id": user_id,
+        "surface": request.surface.value,
+        "mission_id": request.mission_id,
+        "block_id": request.block_id,
     }
+    initial_state["messages"] = []
+    # Nodes read the validated request model directly
+    initial_state["outputs"] = {"request": request}
+    initial_state["errors"] = []
 
     # Run the graph
-    final_state = await graph.ainvoke(initial_state)
+    final_state = await graph.ainvoke(initial_state, config=graph_run_config(coach))
 
     # Build response
-    outputs = final_state.get("outputs", {})
-    block_data = outputs.get("selected_block", {})
-    actions_data = outputs.get("actions", [])
+    outputs = final_state["outputs"]
+    block = outputs.get("selected_block")
+    actions = outputs.get("actions", [])
 
     # Create block with defaults if none selected
-    if block_data:
-        block = Block(**block_data)
-    else:
+    if block is None:
         from cyntra.commons import new_id
 
         block = Block(
@@ -278,8 +313,6 @@ async def run_coach(
             status=BlockStatus.PLANNED,
         )
 
-    actions = [SessionAction(**a) for a in actions_data]
-
     return RunSessionResponse(
         block=block,
         actions=actions,
@@ -3,10 +3,15 @@
 Takes vague user input and produces structured missions with block proposals.
 """
 
-from datetime import date, datetime
+import asyncio
+from collections.abc import Awaitable
+from datetime import datetime, time
+from typing import ClassVar
 
 from langgraph.graph import END, StateGraph
+from langgraph.graph.state import CompiledStateGraph
 
+from cyntra.agents.memory.cache import Embedder, SemanticCache
 from cyntra.agents.memory.interfaces import RepositoryBundle
 from cyntra.agents.schemas import (
     Mission,
@@ -17,9 +22,14 @@ from cyntra.agents.schemas import (
     PlanMissionResponse,
     ProposedBlock,
 )
-from cyntra.agents.tools import MemoryTools, MissionTools, TimelineTools
 
-from .base import GlyphStateDict
+from .base import GlyphStateDict, bound_node, graph_run_config, repo_tools
+
+# Deadlines are stored as dates; missions take the start of that day
+_MIDNIGHT = time.min
+
+# SemanticCache scope for similar-mission search results
+_SIMILAR_MISSIONS_SCOPE = "similar_missions"
 
 
 class PlannerGraph:
@@ -27,20 +37,27 @@ class PlannerGraph:
 
     Nodes:
     1. parse_input - Extract structured info from raw user input
-    2. check_history - Look for similar past missions
-    3. build_mission - Create the mission object
-    4. propose_blocks - Generate initial block schedule
-    5. summarize - Create response summary
+    2. build_mission - Create the mission object, checking for similar completed missions
+    3. propose_blocks - Generate initial block schedule
+    4. summarize - Create response summary
     """
 
+    _compiled_graph: ClassVar[CompiledStateGraph | None] = None
+
     def __init__(
         self,
         repos: RepositoryBundle,
+        *,
+        similar_missions_cache: SemanticCache[list[Mission]] | None = None,
+        embedder: Embedder | None = None,
     ) -> None:
         self._repos = repos
-        self._mission_tools = MissionTools(repos.missions, repos.semantic_memory)
-        self._timeline_tools = TimelineTools(repos.blocks, repos.missions)
-        self._memory_tools = MemoryTools(repos.episodes, repos.profiles, repos.semantic_memory)
+        # Both are needed to serve paraphrased queries from the cache
+        self._similar_missions_cache = similar_missions_cache if embedder is not None else None
+        self._embedder = embedder
+        tools = repo_tools(repos)
+        self._mission_tools = tools.missions
+        self._timeline_tools = tools.timeline
 
     def _parse_input(self, state: GlyphStateDict) -> GlyphStateDict:
         """Parse the raw input to extract mission details.
@@ -48,98 +65,107 @@ class PlannerGraph:
         This is a simplified version - a full implementation would use
         an LLM call to parse natural language.
         """
-        request_data = state.get("outputs", {}).get("request", {})
+        outputs = state["outputs"]
+        request: PlanMissionRequest = outputs["request"]
 
         # Extract what we can from the request
         parsed = {
-            "title": request_data.get("raw_input", "Untitled Mission")[:100],
-            "description": request_data.get("raw_input"),
-            "kind": request_data.get("kind") or MissionKind.OTHER,
-            "deadline": request_data.get("deadline"),
-            "estimated_hours": request_data.get("estimated_hours"),
-            "constraints": request_data.get("constraints"),
-            "preferences": request_data.get("preferences"),
+            "title": request.raw_input[:100],
+            "description": request.raw_input,
+            "kind": request.kind or MissionKind.OTHER,
+            "deadline": request.deadline,
+            "estimated_hours": request.estimated_hours,
+            "constraints": request.constraints,
+            "preferences": request.preferences,
         }
 
-        state["outputs"]["parsed_input"] = parsed
-        state["scratchpad"] = f"{state.get('scratchpad', '')}\nParsed input: {parsed['title']}"
+        outputs["parsed_input"] = parsed
+        state["scratchpad"] += f"\nParsed input: {parsed['title']}"
         return state
 
-    async def _check_history(self, state: GlyphStateDict) -> GlyphStateDict:
-        """Check for similar past missions."""
-        context = state.get("context", {})
-        user_id = context.get("user_id", "")
-        parsed = state.get("outputs", {}).get("parsed_input", {})
+    async def _find_similar_missions(self, user_id: str, query: str) -> list[Mission]:
+        """Find similar completed missions, answering near-duplicate queries from the semantic cache."""
 
-        # Search for similar missions
-        query = f"{parsed.get('title', '')} {parsed.get('description', '')}"
-        similar = await self._mission_tools.find_similar_missions(user_id, query, limit=3)
+        def search() -> Awaitable[list[Mission]]:
+            # Only completed missions inform the history note, so filter in the store
+            return self._mission_tools.find_similar_missions(user_id, query, limit=3, status=MissionStatus.COMPLETED)
 
-        history_note = None
-        if similar:
-            # Generate insight from past missions
-            completed = [m for m in similar if m.status == MissionStatus.COMPLETED]
-            if completed:
-                history_note = f"Found {len(completed)} similar completed missions. Consider what worked before."
+        cache = self._similar_missions_cache
+        if cache is None or self._embedder is None:
+            return await search()
 
-        state["outputs"]["similar_missions"] = [m.model_dump() for m in similar]
-        state["outputs"]["history_note"] = history_note
-        return state
+        query_vector = await self._embedder(query)
+        similar = cache.get(user_id, _SIMILAR_MISSIONS_SCOPE, query_vector)
+        if similar is None:
+            similar = await search()
+            cache.set(user_id, _SIMILAR_MISSIONS_SCOPE, query_vector, similar)
+        return similar
 
     async def _build_mission(self, state: GlyphStateDict) -> GlyphStateDict:
-        """Create the mission object."""
-        context = state.get("context", {})
-        user_id = context.get("user_id", "")
-        parsed = state.get("outputs", {}).get("parsed_input", {})
-
-        # Parse deadline if provided
-        deadline_dt = None
-        if parsed.get("deadline"):
-            if isinstance(parsed["deadline"], str):
-                deadline_dt = datetime.fromisoformat(parsed["deadline"])
-            elif isinstance(parsed["deadline"], date):
-                deadline_dt = datetime.combine(parsed["deadline"], datetime.min.time())
+        """Create the mission object and look for similar past missions."""
+        context = state["context"]
+        user_id = context["user_id"]
+        outputs = state["outputs"]
+        # _parse_input always fills every key
+        parsed = outputs["parsed_input"]
+
+        # Deadline is already a date on the request model
+        deadline = parsed["deadline"]
+        deadline_dt = datetime.combine(deadline, _MIDNIGHT) if deadline else None
 
         # Estimate minutes from hours
         estimated_minutes = None
-        if parsed.get("estimated_hours"):
+        if parsed["estimated_hours"]:
             estimated_minutes = int(parsed["estimated_hours"] * 60)
 
-        # Create the mission
-        mission = await self._mission_tools.create_mission(
-            user_id=user_id,
-            title=parsed.get("title", "Untitled"),
-            description=parsed.get("description"),
-            kind=parsed.get("kind", MissionKind.OTHER),
-            priority=MissionPriority.MEDIUM,
-            deadline_date=deadline_dt,
-            estimated_total_minutes=estimated_minutes,
-            constraints=parsed.get("constraints"),
-            preferences=parsed.get("preferences"),
+        # Similar missions only feed the summary, so search while creating
+        query = f"{parsed['title']} {parsed['description']}"
+        similar, mission = await asyncio.gather(
+            self._find_similar_missions(user_id, query),
+            self._mission_tools.create_mission(
+                user_id=user_id,
+                title=parsed["title"],
+                description=parsed["description"],
+                kind=parsed["kind"],
+                priority=MissionPriority.MEDIUM,
+                deadline_date=deadline_dt,
+                estimated_total_minutes=estimated_minutes,
+                constraints=parsed["constraints"],
+                preferences=parsed["preferences"],
+            ),
         )
 
-        state["outputs"]["mission"] = mission.model_dump()
-        state["context"]["mission_id"] = mission.id
+        # The new mission is active, so the completed-only search never returns it
+        history_note = None
+        if similar:
+            # Generate insight from past missions
+            history_note = f"Found {len(similar)} similar completed missions. Consider what worked before."
+
+        # Models are kept as-is in state; serialization happens at the API boundary
+        outputs["similar_missions"] = similar
+        outputs["history_note"] = history_note
+        outputs["mission"] = mission
+        context["mission_id"] = mission.id
         return state
 
     async def _propose_blocks(self, state: GlyphStateDict) -> GlyphStateDict:
         """Generate proposed blocks for the mission."""
-        mission_data = state.get("outputs", {}).get("mission", {})
-        if not mission_data:
-            state["errors"] = state.get("errors", []) + ["No mission created"]
+        mission = state["outputs"].get("mission")
+        if mission is None:
+            state.setdefault("errors", []).append("No mission created")
             return state
 
-        mission_id = mission_data["id"]
-
-        # Propose blocks (not yet committed)
+        # Propose blocks (not yet committed) from the mission just created
         proposed = await self._timeline_tools.propose_blocks_for_mission(
-            mission_id,
+            mission.id,
             num_blocks=5,
+            mission=mission,
         )
 
-        # Convert to ProposedBlock format
+        # Convert to ProposedBlock format; every field comes from a validated
+        # Block with a default applied, so skip re-validation
         proposed_blocks = [
-            ProposedBlock(
+            ProposedBlock.model_construct(
                 title=b.title or "",
                 plan_note=b.plan_note,
                 suggested_date=b.scheduled_start.date() if b.scheduled_start else None,
@@ -149,66 +175,82 @@ class PlannerGraph:
             for b in proposed
         ]
 
-        state["outputs"]["proposed_blocks"] = [b.model_dump() for b in proposed_blocks]
+        state["outputs"]["proposed_blocks"] = proposed_blocks
         return state
 
     def _summarize(self, state: GlyphStateDict) -> GlyphStateDict:
         """Create the response summary."""
-        mission_data = state.get("outputs", {}).get("mission", {})
-        proposed_blocks = state.get("outputs", {}).get("proposed_blocks", [])
-        history_note = state.get("outputs", {}).get("history_note")
+        outputs = state["outputs"]
+        mission = outputs.get("mission")
+        proposed_blocks = outputs.get("proposed_blocks", [])
+        history_note = outputs.get("history_note")
 
         # Build summary
-        summary = f"Created mission: {mission_data.get('title', 'Untitled')}"
+        summary = f"Created mission: {mission.title if mission else 'Untitled'}"
         if proposed_blocks:
             summary += f" with {len(proposed_blocks)} proposed sessions"
 
         # Build rationale
         rationale_parts = []
-        if mission_data.get("deadline_date"):
-            rationale_parts.append(f"Deadline: {mission_data['deadline_date']}")
-        if mission_data.get("estimated_total_minutes"):
-            hours = mission_data["estimated_total_minutes"] / 60
+        if mission and mission.deadline_date:
+            rationale_parts.append(f"Deadline: {mission.deadline_date}")
+        if mission and mission.estimated_total_minutes:
+            hours = mission.estimated_total_minutes / 60
             rationale_parts.append(f"Estimated effort: {hours:.1f} hours")
 
         rationale = ". ".join(rationale_parts) if rationale_parts else None
 
-        state["outputs"]["summary"] = summary
-        state["outputs"]["rationale"] = rationale
-        state["outputs"]["similar_missions_note"] = history_note
+        outputs["summary"] = summary
+        outputs["rationale"] = rationale
+        outputs["similar_missions_note"] = history_note
 
         return state
 
-    def build(self) -> StateGraph:
-        """Build the LangGraph StateGraph."""
+    @classmethod
+    def build(cls) -> StateGraph:
+        """Build the LangGraph StateGraph.
+
+        Nodes are dispatched to the instance passed via graph_run_config().
+        """
         graph = StateGraph(dict)
 
         # Add nodes
-        graph.add_node("parse_input", self._parse_input)
-        graph.add_node("check_history", self._check_history)
-        graph.add_node("build_mission", self._build_mission)
-        graph.add_node("propose_blocks", self._propose_blocks)
-        graph.add_node("summarize", self._summarize)
+        graph.add_node("parse_input", bound_node("_parse_input"))
+        graph.add_node("build_mission", bound_node("_build_mission"))
+        graph.add_node("propose_blocks", bound_node("_propose_blocks"))
+        graph.add_node("summarize", bound_node("_summarize"))
 
         # Define edges (linear flow for MVP)
         graph.set_entry_point("parse_input")
-        graph.add_edge("parse_input", "check_history")
-        graph.add_edge("check_history", "build_mission")
+        graph.add_edge("parse_input", "build_mission")
         graph.add_edge("build_mission", "propose_blocks")
         graph.add_edge("propose_blocks", "summarize")
         graph.add_edge("summarize", END)
 
         return graph
 
+    @classmethod
+    def compile(cls) -> CompiledStateGraph:
+        """Compile the graph once per class; later calls return the shared runnable."""
+        if cls._compiled_graph is None:
+            cls._compiled_graph = cls.build().compile()
+        return cls._compiled_graph
+
 
 async def run_planner(
     repos: RepositoryBundle,
     user_id: str,
     request: PlanMissionRequest,
+    *,
+    planner: PlannerGraph | None = None,
 ) -> PlanMissionResponse:
-    """Run the planner graph and return a response."""
-    planner = PlannerGraph(repos)
-    graph = planner.build().compile()
+    """Run the planner graph and return a response.
+
+    Pass a long-lived planner to reuse its tools and caches across requests.
+    """
+    if planner is None:
+        planner = PlannerGraph(repos)
+    graph = planner.compile()
 
     # Build initial state
     initial_state: GlyphStateDict = {
@@ -219,46 +261,31 @@ async def run_planner(
         "mode": "planner",
         "messages": [],
         "scratchpad": "",
-        "outputs": {
-            "request": {
-                "raw_input": request.raw_input,
-                "kind": request.kind.value if request.kind else None,
-                "deadline": request.deadline.isoformat() if request.deadline else None,
-                "estimated_hours": request.estimated_hours,
-                "constraints": (request.constraints.model_dump() if request.constraints else None),
-                "preferences": (request.preferences.model_dump() if request.preferences else None),
-            }
-        },
+        # Nodes read the validated request model directly
+        "outputs": {"request": request},
         "errors": [],
     }
 
     # Run the graph
-    final_state = await graph.ainvoke(initial_state)
+    final_state = await graph.ainvoke(initial_state, config=graph_run_config(planner))
 
     # Build response
-    mission_data = final_state.get("outputs", {}).get("mission", {})
-    proposed_blocks_data = final_state.get("outputs", {}).get("proposed_blocks", [])
-
-    mission = (
-        Mission(**mission_data)
-        if mission_data
-        else Mission(
-            id="",
-            user_id=user_id,
-            title="Failed to create mission",
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        )
+    outputs = final_state["outputs"]
+    mission = outputs.get("mission") or Mission(
+        id="",
+        user_id=user_id,
+        title="Failed to create mission",
+        created_at=datetime.now(),
+        updated_at=datetime.now(),
     )
-
-    proposed_blocks = [ProposedBlock(**b) for b in proposed_blocks_data]
+    proposed_blocks = outputs.get("proposed_blocks", [])
 
     return PlanMissionResponse(
         mission=mission,
         proposed_blocks=proposed_blocks,
-        summary=final_state.get("outputs", {}).get("summary", ""),
-        rationale=final_state.get("outputs", {}).get("rationale"),
-        similar_missions_note=final_state.get("outputs", {}).get("similar_missions_note"),
+        summary=outputs.get("summary", ""),
+        rationale=outputs.get("rationale"),
+        similar_missions_note=outputs.get("similar_missions_note"),
         warnings=final_state.get("errors", []),
         suggestions=[],
     )
@@ -1,10 +1,14 @@
 """Graph router - dispatches to the appropriate LangGraph workflow."""
 
+from collections.abc import Awaitable, Callable, Mapping
 from enum import Enum
+from types import MappingProxyType
 from typing import Any
 
+from cyntra.agents.memory.cache import Embedder, LookupCache, SemanticCache
 from cyntra.agents.memory.interfaces import RepositoryBundle
 from cyntra.agents.schemas import (
+    Mission,
     PlanMissionRequest,
     PlanMissionResponse,
     ReflectPeriodRequest,
@@ -14,10 +18,10 @@ from cyntra.agents.schemas import (
 )
 from cyntra.commons import ErrorCode, ServiceError, get_logger
 
-from .archivist_graph import run_archivist
+from .archivist_graph import ArchivistGraph, run_archivist
 from .base import GlyphMode
-from .coach_graph import run_coach
-from .planner_graph import run_planner
+from .coach_graph import CoachGraph, run_coach
+from .planner_graph import PlannerGraph, run_planner
 
 logger = get_logger(__name__)
 
@@ -31,14 +35,62 @@ class GlyphEntrypoint(str, Enum):
     CHAT = "chat"
 
 
+# Read-only so callers cannot remap entrypoints at runtime
+_ENTRYPOINT_MODES: Mapping[GlyphEntrypoint, GlyphMode] = MappingProxyType(
+    {
+        GlyphEntrypoint.PLAN_MISSION: GlyphMode.PLANNER,
+        GlyphEntrypoint.RUN_SESSION: GlyphMode.COACH,
+        GlyphEntrypoint.REFLECT_PERIOD: GlyphMode.ARCHIVIST,
+        GlyphEntrypoint.CHAT: GlyphMode.CHAT,
+    }
+)
+
+
 class GraphRouter:
     """Routes requests to the appropriate LangGraph workflow.
 
-    This is the main entry point for graph execution.
+    This is the main entry point for graph execution. The router holds one
+    instance of each graph; the compiled runnables are shared per class and
+    are warmed up here so the first request does not pay for compilation.
     """
 
-    def __init__(self, repos: RepositoryBundle) -> None:
+    def __init__(
+        self,
+        repos: RepositoryBundle,
+        *,
+        lookup_cache: LookupCache | None = None,
+        similar_missions_cache: SemanticCache[list[Mission]] | None = None,
+        embedder: Embedder | None = None,
+    ) -> None:
         self._repos = repos
+        self._lookup_cache = lookup_cache
+        self._similar_missions_cache = similar_missions_cache
+        self._planner = PlannerGraph(
+            repos,
+            similar_missions_cache=similar_missions_cache,
+            embedder=embedder,
+        )
+        self._coach = CoachGraph(repos, lookup_cache=lookup_cache)
+        self._archivist = ArchivistGraph(repos, lookup_cache=lookup_cache)
+        for graph_cls in (PlannerGraph, CoachGraph, ArchivistGraph):
+            graph_cls.compile()
+
+        # Graph entrypoints -> (expected request type, handler)
+        self._dispatch: dict[GlyphEntrypoint, tuple[type, Callable[[str, Any], Awaitable[Any]]]] = {
+            GlyphEntrypoint.PLAN_MISSION: (PlanMissionRequest, self.plan_mission),
+            GlyphEntrypoint.RUN_SESSION: (RunSessionRequest, self.run_session),
+            GlyphEntrypoint.REFLECT_PERIOD: (ReflectPeriodRequest, self.reflect_period),
+        }
+
+    @property
+    def lookup_cache(self) -> LookupCache | None:
+        """The repository read cache shared by coach and archivist runs (if enabled)."""
+        return self._lookup_cache
+
+    @property
+    def similar_missions_cache(self) -> SemanticCache[list[Mission]] | None:
+        """The planner's similar-mission search cache (if enabled)."""
+        return self._similar_missions_cache
 
     async def plan_mission(
         self,
@@ -47,7 +99,11 @@ class GraphRouter:
     ) -> PlanMissionResponse:
         """Route to the planner graph."""
         logger.debug("routing_to_planner user_id=%s", user_id)
-        return await run_planner(self._repos, user_id, request)
+        response = await run_planner(self._repos, user_id, request, planner=self._planner)
+        # The new mission makes cached coach/archivist reads for this user stale
+        if self._lookup_cache is not None:
+            self._lookup_cache.invalidate(user_id)
+        return response
 
     async def run_session(
         self,
@@ -56,7 +112,7 @@ class GraphRouter:
     ) -> RunSessionResponse:
         """Route to the coach graph."""
         logger.debug("routing_to_coach user_id=%s", user_id)
-        return await run_coach(self._repos, user_id, request)
+        return await run_coach(self._repos, user_id, request, coach=self._coach)
 
     async def reflect_period(
         self,
@@ -65,7 +121,7 @@ class GraphRouter:
     ) -> ReflectPeriodResponse:
         """Route to the archivist graph."""
         logger.debug("routing_to_archivist user_id=%s", user_id)
-        return await run_archivist(self._repos, user_id, request)
+        return await run_archivist(self._repos, user_id, request, archivist=self._archivist)
 
     async def call_graph(
         self,
@@ -93,54 +149,30 @@ class GraphRouter:
             request_type=type(request).__name__,
         )
 
-        if entrypoint == GlyphEntrypoint.PLAN_MISSION:
-            if not isinstance(request, PlanMissionRequest):
-                raise ServiceError(
-                    code=ErrorCode.VALIDATION_ERROR,
-                    message=f"Expected PlanMissionRequest, got {type(request).__name__}",
-                    details={"entrypoint": entrypoint.value},
-                )
-            return await self.plan_mission(user_id, request)
-
-        elif entrypoint == GlyphEntrypoint.RUN_SESSION:
-            if not isinstance(request, RunSessionRequest):
+        entry = self._dispatch.get(entrypoint)
+        if entry is None:
+            if entrypoint == GlyphEntrypoint.CHAT:
+                # Chat is handled by the persona layer, not a graph
                 raise ServiceError(
                     code=ErrorCode.VALIDATION_ERROR,
-                    message=f"Expected RunSessionRequest, got {type(request).__name__}",
+                    message="Chat should be handled by GlyphAgentService, not the router",
                     details={"entrypoint": entrypoint.value},
                 )
-            return await self.run_session(user_id, request)
-
-        elif entrypoint == GlyphEntrypoint.REFLECT_PERIOD:
-            if not isinstance(request, ReflectPeriodRequest):
-                raise ServiceError(
-                    code=ErrorCode.VALIDATION_ERROR,
-                    message=f"Expected ReflectPeriodRequest, got {type(request).__name__}",
-                    details={"entrypoint": entrypoint.value},
-                )
-            return await self.reflect_period(user_id, request)
-
-        elif entrypoint == GlyphEntrypoint.CHAT:
-            # Chat is handled by the persona layer, not a graph
             raise ServiceError(
                 code=ErrorCode.VALIDATION_ERROR,
-                message="Chat should be handled by GlyphAgentService, not the router",
-                details={"entrypoint": entrypoint.value},
+                message=f"Unknown entrypoint: {entrypoint}",
+                details={"entrypoint": str(entrypoint)},
             )
 
-        else:
+        request_type, handler = entry
+        if not isinstance(request, request_type):
             raise ServiceError(
                 code=ErrorCode.VALIDATION_ERROR,
-                message=f"Unknown entrypoint: {entrypoint}",
-                details={"entrypoint": str(entrypoint)},
+                message=f"Expected {request_type.__name__}, got {type(request).__name__}",
+                details={"entrypoint": entrypoint.value},
             )
+        return await handler(user_id, request)
 
     def get_mode_for_entrypoint(self, entrypoint: GlyphEntrypoint) -> GlyphMode:
         """Get the GlyphMode for an entrypoint."""
-        mapping = {
-            GlyphEntrypoint.PLAN_MISSION: GlyphMode.PLANNER,
-            GlyphEntrypoint.RUN_SESSION: GlyphMode.COACH,
-            GlyphEntrypoint.REFLECT_PERIOD: GlyphMode.ARCHIVIST,
-            GlyphEntrypoint.CHAT: GlyphMode.CHAT,
-        }
-        return mapping.get(entrypoint, GlyphMode.CHAT)
+        return _ENTRYPOINT_MODES.get(entrypoint, GlyphMode.CHAT)
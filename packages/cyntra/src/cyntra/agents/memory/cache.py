@@ -1,29 +1,57 @@
 """Caching layer for frequently accessed data.
 
-Simple in-memory cache for MVP. Can be extended to Redis.
+Simple in-memory caches, plus TieredCache to share entries through Redis.
 """
 
-from datetime import datetime, timedelta
+import asyncio
+import functools
+import heapq
+import math
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable, Sequence
 from typing import Any
 
+from cyntra.commons.schema import serialization
+
+# Async text -> vector function used by SemanticCache
+Embedder = Callable[[str], Awaitable[Sequence[float]]]
+
 
 class CacheEntry[T]:
-    """A single cache entry with TTL."""
+    """A single cache entry with TTL.
+
+    Deadlines use the monotonic clock, so wall-clock changes do not
+    expire or revive entries.
+    """
+
+    __slots__ = ("value", "expires_at")
 
-    def __init__(self, value: T, ttl_seconds: int) -> None:
+    def __init__(self, value: T, ttl_seconds: float) -> None:
         self.value = value
-        self.expires_at = datetime.now() + timedelta(seconds=ttl_seconds)
+        self.expires_at = time.monotonic() + ttl_seconds
 
     def is_expired(self) -> bool:
-        return datetime.now() > self.expires_at
+        return time.monotonic() > self.expires_at
 
 
 class SimpleCache[T]:
-    """Simple in-memory cache with TTL support."""
+    """Simple in-memory LRU cache with TTL support.
 
-    def __init__(self, default_ttl_seconds: int = 300) -> None:
-        self._cache: dict[str, CacheEntry[T]] = {}
+    Holds at most max_entries keys; setting a new key when full evicts
+    the least recently used one. Deadlines are also kept in a min-heap so
+    cleanup_expired() only visits entries that have expired.
+    """
+
+    def __init__(self, default_ttl_seconds: int = 300, max_entries: int = 10_000) -> None:
+        self._cache: OrderedDict[str, CacheEntry[T]] = OrderedDict()
         self._default_ttl = default_ttl_seconds
+        self._max_entries = max_entries
+        # In-flight loads resolve to (value, ttl_seconds to store it with)
+        self._inflight: dict[str, asyncio.Task[tuple[T, int | None]]] = {}
+        # (expires_at, key); entries whose key was overwritten or removed
+        # are skipped when popped
+        self._expiry_heap: list[tuple[float, str]] = []
 
     def get(self, key: str) -> T | None:
         """Get a value from cache, returning None if not found or expired."""
@@ -33,15 +61,67 @@ class SimpleCache[T]:
         if entry.is_expired():
             del self._cache[key]
             return None
+        self._cache.move_to_end(key)
         return entry.value
 
     def set(self, key: str, value: T, ttl_seconds: int | None = None) -> None:
         """Set a value in cache with optional custom TTL."""
         ttl = ttl_seconds if ttl_seconds is not None else self._default_ttl
-        self._cache[key] = CacheEntry(value, ttl)
+        entry = CacheEntry(value, ttl)
+        self._cache[key] = entry
+        self._cache.move_to_end(key)
+        while len(self._cache) > self._max_entries:
+            self._cache.popitem(last=False)
+
+        heap = self._expiry_heap
+        if len(heap) > 2 * len(self._cache) + 64:
+            # Too many stale deadlines from overwrites and evictions; rebuild
+            heap[:] = [(e.expires_at, k) for k, e in self._cache.items() if k != key]
+            heapq.heapify(heap)
+        heapq.heappush(heap, (entry.expires_at, key))
+
+    async def get_or_compute(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[T]],
+        ttl_seconds: int | None = None,
+    ) -> T:
+        """Get a value from cache, calling loader() on a miss.
+
+        Concurrent misses on the same key share one in-flight load.
+        """
+
+        async def load() -> tuple[T, int | None]:
+            return await loader(), ttl_seconds
+
+        return await self._get_or_load(key, load)
+
+    async def _get_or_load(self, key: str, load: Callable[[], Awaitable[tuple[T, int | None]]]) -> T:
+        """Single-flight miss path; load() returns the value and the TTL to cache it for."""
+        entry = self._cache.get(key)
+        if entry is not None and not entry.is_expired():
+            self._cache.move_to_end(key)
+            return entry.value
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(load())
+            self._inflight[key] = task
+            task.add_done_callback(functools.partial(self._store_loaded, key))
+        # Shield so one cancelled caller does not cancel the shared load
+        value, _ = await asyncio.shield(task)
+        return value
+
+    def _store_loaded(self, key: str, task: asyncio.Task[tuple[T, int | None]]) -> None:
+        if self._inflight.get(key) is not task:
+            return  # deleted or cleared while loading
+        del self._inflight[key]
+        if not task.cancelled() and task.exception() is None:
+            self.set(key, *task.result())
 
     def delete(self, key: str) -> bool:
         """Delete a key from cache. Returns True if key existed."""
+        self._inflight.pop(key, None)
         if key in self._cache:
             del self._cache[key]
             return True
@@ -50,14 +130,35 @@ class SimpleCache[T]:
     def clear(self) -> None:
         """Clear all entries from cache."""
         self._cache.clear()
+        self._inflight.clear()
+        self._expiry_heap.clear()
 
     def cleanup_expired(self) -> int:
         """Remove all expired entries. Returns count of removed entries."""
-        now = datetime.now()
-        expired_keys = [k for k, v in self._cache.items() if v.expires_at < now]
-        for key in expired_keys:
-            del self._cache[key]
-        return len(expired_keys)
+        now = time.monotonic()
+        heap = self._expiry_heap
+        count = 0
+        while heap and heap[0][0] < now:
+            expires_at, key = heapq.heappop(heap)
+            entry = self._cache.get(key)
+            if entry is not None and entry.expires_at == expires_at:
+                del self._cache[key]
+                count += 1
+        return count
+
+    async def run_reaper(self, interval_seconds: float | None = None) -> None:
+        """Remove expired entries periodically until cancelled.
+
+        Run it as a background task, e.g. fire_and_forget(cache.run_reaper()).
+        Defaults to a quarter of the default TTL between sweeps.
+        """
+        interval = interval_seconds if interval_seconds is not None else self._default_ttl / 4
+        while True:
+            await asyncio.sleep(interval)
+            self.cleanup_expired()
+
+    def __len__(self) -> int:
+        return len(self._cache)
 
 
 # Pre-configured caches for common use cases
@@ -65,18 +166,286 @@ class ProfileCache(SimpleCache[Any]):
     """Cache for user profiles (longer TTL)."""
 
     def __init__(self) -> None:
-        super().__init__(default_ttl_seconds=600)  # 10 minutes
+        super().__init__(default_ttl_seconds=600, max_entries=10_000)  # 10 minutes
 
 
 class MissionCache(SimpleCache[Any]):
     """Cache for missions."""
 
     def __init__(self) -> None:
-        super().__init__(default_ttl_seconds=300)  # 5 minutes
+        super().__init__(default_ttl_seconds=300, max_entries=50_000)  # 5 minutes
 
 
 class BlockCache(SimpleCache[Any]):
     """Cache for blocks (shorter TTL as they change frequently)."""
 
     def __init__(self) -> None:
-        super().__init__(default_ttl_seconds=60)  # 1 minute
+        super().__init__(default_ttl_seconds=60, max_entries=100_000)  # 1 minute
+
+
+class TieredCache[T](SimpleCache[T]):
+    """Two-tier cache: this process's SimpleCache (L1) in front of Redis (L2).
+
+    L1 misses fall back to Redis and repopulate L1, so workers share
+    entries and a restarted worker starts warm. Writes go to both tiers.
+    The sync SimpleCache methods only touch L1; use the a* methods and
+    get_or_compute() to include Redis.
+
+    Values are JSON-encoded by default; pass dumps/loads for other types.
+    The client comes from create_redis_pool() (pip install cyntra[redis]).
+    """
+
+    def __init__(
+        self,
+        redis: Any,
+        prefix: str,
+        *,
+        default_ttl_seconds: int = 300,
+        max_entries: int = 10_000,
+        dumps: Callable[[T], str] = serialization.dumps,
+        loads: Callable[[str | bytes], T] = serialization.loads,
+    ) -> None:
+        super().__init__(default_ttl_seconds=default_ttl_seconds, max_entries=max_entries)
+        self._redis = redis
+        self._prefix = prefix
+        self._dumps = dumps
+        self._loads = loads
+
+    def _redis_key(self, key: str) -> str:
+        return f"{self._prefix}:{key}"
+
+    async def _get_remote(self, key: str) -> tuple[T | None, int | None]:
+        """Read a value and its remaining TTL from Redis."""
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.get(self._redis_key(key))
+            pipe.ttl(self._redis_key(key))
+            raw, ttl = await pipe.execute()
+        if raw is None:
+            return None, None
+        return self._loads(raw), ttl if ttl > 0 else None
+
+    async def aget(self, key: str) -> T | None:
+        """Get a value from L1, falling back to Redis."""
+        value = self.get(key)
+        if value is not None:
+            return value
+        value, ttl = await self._get_remote(key)
+        if value is not None:
+            # Expire from L1 no later than from Redis
+            self.set(key, value, ttl)
+        return value
+
+    async def aset(self, key: str, value: T, ttl_seconds: int | None = None) -> None:
+        """Set a value in both tiers with optional custom TTL."""
+        ttl = ttl_seconds if ttl_seconds is not None else self._default_ttl
+        self.set(key, value, ttl)
+        await self._redis.set(self._redis_key(key), self._dumps(value), ex=ttl)
+
+    async def adelete(self, key: str) -> bool:
+        """Delete a key from both tiers. Returns True if it existed in either."""
+        existed = self.delete(key)
+        removed = await self._redis.delete(self._redis_key(key))
+        return existed or removed > 0
+
+    async def get_or_compute(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[T]],
+        ttl_seconds: int | None = None,
+    ) -> T:
+        """Get a value from either tier, calling loader() when both miss.
+
+        Concurrent misses on the same key share one Redis read and load.
+        """
+
+        async def load_through() -> tuple[T, int | None]:
+            value, remaining = await self._get_remote(key)
+            if value is not None:
+                # Expire from L1 no later than from Redis
+                return value, remaining
+            value = await loader()
+            ttl = ttl_seconds if ttl_seconds is not None else self._default_ttl
+            await self._redis.set(self._redis_key(key), self._dumps(value), ex=ttl)
+            return value, ttl
+
+        return await self._get_or_load(key, load_through)
+
+
+class LookupCache:
+    """LRU + TTL cache for async repository reads, partitioned by user_id.
+
+    Concurrent misses on the same key share one in-flight load, so a burst
+    of identical requests issues a single repository call. Loads that finish
+    after their user was invalidated are returned but not stored.
+    """
+
+    def __init__(self, ttl_seconds: float = 60, max_entries: int = 2048) -> None:
+        self._ttl = ttl_seconds
+        self._max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, Hashable], tuple[float, Any]] = OrderedDict()
+        self._inflight: dict[tuple[str, Hashable], asyncio.Task[Any]] = {}
+
+    async def get_or_load[T](
+        self,
+        user_id: str,
+        key: Hashable,
+        load: Callable[[], Awaitable[T]],
+        *,
+        ttl_seconds: float | None = None,
+    ) -> T:
+        """Return the cached value for key, calling load() on a miss."""
+        full_key = (user_id, key)
+        entry = self._entries.get(full_key)
+        if entry is not None:
+            expires_at, value = entry
+            if time.monotonic() <= expires_at:
+                self._entries.move_to_end(full_key)
+                return value
+            del self._entries[full_key]
+
+        task = self._inflight.get(full_key)
+        if task is None:
+            task = asyncio.ensure_future(load())
+            self._inflight[full_key] = task
+            ttl = self._ttl if ttl_seconds is None else ttl_seconds
+            task.add_done_callback(functools.partial(self._store, full_key, ttl))
+        # Shield so one cancelled caller does not cancel the shared load
+        return await asyncio.shield(task)
+
+    def _store(self, full_key: tuple[str, Hashable], ttl: float, task: asyncio.Task[Any]) -> None:
+        if self._inflight.get(full_key) is not task:
+            return  # invalidated while loading
+        del self._inflight[full_key]
+        if task.cancelled() or task.exception() is not None:
+            return
+        self._entries[full_key] = (time.monotonic() + ttl, task.result())
+        self._entries.move_to_end(full_key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: str | None = None) -> int:
+        """Drop cached entries for a user (or all users). Returns count removed."""
+        if user_id is None:
+            count = len(self._entries)
+            self._entries.clear()
+            self._inflight.clear()
+            return count
+        stale = [k for k in self._entries if k[0] == user_id]
+        for k in stale:
+            del self._entries[k]
+        for k in [k for k in self._inflight if k[0] == user_id]:
+            del self._inflight[k]
+        return len(stale)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def read_through[T](
+    cache: LookupCache | None,
+    user_id: str,
+    key: Hashable,
+    load: Callable[[], Awaitable[T]],
+    *,
+    ttl_seconds: float | None = None,
+) -> Awaitable[T]:
+    """Read through cache when one is configured, otherwise call load() directly."""
+    if cache is None:
+        return load()
+    return cache.get_or_load(user_id, key, load, ttl_seconds=ttl_seconds)
+
+
+def memoize_embedder(embedder: Embedder, max_entries: int = 256) -> Embedder:
+    """Wrap an embedder with an LRU memo keyed on the exact input text.
+
+    Repeated prompts (e.g. the same opening question from many sessions)
+    are embedded once instead of on every call.
+    """
+    memo: OrderedDict[str, Sequence[float]] = OrderedDict()
+
+    async def embed(text: str) -> Sequence[float]:
+        vector = memo.get(text)
+        if vector is not None:
+            memo.move_to_end(text)
+            return vector
+        vector = await embedder(text)
+        memo[text] = vector
+        while len(memo) > max_entries:
+            memo.popitem(last=False)
+        return vector
+
+    return embed
+
+
+def normalize_vector(vector: Sequence[float]) -> tuple[float, ...]:
+    """Scale a vector to unit length, so cosine similarity is a dot product."""
+    norm = math.hypot(*vector)
+    if norm == 0.0:
+        return tuple(vector)
+    return tuple(x / norm for x in vector)
+
+
+class SemanticCache[T]:
+    """LRU + TTL cache keyed on embedding similarity.
+
+    Entries are scoped by (user_id, scope). A lookup returns the cached
+    value whose embedding has the highest cosine similarity to the query,
+    provided it meets the threshold. Vectors are normalized on insert so
+    similarity is a single dot product.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.92,
+        ttl_seconds: int = 600,
+        max_entries: int = 2048,
+    ) -> None:
+        self._threshold = threshold
+        self._ttl = ttl_seconds
+        self._max_entries = max_entries
+        self._next_id = 0
+        self._entries: OrderedDict[int, tuple[tuple[str, str], float, tuple[float, ...], T]] = OrderedDict()
+
+    def get(self, user_id: str, scope: str, vector: Sequence[float]) -> T | None:
+        """Get the most similar cached value at or above the threshold."""
+        query = normalize_vector(vector)
+        now = time.monotonic()
+        best_id: int | None = None
+        best_score = self._threshold
+        expired: list[int] = []
+        for entry_id, (key, expires_at, emb, _) in self._entries.items():
+            if now > expires_at:
+                expired.append(entry_id)
+                continue
+            if key != (user_id, scope) or len(emb) != len(query):
+                continue
+            score = math.sumprod(emb, query)
+            if score >= best_score:
+                best_id, best_score = entry_id, score
+        for entry_id in expired:
+            del self._entries[entry_id]
+        if best_id is None:
+            return None
+        self._entries.move_to_end(best_id)
+        return self._entries[best_id][3]
+
+    def set(self, user_id: str, scope: str, vector: Sequence[float], value: T) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        self._entries[self._next_id] = ((user_id, scope), time.monotonic() + self._ttl, normalize_vector(vector), value)
+        self._next_id += 1
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: str | None = None) -> int:
+        """Drop cached entries for a user (or all users). Returns count removed."""
+        if user_id is None:
+            count = len(self._entries)
+            self._entries.clear()
+            return count
+        stale = [k for k, entry in self._entries.items() if entry[0][0] == user_id]
+        for k in stale:
+            del self._entries[k]
+        return len(stale)
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1,7 +1,17 @@
 """In-memory repository implementations for testing and development."""
 
+import bisect
+import heapq
+import math
+import sys
+from collections import Counter
+from collections.abc import Hashable, Iterable, Iterator, Sequence
 from datetime import date, datetime
+from itertools import islice
+from operator import itemgetter
+from typing import Any
 
+from cyntra.agents.memory.cache import Embedder, normalize_vector
 from cyntra.agents.schemas import (
     Block,
     BlockStatus,
@@ -19,15 +29,92 @@ from cyntra.agents.schemas import (
     UserStats,
 )
 
+# Secondary indexes map a lookup key to the ids of matching records, so
+# per-user and per-mission reads only touch their own records. Ordered
+# indexes keep (sort_key, id) pairs sorted, so listings slice instead of
+# re-sorting. They are maintained on create/update/delete. The keys each
+# record was filed under are snapshotted at insert, so a record mutated in
+# place (get() hands out the stored instance) is still unindexed correctly.
+
+
+def _index_add[K: Hashable](index: dict[K, set[str]], key: K, record_id: str) -> None:
+    index.setdefault(key, set()).add(record_id)
+
+
+def _index_discard[K: Hashable](index: dict[K, set[str]], key: K, record_id: str) -> None:
+    ids = index.get(key)
+    if ids is not None:
+        ids.discard(record_id)
+        if not ids:
+            del index[key]
+
+
+def _ordered_add[K: Hashable](index: dict[K, list[tuple[Any, str]]], key: K, sort_key: Any, record_id: str) -> None:
+    bisect.insort(index.setdefault(key, []), (sort_key, record_id))
+
+
+def _ordered_discard[K: Hashable](index: dict[K, list[tuple[Any, str]]], key: K, sort_key: Any, record_id: str) -> None:
+    entries = index.get(key)
+    if entries is None:
+        return
+    entry = (sort_key, record_id)
+    i = bisect.bisect_left(entries, entry)
+    if i < len(entries) and entries[i] == entry:
+        del entries[i]
+        if not entries:
+            del index[key]
+
+
+def _entry_date(entry: tuple[datetime, str]) -> date:
+    return entry[0].date()
+
+
+def _block_order(block: Block) -> tuple[int, bool, datetime | None]:
+    """Sort key for blocks within a mission: sequence_index, then scheduled_start (unscheduled last)."""
+    start = block.scheduled_start
+    return (block.sequence_index or 0, start is None, start)
+
+
+# (mission_id, user_id, status, _block_order(), scheduled_start)
+type _BlockIndexKeys = tuple[str, str, BlockStatus, tuple[int, bool, datetime | None], datetime | None]
+
 
 class InMemoryMissionsRepository:
     """In-memory implementation of MissionsRepository."""
 
     def __init__(self) -> None:
         self._missions: dict[str, Mission] = {}
+        # Oldest first by created_at, overall and per status
+        self._by_user: dict[str, list[tuple[datetime, str]]] = {}
+        self._by_user_status: dict[tuple[str, MissionStatus], list[tuple[datetime, str]]] = {}
+        # Memoized get_active_mission results, dropped whenever the user's missions change
+        self._latest_active: dict[str, Mission | None] = {}
+        # (user_id, status, created_at) each mission is currently indexed under
+        self._index_keys: dict[str, tuple[str, MissionStatus, datetime]] = {}
+
+    def _index(self, mission: Mission) -> None:
+        user_id, status, created_at = keys = (mission.user_id, mission.status, mission.created_at)
+        self._index_keys[mission.id] = keys
+        self._latest_active.pop(user_id, None)
+        _ordered_add(self._by_user, user_id, created_at, mission.id)
+        _ordered_add(self._by_user_status, (user_id, status), created_at, mission.id)
+
+    def _unindex(self, mission_id: str) -> None:
+        keys = self._index_keys.pop(mission_id, None)
+        if keys is None:
+            return
+        user_id, status, created_at = keys
+        self._latest_active.pop(user_id, None)
+        _ordered_discard(self._by_user, user_id, created_at, mission_id)
+        _ordered_discard(self._by_user_status, (user_id, status), created_at, mission_id)
+
+    def _store(self, mission: Mission) -> None:
+        self._unindex(mission.id)
+        self._missions[mission.id] = mission
+        self._index(mission)
 
     async def create(self, mission: Mission) -> Mission:
-        self._missions[mission.id] = mission
+        self._store(mission)
         return mission
 
     async def get(self, mission_id: str) -> Mission | None:
@@ -36,14 +123,14 @@ class InMemoryMissionsRepository:
     async def update(self, mission: Mission) -> Mission:
         if mission.id not in self._missions:
             raise ValueError(f"Mission {mission.id} not found")
-        self._missions[mission.id] = mission
+        self._store(mission)
         return mission
 
     async def delete(self, mission_id: str) -> bool:
-        if mission_id in self._missions:
-            del self._missions[mission_id]
-            return True
-        return False
+        if self._missions.pop(mission_id, None) is None:
+            return False
+        self._unindex(mission_id)
+        return True
 
     async def list_for_user(
         self,
@@ -53,19 +140,20 @@ class InMemoryMissionsRepository:
         limit: int = 50,
         offset: int = 0,
     ) -> list[Mission]:
-        missions = [
-            m for m in self._missions.values() if m.user_id == user_id and (status is None or m.status == status)
-        ]
-        # Sort by created_at descending
-        missions.sort(key=lambda m: m.created_at, reverse=True)
-        return missions[offset : offset + limit]
+        # Newest first by created_at; a status filter reads that status's index
+        entries = self._by_user.get(user_id, ()) if status is None else self._by_user_status.get((user_id, status), ())
+        newest = (self._missions[i] for _, i in reversed(entries))
+        return list(islice(newest, offset, offset + limit))
 
     async def get_active_mission(self, user_id: str) -> Mission | None:
-        active = [m for m in self._missions.values() if m.user_id == user_id and m.status == MissionStatus.ACTIVE]
-        if not active:
-            return None
+        if user_id in self._latest_active:
+            return self._latest_active[user_id]
+
+        active = [self._missions[i] for _, i in self._by_user_status.get((user_id, MissionStatus.ACTIVE), ())]
         # Return most recently updated active mission
-        return max(active, key=lambda m: m.updated_at)
+        latest = max(active, key=lambda m: m.updated_at) if active else None
+        self._latest_active[user_id] = latest
+        return latest
 
 
 class InMemoryBlocksRepository:
@@ -73,9 +161,48 @@ class InMemoryBlocksRepository:
 
     def __init__(self) -> None:
         self._blocks: dict[str, Block] = {}
+        # Ordered by _block_order() (overall and per status) and by scheduled_start
+        self._by_mission: dict[str, list[tuple[tuple[int, bool, datetime | None], str]]] = {}
+        self._by_mission_status: dict[tuple[str, BlockStatus], list[tuple[tuple[int, bool, datetime | None], str]]] = {}
+        self._by_user_date: dict[tuple[str, date], list[tuple[datetime, str]]] = {}
+        self._in_progress_by_user: dict[str, set[str]] = {}
+        # Keys each block is currently indexed under
+        self._index_keys: dict[str, _BlockIndexKeys] = {}
+
+    def _index(self, block: Block) -> None:
+        mission_id, user_id, status, order, start = keys = (
+            block.mission_id,
+            block.user_id,
+            block.status,
+            _block_order(block),
+            block.scheduled_start,
+        )
+        self._index_keys[block.id] = keys
+        _ordered_add(self._by_mission, mission_id, order, block.id)
+        _ordered_add(self._by_mission_status, (mission_id, status), order, block.id)
+        if start is not None:
+            _ordered_add(self._by_user_date, (user_id, start.date()), start, block.id)
+        if status == BlockStatus.IN_PROGRESS:
+            _index_add(self._in_progress_by_user, user_id, block.id)
+
+    def _unindex(self, block_id: str) -> None:
+        keys = self._index_keys.pop(block_id, None)
+        if keys is None:
+            return
+        mission_id, user_id, status, order, start = keys
+        _ordered_discard(self._by_mission, mission_id, order, block_id)
+        _ordered_discard(self._by_mission_status, (mission_id, status), order, block_id)
+        if start is not None:
+            _ordered_discard(self._by_user_date, (user_id, start.date()), start, block_id)
+        _index_discard(self._in_progress_by_user, user_id, block_id)
+
+    def _store(self, block: Block) -> None:
+        self._unindex(block.id)
+        self._blocks[block.id] = block
+        self._index(block)
 
     async def create(self, block: Block) -> Block:
-        self._blocks[block.id] = block
+        self._store(block)
         return block
 
     async def get(self, block_id: str) -> Block | None:
@@ -84,14 +211,14 @@ class InMemoryBlocksRepository:
     async def update(self, block: Block) -> Block:
         if block.id not in self._blocks:
             raise ValueError(f"Block {block.id} not found")
-        self._blocks[block.id] = block
+        self._store(block)
         return block
 
     async def delete(self, block_id: str) -> bool:
-        if block_id in self._blocks:
-            del self._blocks[block_id]
-            return True
-        return False
+        if self._blocks.pop(block_id, None) is None:
+            return False
+        self._unindex(block_id)
+        return True
 
     async def list_for_mission(
         self,
@@ -100,28 +227,22 @@ class InMemoryBlocksRepository:
         status: BlockStatus | None = None,
         limit: int = 100,
     ) -> list[Block]:
-        blocks = [
-            b for b in self._blocks.values() if b.mission_id == mission_id and (status is None or b.status == status)
-        ]
-        # Sort by sequence_index, then scheduled_start
-        blocks.sort(key=lambda b: (b.sequence_index or 0, b.scheduled_start or datetime.max))
-        return blocks[:limit]
+        # Already ordered by sequence_index, then scheduled_start
+        if status is None:
+            entries = self._by_mission.get(mission_id, ())
+        else:
+            entries = self._by_mission_status.get((mission_id, status), ())
+        return [self._blocks[i] for _, i in islice(entries, limit)]
 
     async def list_for_user_date(
         self,
         user_id: str,
         target_date: date,
     ) -> list[Block]:
-        blocks = [
-            b
-            for b in self._blocks.values()
-            if b.user_id == user_id and b.scheduled_start is not None and b.scheduled_start.date() == target_date
-        ]
-        blocks.sort(key=lambda b: b.scheduled_start or datetime.max)
-        return blocks
+        return [self._blocks[i] for _, i in self._by_user_date.get((user_id, target_date), ())]
 
     async def get_current_block(self, user_id: str) -> Block | None:
-        in_progress = [b for b in self._blocks.values() if b.user_id == user_id and b.status == BlockStatus.IN_PROGRESS]
+        in_progress = [self._blocks[i] for i in self._in_progress_by_user.get(user_id, ())]
         if not in_progress:
             return None
         # Return the one that started most recently
@@ -133,11 +254,27 @@ class InMemoryEpisodesRepository:
 
     def __init__(self) -> None:
         self._episodes: dict[str, Episode] = {}
+        # Oldest first by created_at, overall and per kind
+        self._by_user: dict[str, list[tuple[datetime, str]]] = {}
+        self._by_user_kind: dict[tuple[str, EpisodeKind], list[tuple[datetime, str]]] = {}
+        # (user_id, kind, created_at) each episode is currently indexed under
+        self._index_keys: dict[str, tuple[str, EpisodeKind, datetime]] = {}
 
     async def create(self, episode: Episode) -> Episode:
+        old = self._index_keys.get(episode.id)
+        if old is not None:
+            user_id, kind, created_at = old
+            _ordered_discard(self._by_user, user_id, created_at, episode.id)
+            _ordered_discard(self._by_user_kind, (user_id, kind), created_at, episode.id)
         self._episodes[episode.id] = episode
+        self._index_keys[episode.id] = (episode.user_id, episode.kind, episode.created_at)
+        _ordered_add(self._by_user, episode.user_id, episode.created_at, episode.id)
+        _ordered_add(self._by_user_kind, (episode.user_id, episode.kind), episode.created_at, episode.id)
         return episode
 
+    def _newest_first(self, user_id: str) -> Iterator[Episode]:
+        return (self._episodes[i] for _, i in reversed(self._by_user.get(user_id, ())))
+
     async def get(self, episode_id: str) -> Episode | None:
         return self._episodes.get(episode_id)
 
@@ -151,28 +288,27 @@ class InMemoryEpisodesRepository:
         end_date: date | None = None,
         limit: int = 50,
     ) -> list[Episode]:
-        episodes = [e for e in self._episodes.values() if e.user_id == user_id]
+        if kind is None:
+            entries = self._by_user.get(user_id, [])
+        else:
+            entries = self._by_user_kind.get((user_id, kind), [])
+        # Entries are oldest first, so bisect the date range once instead of
+        # comparing every episode's date
+        start = 0 if start_date is None else bisect.bisect_left(entries, start_date, key=_entry_date)
+        stop = len(entries) if end_date is None else bisect.bisect_right(entries, end_date, key=_entry_date)
+        episodes: Iterator[Episode] = (self._episodes[entries[j][1]] for j in range(stop - 1, start - 1, -1))
 
-        if kind is not None:
-            episodes = [e for e in episodes if e.kind == kind]
         if mission_id is not None:
-            episodes = [e for e in episodes if e.mission_id == mission_id]
-        if start_date is not None:
-            episodes = [e for e in episodes if e.created_at.date() >= start_date]
-        if end_date is not None:
-            episodes = [e for e in episodes if e.created_at.date() <= end_date]
+            episodes = (e for e in episodes if e.mission_id == mission_id)
 
-        episodes.sort(key=lambda e: e.created_at, reverse=True)
-        return episodes[:limit]
+        return list(islice(episodes, limit))
 
     async def get_recent(
         self,
         user_id: str,
         limit: int = 10,
     ) -> list[Episode]:
-        episodes = [e for e in self._episodes.values() if e.user_id == user_id]
-        episodes.sort(key=lambda e: e.created_at, reverse=True)
-        return episodes[:limit]
+        return list(islice(self._newest_first(user_id), limit))
 
 
 class InMemoryUserProfileRepository:
@@ -193,8 +329,9 @@ class InMemoryUserProfileRepository:
         return profile
 
     async def get_or_create(self, user_id: str) -> UserProfile:
-        if user_id in self._profiles:
-            return self._profiles[user_id]
+        profile = self._profiles.get(user_id)
+        if profile is not None:
+            return profile
 
         now = datetime.now()
         profile = UserProfile(
@@ -208,24 +345,103 @@ class InMemoryUserProfileRepository:
         return profile
 
 
+def _tokenize(text: str) -> frozenset[str]:
+    """Lowercased words of a text, interned so repeated words share one string across records."""
+    return frozenset(map(sys.intern, text.lower().split()))
+
+
 class InMemorySemanticMemory:
     """In-memory stub for SemanticMemory.
 
-    For MVP, this just stores episodes and does simple text matching.
+    Without an embedder, this does simple text matching: texts are
+    tokenized once when added into a (user_id, token) inverted index, and
+    a search sums the query tokens' postings to get every matching
+    record's word overlap in one pass. With an embedder, records are
+    embedded when added and searches rank them by cosine similarity.
     Real implementation would use Cognee or similar vector store.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, embedder: Embedder | None = None) -> None:
+        self._embedder = embedder
         self._episodes: dict[str, Episode] = {}
         self._missions: dict[str, Mission] = {}
         self._patterns: dict[str, dict[str, str]] = {}  # user_id -> {pattern_type: summary}
+        # Lexical index (no embedder)
+        self._episode_tokens: dict[str, frozenset[str]] = {}
+        self._mission_tokens: dict[str, frozenset[str]] = {}
+        self._episode_postings: dict[tuple[str, str], set[str]] = {}
+        self._mission_postings: dict[tuple[str, str], set[str]] = {}
+        # Unit-length embeddings (with embedder): user_id -> {record_id: vector}
+        self._episode_vectors: dict[str, dict[str, tuple[float, ...]]] = {}
+        self._mission_vectors: dict[str, dict[str, tuple[float, ...]]] = {}
+
+    @staticmethod
+    def _reindex(
+        postings: dict[tuple[str, str], set[str]],
+        tokens: dict[str, frozenset[str]],
+        user_id: str,
+        record_id: str,
+        text: str,
+        old_user_id: str | None,
+    ) -> None:
+        if old_user_id is not None:
+            for token in tokens[record_id]:
+                _index_discard(postings, (old_user_id, token), record_id)
+        words = _tokenize(text)
+        tokens[record_id] = words
+        for token in words:
+            _index_add(postings, (user_id, token), record_id)
+
+    @staticmethod
+    def _overlaps(postings: dict[tuple[str, str], set[str]], user_id: str, query_words: frozenset[str]) -> Counter[str]:
+        """Count matched query words per record by summing the query tokens' postings."""
+        counts: Counter[str] = Counter()
+        for token in query_words:
+            counts.update(postings.get((user_id, token), ()))
+        return counts
+
+    async def _embed_into(
+        self,
+        vectors: dict[str, dict[str, tuple[float, ...]]],
+        user_id: str,
+        record_id: str,
+        text: str,
+        old_user_id: str | None,
+    ) -> None:
+        assert self._embedder is not None
+        vector = normalize_vector(await self._embedder(text))
+        if old_user_id is not None:
+            vectors.get(old_user_id, {}).pop(record_id, None)
+        vectors.setdefault(user_id, {})[record_id] = vector
+
+    async def _cosine_scores(
+        self, vectors: dict[str, dict[str, tuple[float, ...]]], user_id: str, query: str
+    ) -> Iterator[tuple[str, float]]:
+        assert self._embedder is not None
+        query_vector = normalize_vector(await self._embedder(query))
+        return ((i, math.sumprod(v, query_vector)) for i, v in vectors.get(user_id, {}).items())
 
     async def add_episode(self, episode: Episode) -> None:
+        old = self._episodes.get(episode.id)
         self._episodes[episode.id] = episode
+        text = f"{episode.title or ''} {episode.summary} {episode.reflection or ''}"
+        old_user_id = old and old.user_id
+        # Lexical indexing is synchronous; only embedding needs an await
+        if self._embedder is None:
+            self._reindex(self._episode_postings, self._episode_tokens, episode.user_id, episode.id, text, old_user_id)
+        else:
+            await self._embed_into(self._episode_vectors, episode.user_id, episode.id, text, old_user_id)
 
     async def add_mission(self, mission: Mission) -> None:
         """Helper to index missions for similarity search."""
+        old = self._missions.get(mission.id)
         self._missions[mission.id] = mission
+        text = f"{mission.title} {mission.description or ''}"
+        old_user_id = old and old.user_id
+        if self._embedder is None:
+            self._reindex(self._mission_postings, self._mission_tokens, mission.user_id, mission.id, text, old_user_id)
+        else:
+            await self._embed_into(self._mission_vectors, mission.user_id, mission.id, text, old_user_id)
 
     async def search_similar_episodes(
         self,
@@ -235,24 +451,24 @@ class InMemorySemanticMemory:
         limit: int = 5,
         min_similarity: float = 0.5,
     ) -> list[Episode]:
+        if self._embedder is not None:
+            scores = await self._cosine_scores(self._episode_vectors, user_id, query)
+            scored = [(score, self._episodes[i]) for i, score in scores if score >= min_similarity]
+            return [ep for _, ep in heapq.nlargest(limit, scored, key=itemgetter(0))]
+
         # Simple keyword matching for MVP
-        query_lower = query.lower()
-        user_episodes = [e for e in self._episodes.values() if e.user_id == user_id]
+        query_words = _tokenize(query)
+        if not query_words:
+            return []
 
         scored = []
-        for ep in user_episodes:
-            text = f"{ep.title or ''} {ep.summary} {ep.reflection or ''}".lower()
-            # Very simple scoring: count matching words
-            query_words = set(query_lower.split())
-            text_words = set(text.split())
-            overlap = len(query_words & text_words)
-            if overlap > 0:
-                score = overlap / max(len(query_words), 1)
-                if score >= min_similarity:
-                    scored.append((score, ep))
-
-        scored.sort(key=lambda x: x[0], reverse=True)
-        return [ep for _, ep in scored[:limit]]
+        for episode_id, overlap in self._overlaps(self._episode_postings, user_id, query_words).items():
+            # Very simple scoring: fraction of query words matched
+            score = overlap / len(query_words)
+            if score >= min_similarity:
+                scored.append((score, self._episodes[episode_id]))
+
+        return [ep for _, ep in heapq.nlargest(limit, scored, key=itemgetter(0))]
 
     async def search_similar_missions(
         self,
@@ -260,21 +476,26 @@ class InMemorySemanticMemory:
         query: str,
         *,
         limit: int = 5,
+        status: MissionStatus | None = None,
+        min_similarity: float = 0.5,
     ) -> list[Mission]:
-        query_lower = query.lower()
-        user_missions = [m for m in self._missions.values() if m.user_id == user_id]
+        matches: Iterable[tuple[str, float]]
+        if self._embedder is not None:
+            matches = await self._cosine_scores(self._mission_vectors, user_id, query)
+            threshold = min_similarity
+        else:
+            # Keyword matching scores by shared word count; any overlap matches
+            query_words = _tokenize(query)
+            matches = self._overlaps(self._mission_postings, user_id, query_words).items()
+            threshold = 1
 
         scored = []
-        for mission in user_missions:
-            text = f"{mission.title} {mission.description or ''}".lower()
-            query_words = set(query_lower.split())
-            text_words = set(text.split())
-            overlap = len(query_words & text_words)
-            if overlap > 0:
-                scored.append((overlap, mission))
+        for mission_id, score in matches:
+            mission = self._missions[mission_id]
+            if score >= threshold and (status is None or mission.status == status):
+                scored.append((score, mission))
 
-        scored.sort(key=lambda x: x[0], reverse=True)
-        return [m for _, m in scored[:limit]]
+        return [m for _, m in heapq.nlargest(limit, scored, key=itemgetter(0))]
 
     async def get_pattern_summary(
         self,
@@ -299,30 +520,40 @@ class InMemoryGraphRepository:
     """In-memory implementation of GraphRepository."""
 
     def __init__(self) -> None:
-        self._nodes: dict[str, GraphNode] = {}  # keyed by f"{graph_id}:{node_id}"
+        self._nodes_by_graph: dict[str, dict[str, GraphNode]] = {}  # graph_id -> {node_id: node}
+        self._title_lower: dict[tuple[str, str], str] = {}  # (graph_id, node_id) -> lowercased title
+        self._children: dict[tuple[str, str], dict[str, GraphNode]] = {}  # (graph_id, parent_id) -> {node_id: node}
         self._edges: dict[str, GraphEdge] = {}
-        self._progress: dict[str, NodeProgress] = {}  # keyed by f"{user_id}:{graph_id}:{node_id}"
-
-    def _node_key(self, graph_id: str, node_id: str) -> str:
-        return f"{graph_id}:{node_id}"
-
-    def _progress_key(self, user_id: str, graph_id: str, node_id: str) -> str:
-        return f"{user_id}:{graph_id}:{node_id}"
+        # Adjacency lists of edge ids, keyed by (graph_id, node_id)
+        self._out: dict[tuple[str, str], list[str]] = {}
+        self._in: dict[tuple[str, str], list[str]] = {}
+        self._progress: dict[tuple[str, str, str], NodeProgress] = {}  # keyed by (user_id, graph_id, node_id)
 
     async def add_node(self, node: GraphNode) -> GraphNode:
         """Helper to add nodes for testing."""
-        key = self._node_key(node.graph_id, node.id)
-        self._nodes[key] = node
+        graph_nodes = self._nodes_by_graph.setdefault(node.graph_id, {})
+        old = graph_nodes.get(node.id)
+        if old is not None and old.parent_id and old.parent_id != node.parent_id:
+            del self._children[(old.graph_id, old.parent_id)][old.id]
+        graph_nodes[node.id] = node
+        if node.parent_id:
+            self._children.setdefault((node.graph_id, node.parent_id), {})[node.id] = node
+        self._title_lower[(node.graph_id, node.id)] = node.title.lower()
         return node
 
     async def add_edge(self, edge: GraphEdge) -> GraphEdge:
         """Helper to add edges for testing."""
+        old = self._edges.get(edge.id)
+        if old is not None:
+            self._out[(old.graph_id, old.source_id)].remove(old.id)
+            self._in[(old.graph_id, old.target_id)].remove(old.id)
         self._edges[edge.id] = edge
+        self._out.setdefault((edge.graph_id, edge.source_id), []).append(edge.id)
+        self._in.setdefault((edge.graph_id, edge.target_id), []).append(edge.id)
         return edge
 
     async def get_node(self, graph_id: str, node_id: str) -> GraphNode | None:
-        key = self._node_key(graph_id, node_id)
-        return self._nodes.get(key)
+        return self._nodes_by_graph.get(graph_id, {}).get(node_id)
 
     async def get_neighbors(
         self,
@@ -332,38 +563,48 @@ class InMemoryGraphRepository:
         edge_types: list[str] | None = None,
         direction: str = "outgoing",
     ) -> list[GraphNode]:
+        nodes = self._nodes_by_graph.get(graph_id, {})
+        wanted_types = frozenset(edge_types) if edge_types else None
         neighbors: list[GraphNode] = []
-
-        for edge in self._edges.values():
-            if edge.graph_id != graph_id:
-                continue
-            if edge_types and edge.edge_type.value not in edge_types:
-                continue
-
-            neighbor_id: str | None = None
-            if direction in ("outgoing", "both") and edge.source_id == node_id:
-                neighbor_id = edge.target_id
-            elif direction in ("incoming", "both") and edge.target_id == node_id:
-                neighbor_id = edge.source_id
-
-            if neighbor_id:
-                node = await self.get_node(graph_id, neighbor_id)
-                if node and node not in neighbors:
+        seen: set[str] = set()
+
+        # (adjacency, attribute holding the node on the other end)
+        sides: list[tuple[dict[tuple[str, str], list[str]], str]] = []
+        if direction in ("outgoing", "both"):
+            sides.append((self._out, "target_id"))
+        if direction in ("incoming", "both"):
+            sides.append((self._in, "source_id"))
+
+        for adjacency, end in sides:
+            for edge_id in adjacency.get((graph_id, node_id), ()):
+                edge = self._edges[edge_id]
+                if wanted_types is not None and edge.edge_type.value not in wanted_types:
+                    continue
+
+                neighbor_id = getattr(edge, end)
+                if neighbor_id in seen:
+                    continue
+                node = nodes.get(neighbor_id)
+                if node is not None:
+                    seen.add(neighbor_id)
                     neighbors.append(node)
 
         return neighbors
 
     async def query(self, query: GraphQuery) -> GraphQueryResult:
         nodes: list[GraphNode] = []
+        needle = query.title_contains.lower() if query.title_contains else None
+        titles = self._title_lower
 
-        for node in self._nodes.values():
-            if node.graph_id != query.graph_id:
-                continue
+        if query.parent_id:
+            candidates = self._children.get((query.graph_id, query.parent_id), {})
+        else:
+            candidates = self._nodes_by_graph.get(query.graph_id, {})
+
+        for node in candidates.values():
             if query.node_types and node.type not in query.node_types:
                 continue
-            if query.parent_id and node.parent_id != query.parent_id:
-                continue
-            if query.title_contains and query.title_contains.lower() not in node.title.lower():
+            if needle is not None and needle not in titles[(node.graph_id, node.id)]:
                 continue
 
             nodes.append(node)
@@ -384,19 +625,24 @@ class InMemoryGraphRepository:
         graph_id: str,
         node_id: str,
     ) -> NodeProgress | None:
-        key = self._progress_key(user_id, graph_id, node_id)
-        return self._progress.get(key)
+        return self._progress.get((user_id, graph_id, node_id))
 
     async def update_user_progress(
         self,
         progress: NodeProgress,
     ) -> NodeProgress:
-        key = self._progress_key(progress.user_id, progress.graph_id, progress.node_id)
-        self._progress[key] = progress
+        self._progress[(progress.user_id, progress.graph_id, progress.node_id)] = progress
         return progress
 
+    async def update_user_progress_many(self, items: Sequence[NodeProgress]) -> list[NodeProgress]:
+        """Helper to store a batch of progress records in one dict update."""
+        self._progress.update({(p.user_id, p.graph_id, p.node_id): p for p in items})
+        return list(items)
+
 
-def create_in_memory_repos() -> tuple[
+def create_in_memory_repos(
+    embedder: Embedder | None = None,
+) -> tuple[
     InMemoryMissionsRepository,
     InMemoryBlocksRepository,
     InMemoryEpisodesRepository,
@@ -406,13 +652,14 @@ def create_in_memory_repos() -> tuple[
 ]:
     """Create a fresh set of in-memory repositories.
 
-    Useful for testing.
+    Useful for testing. Pass an embedder to rank semantic memory searches
+    by embedding similarity instead of word overlap.
     """
     return (
         InMemoryMissionsRepository(),
         InMemoryBlocksRepository(),
         InMemoryEpisodesRepository(),
         InMemoryUserProfileRepository(),
-        InMemorySemanticMemory(),
+        InMemorySemanticMemory(embedder),
         InMemoryGraphRepository(),
     )
@@ -210,8 +210,14 @@ class SemanticMemory(Protocol):
         query: str,
         *,
         limit: int = 5,
+        status: MissionStatus | None = None,
+        min_similarity: float = 0.5,
     ) -> list[Mission]:
-        """Search for past missions similar to a query/description."""
+        """Search for past missions similar to a query/description.
+
+        When status is given, only missions in that status are returned.
+        min_similarity is the lowest embedding similarity a match may have.
+        """
         ...
 
     @abstractmethod
@@ -289,6 +295,9 @@ class RepositoryBundle:
     This is the concrete class that gets passed to GlyphAgentService.
     """
 
+    # __weakref__ keeps bundles usable as keys of the graphs' tool cache
+    __slots__ = ("missions", "blocks", "episodes", "profiles", "semantic_memory", "graph", "__weakref__")
+
     def __init__(
         self,
         *,
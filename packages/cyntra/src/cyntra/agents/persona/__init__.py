@@ -1,41 +1,76 @@
 """Persona layer for Glyph - prompts, messages, and agent factory."""
 
-from .agent_factory import (
-    AgentConfig,
-    GlyphPersona,
-    ToolDefinition,
-    ToolRegistry,
-    create_glyph_agent_config,
-    create_glyph_persona,
-    create_tool_registry_from_tools,
-)
-from .kernel_orchestrator import (
-    KernelOrchestratorPersona,
-    create_kernel_orchestrator_config,
-    create_kernel_orchestrator_persona,
-    create_kernel_tool_registry,
-)
-from .kernel_prompts import (
-    KERNEL_ORCHESTRATOR_SYSTEM_PROMPT,
-    build_kernel_system_prompt,
-)
-from .message_types import (
-    Conversation,
-    Message,
-    MessageRole,
-    ToolCall,
-    ToolResult,
-    from_openai_format,
-    to_openai_format,
-)
-from .prompts import (
-    ARCHIVIST_EXAMPLES,
-    COACH_EXAMPLES,
-    GLYPH_SYSTEM_PROMPT,
-    PLANNER_EXAMPLES,
-    build_system_prompt,
-    get_mode_examples,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from cyntra.agents.persona.agent_factory import (
+        AgentConfig,
+        GlyphPersona,
+        ToolDefinition,
+        ToolRegistry,
+        create_glyph_agent_config,
+        create_glyph_persona,
+        create_tool_registry_from_tools,
+    )
+    from cyntra.agents.persona.kernel_orchestrator import (
+        KernelOrchestratorPersona,
+        create_kernel_orchestrator_config,
+        create_kernel_orchestrator_persona,
+        create_kernel_tool_registry,
+    )
+    from cyntra.agents.persona.kernel_prompts import (
+        KERNEL_ORCHESTRATOR_SYSTEM_PROMPT,
+        build_kernel_system_prompt,
+    )
+    from cyntra.agents.persona.message_types import (
+        Conversation,
+        Message,
+        MessageRole,
+        ToolCall,
+        ToolResult,
+        from_openai_format,
+        to_openai_format,
+    )
+    from cyntra.agents.persona.prompts import (
+        ARCHIVIST_EXAMPLES,
+        COACH_EXAMPLES,
+        GLYPH_SYSTEM_PROMPT,
+        PLANNER_EXAMPLES,
+        build_system_prompt,
+        get_mode_examples,
+    )
+
+# Public names are resolved on first access so that importing message
+# types does not build the agent factory and prompt modules.
+_LAZY: dict[str, str] = {
+    "AgentConfig": "cyntra.agents.persona.agent_factory",
+    "GlyphPersona": "cyntra.agents.persona.agent_factory",
+    "ToolDefinition": "cyntra.agents.persona.agent_factory",
+    "ToolRegistry": "cyntra.agents.persona.agent_factory",
+    "create_glyph_agent_config": "cyntra.agents.persona.agent_factory",
+    "create_glyph_persona": "cyntra.agents.persona.agent_factory",
+    "create_tool_registry_from_tools": "cyntra.agents.persona.agent_factory",
+    "KernelOrchestratorPersona": "cyntra.agents.persona.kernel_orchestrator",
+    "create_kernel_orchestrator_config": "cyntra.agents.persona.kernel_orchestrator",
+    "create_kernel_orchestrator_persona": "cyntra.agents.persona.kernel_orchestrator",
+    "create_kernel_tool_registry": "cyntra.agents.persona.kernel_orchestrator",
+    "KERNEL_ORCHESTRATOR_SYSTEM_PROMPT": "cyntra.agents.persona.kernel_prompts",
+    "build_kernel_system_prompt": "cyntra.agents.persona.kernel_prompts",
+    "Conversation": "cyntra.agents.persona.message_types",
+    "Message": "cyntra.agents.persona.message_types",
+    "MessageRole": "cyntra.agents.persona.message_types",
+    "ToolCall": "cyntra.agents.persona.message_types",
+    "ToolResult": "cyntra.agents.persona.message_types",
+    "from_openai_format": "cyntra.agents.persona.message_types",
+    "to_openai_format": "cyntra.agents.persona.message_types",
+    "ARCHIVIST_EXAMPLES": "cyntra.agents.persona.prompts",
+    "COACH_EXAMPLES": "cyntra.agents.persona.prompts",
+    "GLYPH_SYSTEM_PROMPT": "cyntra.agents.persona.prompts",
+    "PLANNER_EXAMPLES": "cyntra.agents.persona.prompts",
+    "build_system_prompt": "cyntra.agents.persona.prompts",
+    "get_mode_examples": "cyntra.agents.persona.prompts",
+}
 
 __all__ = [
     # Agent factory
@@ -68,3 +103,17 @@ __all__ = [
     "build_kernel_system_prompt",
     "get_mode_examples",
 ]
+
+
+def __getattr__(name: str) -> object:
+    """Lazily import public names from their defining submodule."""
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(__all__)
@@ -3,21 +3,73 @@
 Uses the OpenAI Agents SDK for tool-calling and conversation management.
 """
 
-import json
-from collections.abc import Callable, Coroutine
+import asyncio
+import functools
+import sqlite3
+from collections import OrderedDict
+from collections.abc import Callable, Coroutine, Hashable, Sequence
 from dataclasses import dataclass
 from typing import Any
 
 from agents import Agent as SDKAgent
-from agents import FunctionTool, ModelSettings, RunContextWrapper, Runner, SQLiteSession
+from agents import FunctionTool, ModelSettings, RunContextWrapper, Runner, RunResult, SQLiteSession, ToolCallItem
+from pydantic import BaseModel
 
 from cyntra.agents.config import AgentSettings
-from cyntra.agents.persona.message_types import Message
+from cyntra.agents.persona.message_types import Message, ToolCall
 from cyntra.agents.persona.prompts import build_system_prompt
 from cyntra.commons import get_logger, new_id
+from cyntra.commons.schema import dumps, loads
 
 logger = get_logger(__name__)
 
+_IN_MEMORY_DB = ":memory:"
+
+# Agents kept per tool registry, keyed by everything that shapes them
+_MAX_CACHED_AGENTS = 64
+
+
+@functools.cache
+def _enable_wal(db_path: str) -> None:
+    """Switch a shared session database to WAL mode, once per process and path."""
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+
+
+def open_session(session_id: str, db_path: str = _IN_MEMORY_DB) -> SQLiteSession:
+    """Open a conversation session.
+
+    With the default ":memory:" each session gets its own private
+    database. A file path lets every session share one WAL-mode database
+    keyed by session_id, so sessions stop paying per-database setup.
+    """
+    if db_path != _IN_MEMORY_DB:
+        _enable_wal(db_path)
+    return SQLiteSession(session_id=session_id, db_path=db_path)
+
+
+def _tool_calls(result: RunResult) -> list[ToolCall]:
+    """Tool calls the agent made during a run, in order."""
+    calls: list[ToolCall] = []
+    for item in result.new_items:
+        if not isinstance(item, ToolCallItem):
+            continue
+        raw = item.raw_item
+        fields = raw if isinstance(raw, dict) else raw.model_dump()
+        try:
+            arguments = loads(fields.get("arguments") or "{}")
+        except ValueError:
+            arguments = {}
+        calls.append(
+            ToolCall(
+                id=fields.get("call_id") or fields.get("id") or "",
+                name=item.tool_name or "",
+                arguments=arguments if isinstance(arguments, dict) else {},
+            )
+        )
+    return calls
+
 
 @dataclass
 class ToolDefinition:
@@ -35,24 +87,26 @@ class ToolDefinition:
         """
         # Capture handler in closure
         handler = self.handler
+        # Tools without parameters are called bare, whatever arguments arrive
+        takes_args = bool(self.parameters.get("properties"))
 
         async def on_invoke(ctx: RunContextWrapper[Any], args_json: str) -> str:
             """Invoke the tool with parsed arguments.
 
             The Agents SDK passes arguments as a JSON string for custom tools.
             """
-            args = json.loads(args_json) if args_json else {}
+            args = loads(args_json) if takes_args and args_json and args_json != "{}" else {}
             logger.debug("executing_tool tool_name=%s", self.name)
             try:
                 result = await handler(**args)
                 # Normalize to a string output (SDK expects plain text)
-                if isinstance(result, dict | list):
-                    return json.dumps(result, default=str)
+                if isinstance(result, dict | list | BaseModel):
+                    return dumps(result)
                 if result is None:
                     return "OK"
                 return str(result)
             except Exception as e:
-                logger.error("tool_execution_error tool_name=%s error=%s", self.name, str(e))
+                logger.error("tool_execution_error tool_name=%s error=%s", self.name, e)
                 return f"Error: {e}"
 
         return FunctionTool(
@@ -68,6 +122,10 @@ class ToolRegistry:
 
     def __init__(self) -> None:
         self._tools: dict[str, ToolDefinition] = {}
+        # Converted tool lists, rebuilt after the next register()
+        self._cached_function_tools: list[FunctionTool] | None = None
+        self._cached_openai_tools: list[dict[str, Any]] | None = None
+        self._cached_agents: OrderedDict[Hashable, SDKAgent] = OrderedDict()
 
     def register(
         self,
@@ -83,33 +141,63 @@ class ToolRegistry:
             parameters=parameters,
             handler=handler,
         )
+        self._cached_function_tools = None
+        self._cached_openai_tools = None
+        self._cached_agents.clear()
         logger.debug("tool_registered tool_name=%s", name)
 
     def get(self, name: str) -> ToolDefinition | None:
         """Get a tool by name."""
         return self._tools.get(name)
 
+    def __len__(self) -> int:
+        return len(self._tools)
+
     def list_tools(self) -> list[ToolDefinition]:
         """List all registered tools."""
         return list(self._tools.values())
 
     def to_openai_tools(self) -> list[dict[str, Any]]:
         """Convert tools to OpenAI function calling format (legacy)."""
-        return [
-            {
-                "type": "function",
-                "function": {
-                    "name": tool.name,
-                    "description": tool.description,
-                    "parameters": tool.parameters,
-                },
-            }
-            for tool in self._tools.values()
-        ]
+        if self._cached_openai_tools is None:
+            self._cached_openai_tools = [
+                {
+                    "type": "function",
+                    "function": {
+                        "name": tool.name,
+                        "description": tool.description,
+                        "parameters": tool.parameters,
+                    },
+                }
+                for tool in self._tools.values()
+            ]
+        return list(self._cached_openai_tools)
 
     def to_function_tools(self) -> list[FunctionTool]:
-        """Convert all registered tools to Agents SDK FunctionTools."""
-        return [tool_def.to_function_tool() for tool_def in self._tools.values()]
+        """Convert all registered tools to Agents SDK FunctionTools.
+
+        The converted tools are built once and reused until another tool is registered.
+        """
+        if self._cached_function_tools is None:
+            self._cached_function_tools = [tool_def.to_function_tool() for tool_def in self._tools.values()]
+        return list(self._cached_function_tools)
+
+    def get_or_build_agent(self, key: Hashable, build: Callable[[], SDKAgent]) -> SDKAgent:
+        """Return the agent built for key with these tools, building it on first use.
+
+        Agents hold no conversation state, so sessions with the same prompt
+        inputs and model settings share one. The most recently used
+        agents are kept; all are dropped when a tool is registered.
+        """
+        agent = self._cached_agents.get(key)
+        if agent is not None:
+            self._cached_agents.move_to_end(key)
+            return agent
+        agent = build()
+        self._cached_agents[key] = agent
+        if len(self._cached_agents) > _MAX_CACHED_AGENTS:
+            self._cached_agents.popitem(last=False)
+        return agent
 
 
 @dataclass
@@ -168,17 +256,54 @@ class GlyphPersona:
             len(reply_text),
         )
 
-        response_msg = Message.assistant(reply_text)
+        # Tool calls are reported so callers can tell the reply had side effects
+        response_msg = Message.assistant(reply_text, tool_calls=_tool_calls(result))
         return response_msg
 
+    async def send_message_batch(
+        self,
+        contents: Sequence[str],
+        *,
+        max_concurrency: int = 8,
+    ) -> list[Message | BaseException]:
+        """Send independent messages concurrently, for evals and offline replays.
+
+        Each message runs in its own ephemeral session, so prompts do not
+        see each other's turns and the persona's conversation session is
+        left untouched. At most max_concurrency runs are in flight at once.
+
+        Returns:
+            One entry per message, in input order: the reply, or the
+            exception its run raised.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _run_one(content: str) -> Message:
+            session = open_session(new_id())
+            async with semaphore:
+                result = await Runner.run(self._config.agent, content, session=session)
+            return Message.assistant(str(result.final_output) if result.final_output else "")
+
+        logger.debug("sending_message_batch model=%s batch_size=%d", self._config.agent.model, len(contents))
+        return await asyncio.gather(*(_run_one(c) for c in contents), return_exceptions=True)
+
+    async def record_turn(self, content: str, reply: str) -> None:
+        """Append a user message and a reply produced outside the agent to the session."""
+        await self._config.session.add_items(
+            [
+                {"role": "user", "content": content},
+                {"role": "assistant", "content": reply},
+            ]
+        )
+
     def reset_conversation(self) -> None:
         """Start a fresh conversation by creating a new Session.
 
         We create a new in-memory session with a fresh ID.
         """
         new_session_id = new_id()
-        # Create a new in-memory SQLite session
-        self._config.session = SQLiteSession(db_path=":memory:", session_id=new_session_id)
+        # Keep the current session's database (private in-memory or shared file)
+        self._config.session = open_session(new_session_id, self._config.session.db_path)
         logger.debug("conversation_reset session_id=%s", new_session_id)
 
     async def inject_context(self, context: str) -> None:
@@ -215,33 +340,41 @@ def create_glyph_agent_config(
         user_context: Optional additional user context
         session_id: Optional session ID for conversation continuity
     """
-    system_prompt = build_system_prompt(
-        mode=mode,
-        user_name=user_name,
-        user_context=user_context,
-    )
-
     llm_deployment = settings.llm.default
     behavior = settings.behavior
 
-    model_settings = ModelSettings(
-        temperature=behavior.temperature,
-        max_tokens=behavior.max_tokens,
-    )
-
-    tools = tool_registry.to_function_tools()
+    def build_agent() -> SDKAgent:
+        system_prompt = build_system_prompt(
+            mode=mode,
+            user_name=user_name,
+            user_context=user_context,
+        )
+        model_settings = ModelSettings(
+            temperature=behavior.temperature,
+            max_tokens=behavior.max_tokens,
+        )
+        return SDKAgent(
+            name="Glyph",
+            instructions=system_prompt,
+            model=llm_deployment.model,
+            model_settings=model_settings,
+            tools=tool_registry.to_function_tools(),
+        )
 
-    agent = SDKAgent(
-        name="Glyph",
-        instructions=system_prompt,
-        model=llm_deployment.model,
-        model_settings=model_settings,
-        tools=tools,
+    agent_key = (
+        "Glyph",
+        mode,
+        user_name,
+        user_context,
+        llm_deployment.model,
+        behavior.temperature,
+        behavior.max_tokens,
     )
+    agent = tool_registry.get_or_build_agent(agent_key, build_agent)
 
-    # Create in-memory SQLite session for conversation persistence
+    # Create the SQLite session for conversation persistence
     session_id = session_id or new_id()
-    session = SQLiteSession(db_path=":memory:", session_id=session_id)
+    session = open_session(session_id, behavior.session_db_path)
 
     logger.debug(
         "glyph_agent_created model=%s mode=%s user_name=%s session_id=%s tools_count=%d",
@@ -249,7 +382,7 @@ def create_glyph_agent_config(
         mode,
         user_name,
         session_id,
-        len(tools),
+        len(agent.tools),
     )
 
     return AgentConfig(agent=agent, session=session)
@@ -295,6 +428,187 @@ def create_glyph_persona(
     return GlyphPersona(config)
 
 
+# Tool parameter schemas are shared by every registry; they are never mutated.
+_NO_PARAMS_SCHEMA: dict[str, Any] = {"type": "object", "properties": {}}
+
+_CREATE_MISSION_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "title": {"type": "string", "description": "Mission title"},
+        "description": {"type": "string", "description": "Mission description"},
+        "kind": {
+            "type": "string",
+            "enum": ["exam", "project", "habit", "life_admin", "other"],
+        },
+        "deadline_date": {
+            "type": "string",
+            "description": "Deadline in ISO format",
+        },
+    },
+    "required": ["title"],
+}
+
+_CREATE_BLOCK_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "mission_id": {"type": "string"},
+        "title": {"type": "string"},
+        "plan_note": {"type": "string"},
+        "planned_duration_minutes": {"type": "integer"},
+    },
+    "required": ["mission_id"],
+}
+
+_START_BLOCK_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "block_id": {"type": "string"},
+    },
+    "required": ["block_id"],
+}
+
+_COMPLETE_BLOCK_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "block_id": {"type": "string"},
+        "outcome_note": {"type": "string"},
+        "completion_ratio": {"type": "number"},
+    },
+    "required": ["block_id"],
+}
+
+_SAVE_EPISODE_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "kind": {
+            "type": "string",
+            "enum": ["session", "day", "mission", "meta"],
+        },
+        "summary": {"type": "string"},
+        "mission_id": {"type": "string"},
+        "block_id": {"type": "string"},
+    },
+    "required": ["kind", "summary"],
+}
+
+_SEARCH_EPISODES_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "query": {"type": "string"},
+        "limit": {"type": "integer"},
+    },
+    "required": ["query"],
+}
+
+_PLANNER_TOOL_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "raw_input": {
+            "type": "string",
+            "description": "User's natural-language description of the mission or overwhelm.",
+        },
+        "kind": {
+            "type": "string",
+            "enum": ["exam", "project", "habit", "life_admin", "other"],
+            "description": "Optional mission kind. If unsure, omit.",
+        },
+        "deadline": {
+            "type": "string",
+            "description": "Optional deadline in ISO date format (YYYY-MM-DD).",
+        },
+        "estimated_hours": {
+            "type": "number",
+            "description": "Optional rough estimate of hours required.",
+        },
+        "surface": {
+            "type": "string",
+            "description": "Optional UI surface name (e.g. 'FOCUS_DOCK', 'OUTORA_LIBRARY').",
+        },
+    },
+    "required": ["raw_input"],
+}
+
+_COACH_TOOL_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "mission_id": {
+            "type": "string",
+            "description": "Optional mission ID to focus on. If omitted, use the active mission.",
+        },
+        "block_id": {
+            "type": "string",
+            "description": "Optional specific block ID to continue.",
+        },
+        "available_minutes": {
+            "type": "integer",
+            "description": "Approximate minutes the user has available for this session.",
+        },
+        "energy_level": {
+            "type": "string",
+            "enum": ["very_low", "low", "medium", "high", "very_high"],
+            "description": "User's approximate energy level, if known.",
+        },
+        "mood_note": {
+            "type": "string",
+            "description": "Short note about how the user feels going into this session.",
+        },
+        "is_continuation": {
+            "type": "boolean",
+            "description": "True if the user is continuing a session already in progress.",
+        },
+        "surface": {
+            "type": "string",
+            "description": "Optional UI surface name.",
+        },
+    },
+    "required": [],
+}
+
+_ARCHIVIST_TOOL_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "kind": {
+            "type": "string",
+            "enum": ["block", "day", "week", "mission"],
+            "description": "What period to reflect on. Use 'day' for today, 'week' for a week view, etc.",
+        },
+        "mission_id": {
+            "type": "string",
+            "description": "Optional mission ID to focus the reflection on.",
+        },
+        "block_id": {
+            "type": "string",
+            "description": "Optional block ID to reflect on a single session.",
+        },
+        "start_date": {
+            "type": "string",
+            "description": "Optional period start date (YYYY-MM-DD).",
+        },
+        "end_date": {
+            "type": "string",
+            "description": "Optional period end date (YYYY-MM-DD).",
+        },
+        "user_reflection": {
+            "type": "string",
+            "description": "User's free-text reflection, if they already wrote one.",
+        },
+        "focus_score": {
+            "type": "integer",
+            "description": "Optional focus score (1–5).",
+        },
+        "energy_score": {
+            "type": "integer",
+            "description": "Optional energy score (1–5).",
+        },
+        "surface": {
+            "type": "string",
+            "description": "Optional UI surface name.",
+        },
+    },
+    "required": ["kind"],
+}
+
+
 def create_tool_registry_from_tools(
     mission_tools: Any,
     timeline_tools: Any,
@@ -321,29 +635,14 @@ def create_tool_registry_from_tools(
     registry.register(
         name="create_mission",
         description="Create a new mission for the user",
-        parameters={
-            "type": "object",
-            "properties": {
-                "title": {"type": "string", "description": "Mission title"},
-                "description": {"type": "string", "description": "Mission description"},
-                "kind": {
-                    "type": "string",
-                    "enum": ["exam", "project", "habit", "life_admin", "other"],
-                },
-                "deadline_date": {
-                    "type": "string",
-                    "description": "Deadline in ISO format",
-                },
-            },
-            "required": ["title"],
-        },
+        parameters=_CREATE_MISSION_SCHEMA,
         handler=mission_tools.create_mission,
     )
 
     registry.register(
         name="get_active_mission",
         description="Get the user's current active mission",
-        parameters={"type": "object", "properties": {}},
+        parameters=_NO_PARAMS_SCHEMA,
         handler=mission_tools.get_active_mission,
     )
 
@@ -351,51 +650,28 @@ def create_tool_registry_from_tools(
     registry.register(
         name="create_block",
         description="Create a focus block for a mission",
-        parameters={
-            "type": "object",
-            "properties": {
-                "mission_id": {"type": "string"},
-                "title": {"type": "string"},
-                "plan_note": {"type": "string"},
-                "planned_duration_minutes": {"type": "integer"},
-            },
-            "required": ["mission_id"],
-        },
+        parameters=_CREATE_BLOCK_SCHEMA,
         handler=timeline_tools.create_block,
     )
 
     registry.register(
         name="start_block",
         description="Start a focus block",
-        parameters={
-            "type": "object",
-            "properties": {
-                "block_id": {"type": "string"},
-            },
-            "required": ["block_id"],
-        },
+        parameters=_START_BLOCK_SCHEMA,
         handler=timeline_tools.start_block,
     )
 
     registry.register(
         name="complete_block",
         description="Complete a focus block",
-        parameters={
-            "type": "object",
-            "properties": {
-                "block_id": {"type": "string"},
-                "outcome_note": {"type": "string"},
-                "completion_ratio": {"type": "number"},
-            },
-            "required": ["block_id"],
-        },
+        parameters=_COMPLETE_BLOCK_SCHEMA,
         handler=timeline_tools.complete_block,
     )
 
     registry.register(
         name="get_today_blocks",
         description="Get blocks scheduled for today",
-        parameters={"type": "object", "properties": {}},
+        parameters=_NO_PARAMS_SCHEMA,
         handler=timeline_tools.get_today_blocks,
     )
 
@@ -403,67 +679,19 @@ def create_tool_registry_from_tools(
     registry.register(
         name="save_episode",
         description="Save a reflection/episode about a session or period",
-        parameters={
-            "type": "object",
-            "properties": {
-                "kind": {
-                    "type": "string",
-                    "enum": ["session", "day", "mission", "meta"],
-                },
-                "summary": {"type": "string"},
-                "mission_id": {"type": "string"},
-                "block_id": {"type": "string"},
-            },
-            "required": ["kind", "summary"],
-        },
+        parameters=_SAVE_EPISODE_SCHEMA,
         handler=memory_tools.save_episode,
     )
 
     registry.register(
         name="search_episodes",
         description="Search past episodes for similar experiences",
-        parameters={
-            "type": "object",
-            "properties": {
-                "query": {"type": "string"},
-                "limit": {"type": "integer"},
-            },
-            "required": ["query"],
-        },
+        parameters=_SEARCH_EPISODES_SCHEMA,
         handler=memory_tools.search_episodes,
     )
 
     # Workflow tools - LangGraph graph invocation
     if workflow_tools is not None:
-        # Planner tool schema
-        planner_tool_schema = {
-            "type": "object",
-            "properties": {
-                "raw_input": {
-                    "type": "string",
-                    "description": "User's natural-language description of the mission or overwhelm.",
-                },
-                "kind": {
-                    "type": "string",
-                    "enum": ["exam", "project", "habit", "life_admin", "other"],
-                    "description": "Optional mission kind. If unsure, omit.",
-                },
-                "deadline": {
-                    "type": "string",
-                    "description": "Optional deadline in ISO date format (YYYY-MM-DD).",
-                },
-                "estimated_hours": {
-                    "type": "number",
-                    "description": "Optional rough estimate of hours required.",
-                },
-                "surface": {
-                    "type": "string",
-                    "description": "Optional UI surface name (e.g. 'FOCUS_DOCK', 'OUTORA_LIBRARY').",
-                },
-            },
-            "required": ["raw_input"],
-        }
-
         registry.register(
             name="plan_mission_via_graph",
             description=(
@@ -471,47 +699,10 @@ def create_tool_registry_from_tools(
                 "planner workflow. Use this when the user is describing exams, "
                 "projects, or general overwhelm and needs a concrete plan."
             ),
-            parameters=planner_tool_schema,
+            parameters=_PLANNER_TOOL_SCHEMA,
             handler=workflow_tools.plan_mission_via_graph,
         )
 
-        # Coach tool schema
-        coach_tool_schema = {
-            "type": "object",
-            "properties": {
-                "mission_id": {
-                    "type": "string",
-                    "description": "Optional mission ID to focus on. If omitted, use the active mission.",
-                },
-                "block_id": {
-                    "type": "string",
-                    "description": "Optional specific block ID to continue.",
-                },
-                "available_minutes": {
-                    "type": "integer",
-                    "description": "Approximate minutes the user has available for this session.",
-                },
-                "energy_level": {
-                    "type": "string",
-                    "enum": ["very_low", "low", "medium", "high", "very_high"],
-                    "description": "User's approximate energy level, if known.",
-                },
-                "mood_note": {
-                    "type": "string",
-                    "description": "Short note about how the user feels going into this session.",
-                },
-                "is_continuation": {
-                    "type": "boolean",
-                    "description": "True if the user is continuing a session already in progress.",
-                },
-                "surface": {
-                    "type": "string",
-                    "description": "Optional UI surface name.",
-                },
-            },
-            "required": [],
-        }
-
         registry.register(
             name="run_session_via_graph",
             description=(
@@ -519,65 +710,20 @@ def create_tool_registry_from_tools(
                 "Use this when the user asks what to work on right now or how "
                 "to use a block of time."
             ),
-            parameters=coach_tool_schema,
+            parameters=_COACH_TOOL_SCHEMA,
             handler=workflow_tools.run_session_via_graph,
         )
 
-        # Archivist tool schema
-        archivist_tool_schema = {
-            "type": "object",
-            "properties": {
-                "kind": {
-                    "type": "string",
-                    "enum": ["block", "day", "week", "mission"],
-                    "description": "What period to reflect on. Use 'day' for today, 'week' for a week view, etc.",
-                },
-                "mission_id": {
-                    "type": "string",
-                    "description": "Optional mission ID to focus the reflection on.",
-                },
-                "block_id": {
-                    "type": "string",
-                    "description": "Optional block ID to reflect on a single session.",
-                },
-                "start_date": {
-                    "type": "string",
-                    "description": "Optional period start date (YYYY-MM-DD).",
-                },
-                "end_date": {
-                    "type": "string",
-                    "description": "Optional period end date (YYYY-MM-DD).",
-                },
-                "user_reflection": {
-                    "type": "string",
-                    "description": "User's free-text reflection, if they already wrote one.",
-                },
-                "focus_score": {
-                    "type": "integer",
-                    "description": "Optional focus score (1–5).",
-                },
-                "energy_score": {
-                    "type": "integer",
-                    "description": "Optional energy score (1–5).",
-                },
-                "surface": {
-                    "type": "string",
-                    "description": "Optional UI surface name.",
-                },
-            },
-            "required": ["kind"],
-        }
-
         registry.register(
             name="reflect_period_via_graph",
             description=(
                 "Reflect on a session/day/week/mission using the archivist workflow. "
                 "Use this when the user wants to look back on a period and see patterns."
             ),
-            parameters=archivist_tool_schema,
+            parameters=_ARCHIVIST_TOOL_SCHEMA,
             handler=workflow_tools.reflect_period_via_graph,
         )
 
-    logger.info("tool_registry_created tool_count=%d", len(registry.list_tools()))
+    logger.info("tool_registry_created tool_count=%d", len(registry))
 
     return registry
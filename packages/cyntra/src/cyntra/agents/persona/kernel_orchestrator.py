@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+from typing import Any
+
 from agents import Agent as SDKAgent
-from agents import ModelSettings, SQLiteSession
+from agents import ModelSettings
 
 from cyntra.agents.config import AgentSettings
-from cyntra.agents.persona.agent_factory import AgentConfig, GlyphPersona, ToolRegistry
+from cyntra.agents.persona.agent_factory import AgentConfig, GlyphPersona, ToolRegistry, open_session
 from cyntra.agents.persona.kernel_prompts import build_kernel_system_prompt
 from cyntra.agents.tools.kernel import KernelTools
 from cyntra.commons import get_logger, new_id
@@ -18,6 +20,76 @@ class KernelOrchestratorPersona(GlyphPersona):
     """Kernel Orchestrator persona using the Agents SDK."""
 
 
+# Tool parameter schemas are shared by every registry; they are never mutated.
+_KERNEL_SKILL_RUN_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "skill_id": {"type": "string"},
+        "inputs": {"type": "object"},
+        "inputs_file": {"type": "string"},
+        "trace_dir": {"type": "string"},
+        "no_trace": {"type": "boolean"},
+        "workcell_id": {"type": "string"},
+        "issue_id": {"type": "string"},
+        "timeout_seconds": {"type": "integer"},
+    },
+    "required": ["skill_id"],
+}
+
+_KERNEL_RUN_ONCE_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "issue_id": {"type": "string"},
+        "universe": {"type": "string"},
+        "max_concurrent": {"type": "integer"},
+        "speculate": {"type": "boolean"},
+        "dry_run": {"type": "boolean"},
+        "timeout_seconds": {"type": "integer"},
+    },
+    "required": [],
+}
+
+_KERNEL_STATUS_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "verbose": {"type": "boolean"},
+    },
+    "required": [],
+}
+
+_KERNEL_STATS_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "cost": {"type": "boolean"},
+        "success_rate": {"type": "boolean"},
+        "timing": {"type": "boolean"},
+    },
+    "required": [],
+}
+
+_KERNEL_READ_FILE_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "path": {"type": "string"},
+        "max_bytes": {"type": "integer"},
+    },
+    "required": ["path"],
+}
+
+_KERNEL_WRITE_FILE_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "path": {"type": "string"},
+        "content": {"type": "string"},
+        "mode": {
+            "type": "string",
+            "enum": ["overwrite", "append"],
+        },
+    },
+    "required": ["path", "content"],
+}
+
+
 def create_kernel_tool_registry(kernel_tools: KernelTools) -> ToolRegistry:
     """Create tool registry for the Kernel Orchestrator."""
     registry = ToolRegistry()
@@ -25,98 +97,42 @@ def create_kernel_tool_registry(kernel_tools: KernelTools) -> ToolRegistry:
     registry.register(
         name="kernel_skill_run",
         description="Run a Cyntra skill by skill_id via the kernel CLI.",
-        parameters={
-            "type": "object",
-            "properties": {
-                "skill_id": {"type": "string"},
-                "inputs": {"type": "object"},
-                "inputs_file": {"type": "string"},
-                "trace_dir": {"type": "string"},
-                "no_trace": {"type": "boolean"},
-                "workcell_id": {"type": "string"},
-                "issue_id": {"type": "string"},
-                "timeout_seconds": {"type": "integer"},
-            },
-            "required": ["skill_id"],
-        },
+        parameters=_KERNEL_SKILL_RUN_SCHEMA,
         handler=kernel_tools.kernel_skill_run,
     )
 
     registry.register(
         name="kernel_run_once",
         description="Run a single kernel cycle (optionally scoped).",
-        parameters={
-            "type": "object",
-            "properties": {
-                "issue_id": {"type": "string"},
-                "universe": {"type": "string"},
-                "max_concurrent": {"type": "integer"},
-                "speculate": {"type": "boolean"},
-                "dry_run": {"type": "boolean"},
-                "timeout_seconds": {"type": "integer"},
-            },
-            "required": [],
-        },
+        parameters=_KERNEL_RUN_ONCE_SCHEMA,
         handler=kernel_tools.kernel_run_once,
     )
 
     registry.register(
         name="kernel_status",
         description="Fetch current kernel status as JSON.",
-        parameters={
-            "type": "object",
-            "properties": {
-                "verbose": {"type": "boolean"},
-            },
-            "required": [],
-        },
+        parameters=_KERNEL_STATUS_SCHEMA,
         handler=kernel_tools.kernel_status,
     )
 
     registry.register(
         name="kernel_stats",
         description="Fetch kernel stats summary.",
-        parameters={
-            "type": "object",
-            "properties": {
-                "cost": {"type": "boolean"},
-                "success_rate": {"type": "boolean"},
-                "timing": {"type": "boolean"},
-            },
-            "required": [],
-        },
+        parameters=_KERNEL_STATS_SCHEMA,
         handler=kernel_tools.kernel_stats,
     )
 
     registry.register(
         name="kernel_read_file",
         description="Read a file within the repo.",
-        parameters={
-            "type": "object",
-            "properties": {
-                "path": {"type": "string"},
-                "max_bytes": {"type": "integer"},
-            },
-            "required": ["path"],
-        },
+        parameters=_KERNEL_READ_FILE_SCHEMA,
         handler=kernel_tools.kernel_read_file,
     )
 
     registry.register(
         name="kernel_write_file",
         description="Write a file within the repo.",
-        parameters={
-            "type": "object",
-            "properties": {
-                "path": {"type": "string"},
-                "content": {"type": "string"},
-                "mode": {
-                    "type": "string",
-                    "enum": ["overwrite", "append"],
-                },
-            },
-            "required": ["path", "content"],
-        },
+        parameters=_KERNEL_WRITE_FILE_SCHEMA,
         handler=kernel_tools.kernel_write_file,
     )
 
@@ -131,34 +147,33 @@ def create_kernel_orchestrator_config(
     session_id: str | None = None,
 ) -> AgentConfig:
     """Create a Kernel Orchestrator Agents-SDK configuration."""
-    system_prompt = build_kernel_system_prompt(extra_context=extra_context)
-
     llm_deployment = settings.llm.default
     behavior = settings.behavior
 
-    model_settings = ModelSettings(
-        temperature=behavior.temperature,
-        max_tokens=behavior.max_tokens,
-    )
-
-    tools = tool_registry.to_function_tools()
-
-    agent = SDKAgent(
-        name="KernelOrchestrator",
-        instructions=system_prompt,
-        model=llm_deployment.model,
-        model_settings=model_settings,
-        tools=tools,
-    )
+    def build_agent() -> SDKAgent:
+        model_settings = ModelSettings(
+            temperature=behavior.temperature,
+            max_tokens=behavior.max_tokens,
+        )
+        return SDKAgent(
+            name="KernelOrchestrator",
+            instructions=build_kernel_system_prompt(extra_context=extra_context),
+            model=llm_deployment.model,
+            model_settings=model_settings,
+            tools=tool_registry.to_function_tools(),
+        )
+
+    agent_key = ("KernelOrchestrator", extra_context, llm_deployment.model, behavior.temperature, behavior.max_tokens)
+    agent = tool_registry.get_or_build_agent(agent_key, build_agent)
 
     session_id = session_id or new_id()
-    session = SQLiteSession(db_path=":memory:", session_id=session_id)
+    session = open_session(session_id, behavior.session_db_path)
 
     logger.debug(
         "kernel_orchestrator_created model=%s session_id=%s tools_count=%d",
         llm_deployment.model,
         session_id,
-        len(tools),
+        len(agent.tools),
     )
 
     return AgentConfig(agent=agent, session=session)
@@ -1,5 +1,7 @@
 """System prompt for the Kernel Orchestrator persona."""
 
+import functools
+
 KERNEL_ORCHESTRATOR_SYSTEM_PROMPT = """You are Kernel Orchestrator, an AI systems executive for Cyntra.
 
 ## Mission
@@ -57,6 +59,7 @@ quality, speed, and cost with between-run updates only.
 """
 
 
+@functools.lru_cache(maxsize=128)
 def build_kernel_system_prompt(extra_context: str | None = None) -> str:
     """Build the kernel orchestrator prompt with optional context."""
     if not extra_context:
@@ -3,6 +3,8 @@
 Based on the MANIFEST.md specification.
 """
 
+import functools
+
 # Core system prompt that defines Glyph's identity
 GLYPH_SYSTEM_PROMPT = """You are Glyph, a slightly cursed, fiercely loyal focus companion.
 
@@ -117,6 +119,7 @@ def get_mode_examples(mode: str) -> str:
     return examples.get(mode, "")
 
 
+@functools.lru_cache(maxsize=128)
 def build_system_prompt(
     mode: str | None = None,
     user_name: str | None = None,
@@ -3,10 +3,13 @@
 This is what apps/backend imports and uses.
 """
 
+import asyncio
+from collections.abc import Sequence
 from typing import Any
 
 from cyntra.agents.config import AgentSettings
 from cyntra.agents.graphs import GraphRouter
+from cyntra.agents.memory.cache import Embedder, LookupCache, SemanticCache, memoize_embedder
 from cyntra.agents.memory.interfaces import RepositoryBundle, SemanticMemory
 from cyntra.agents.persona import (
     GlyphPersona,
@@ -19,6 +22,7 @@ from cyntra.agents.schemas import (
     AgentResponse,
     ChatRequest,
     ChatResponse,
+    Mission,
     PlanMissionRequest,
     PlanMissionResponse,
     ReflectPeriodRequest,
@@ -36,6 +40,7 @@ from cyntra.agents.tools import (
     WorkflowTools,
 )
 from cyntra.commons import SurfaceType, get_logger, new_id
+from cyntra.commons.infra import uvloop_loop_factory
 
 logger = get_logger(__name__)
 
@@ -59,6 +64,13 @@ class GlyphAgentService:
     - Tool calling and argument parsing
     - Conversation memory via Sessions
     - Model configuration via ModelSettings
+
+    Concurrency: one instance serves concurrent requests for all users.
+    The router, its graphs and their repository tools are shared, so graph
+    nodes keep per-request state (UI state included) in each run's own
+    state dict. Repositories and caches are shared and written to; caches
+    are invalidated per user after writes. Turns of the same conversation
+    are serialized by run_batch_async().
     """
 
     def __init__(
@@ -68,6 +80,7 @@ class GlyphAgentService:
         semantic_memory: SemanticMemory | None = None,
         telemetry: Telemetry | None = None,
         openai_client: Any | None = None,  # Deprecated: SDK manages its own client
+        embedder: Embedder | None = None,
     ) -> None:
         """Initialize the Glyph agent service.
 
@@ -78,6 +91,7 @@ class GlyphAgentService:
             telemetry: Optional telemetry handler
             openai_client: Deprecated - the Agents SDK manages its own client.
                           Kept for backward compatibility but ignored.
+            embedder: Optional async text embedder; required for the semantic cache
         """
         self._config = config
         self._repos = repos
@@ -88,8 +102,40 @@ class GlyphAgentService:
         if openai_client is not None:
             logger.warning("openai_client parameter is deprecated; the Agents SDK manages its own client")
 
-        # Initialize graph router
-        self._router = GraphRouter(repos)
+        # Repository read cache
+        lookup_cache = None
+        if config.lookup_cache.enabled:
+            lookup_cache = LookupCache(
+                ttl_seconds=config.lookup_cache.ttl_seconds,
+                max_entries=config.lookup_cache.max_entries,
+            )
+
+        # Semantic chat response and similar-mission caches (need an embedder)
+        if embedder is not None and config.behavior.memoize_embeddings:
+            embedder = memoize_embedder(embedder, config.behavior.embedding_memo_size)
+        self._embedder = embedder
+        self._semantic_cache: SemanticCache[str] | None = None
+        similar_missions_cache: SemanticCache[list[Mission]] | None = None
+        if config.semantic_cache.enabled:
+            if embedder is None:
+                logger.warning("semantic_cache_disabled reason=no_embedder")
+            else:
+                self._semantic_cache = SemanticCache(
+                    threshold=config.semantic_cache.threshold,
+                    ttl_seconds=config.semantic_cache.ttl_seconds,
+                    max_entries=config.semantic_cache.max_entries,
+                )
+                similar_missions_cache = SemanticCache(
+                    threshold=config.semantic_cache.threshold,
+                    ttl_seconds=config.semantic_cache.ttl_seconds,
+                    max_entries=config.semantic_cache.max_entries,
+                )
+        self._router = GraphRouter(
+            repos,
+            lookup_cache=lookup_cache,
+            similar_missions_cache=similar_missions_cache,
+            embedder=embedder,
+        )
 
         # Initialize tools with semantic memory
         self._mission_tools = MissionTools(repos.missions, self._semantic_memory)
@@ -97,7 +143,7 @@ class GlyphAgentService:
         self._memory_tools = MemoryTools(repos.episodes, repos.profiles, self._semantic_memory)
         self._graph_tools = GraphTools(repos.graph)
         self._ui_tools = UITools()
-        self._external_tools = ExternalSignalTools()
+        self._external_tools = ExternalSignalTools(parallel=config.behavior.enable_parallel_tool_execution)
 
         # Create tool registry for persona
         self._tool_registry = create_tool_registry_from_tools(
@@ -136,7 +182,28 @@ class GlyphAgentService:
 
         Each new session creates a WorkflowTools instance bound to the user_id,
         allowing the persona to invoke LangGraph workflows via tools.
+
+        When the semantic cache is enabled, the opening message of a new
+        conversation may be answered from a cached reply to a similar
+        message on the same surface. The session is still created and the
+        cached turn recorded in it, so the conversation can continue. Only
+        replies produced without tool calls are cached: replaying one that
+        used tools would skip their side effects.
         """
+        # Only opening messages are cacheable; later turns depend on history
+        query_vector = None
+        cached = None
+        if self._semantic_cache is not None and self._embedder is not None and not session_id:
+            try:
+                query_vector = await self._embedder(message)
+            except Exception as e:
+                # The cache is an optimization; answer the message uncached
+                logger.warning("semantic_cache_embed_error error=%s", e)
+            else:
+                cached = self._semantic_cache.get(user_id, surface.value, query_vector)
+                if cached is not None:
+                    logger.debug("semantic_cache_hit user_id=%s surface=%s", user_id, surface.value)
+
         # Get or create session
         if not session_id:
             session_id = new_id()
@@ -180,14 +247,20 @@ class GlyphAgentService:
             persona = self._sessions[session_id]
 
         # Send message and get response
-        try:
-            response_msg = await persona.send_message(message)
-            response_content = response_msg.content
-        except Exception as e:
-            # Handle API errors gracefully (e.g., no API key, rate limits)
-            # This allows the service to work in test mode without a valid API key
-            logger.warning("chat_error error=%s", str(e))
-            response_content = "I'm here to help! (Note: LLM service temporarily unavailable)"
+        if cached is not None:
+            await persona.record_turn(message, cached)
+            response_content = cached
+        else:
+            try:
+                response_msg = await persona.send_message(message)
+                response_content = response_msg.content
+                if query_vector is not None and self._semantic_cache is not None and not response_msg.tool_calls:
+                    self._semantic_cache.set(user_id, surface.value, query_vector, response_content)
+            except Exception as e:
+                # Handle API errors gracefully (e.g., no API key, rate limits)
+                # This allows the service to work in test mode without a valid API key
+                logger.warning("chat_error error=%s", e)
+                response_content = "I'm here to help! (Note: LLM service temporarily unavailable)"
 
         logger.debug(
             "chat_response session_id=%s user_id=%s message_length=%d response_length=%d",
@@ -221,6 +294,9 @@ class GlyphAgentService:
 
         response = await self._router.plan_mission(user_id, request)
 
+        # A new mission and its blocks make this user's cached reads and replies stale
+        self.invalidate_cache(user_id)
+
         logger.info(
             "plan_mission_complete user_id=%s mission_id=%s blocks_proposed=%d",
             user_id,
@@ -332,6 +408,70 @@ class GlyphAgentService:
             conversation_id=response.conversation_id,
         )
 
+    # Batch execution
+
+    async def run_batch_async(
+        self,
+        requests: Sequence[tuple[str, ChatRequest]],
+        max_concurrency: int | None = None,
+    ) -> list[ChatResponse]:
+        """Handle many chat requests concurrently.
+
+        Each request goes through handle_chat_request() under a bounded
+        semaphore, so bulk callers (evals, offline replays) overlap LLM
+        round-trips instead of awaiting them one by one.
+
+        Args:
+            requests: (user_id, ChatRequest) pairs
+            max_concurrency: Maximum requests in flight at once
+                (defaults to behavior.batch_max_concurrency)
+
+        Returns:
+            Responses in the same order as the input requests.
+
+        Raises:
+            ValueError: If max_concurrency is less than 1.
+        """
+        limit = self._config.behavior.batch_max_concurrency if max_concurrency is None else max_concurrency
+        if limit < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {limit}")
+        semaphore = asyncio.Semaphore(limit)
+
+        # Turns of the same conversation share a persona, so they run in
+        # input order; distinct conversations run concurrently.
+        conversation_locks: dict[str, asyncio.Lock] = {}
+        for _, request in requests:
+            if request.conversation_id:
+                conversation_locks.setdefault(request.conversation_id, asyncio.Lock())
+
+        async def _run_one(user_id: str, request: ChatRequest) -> ChatResponse:
+            lock = conversation_locks.get(request.conversation_id or "")
+            if lock is None:
+                async with semaphore:
+                    return await self.handle_chat_request(user_id, request)
+            async with lock, semaphore:
+                return await self.handle_chat_request(user_id, request)
+
+        logger.debug("run_batch_start size=%d max_concurrency=%d", len(requests), limit)
+        return list(await asyncio.gather(*(_run_one(user_id, request) for user_id, request in requests)))
+
+    def run_batch(
+        self,
+        requests: Sequence[tuple[str, ChatRequest]],
+        max_concurrency: int | None = None,
+    ) -> list[ChatResponse]:
+        """Synchronous wrapper around run_batch_async() for scripts and evals.
+
+        Runs on a uvloop event loop when uvloop is installed and
+        features.use_uvloop is set. Must not be called from inside a
+        running event loop.
+        """
+        loop_factory = uvloop_loop_factory() if self._config.features.use_uvloop else None
+        return asyncio.run(
+            self.run_batch_async(requests, max_concurrency=max_concurrency),
+            loop_factory=loop_factory,
+        )
+
     # Convenience methods for direct tool access
 
     async def get_active_mission(self, user_id: str) -> Any:
@@ -357,15 +497,40 @@ class GlyphAgentService:
         completion_ratio: float | None = None,
     ) -> Any:
         """Mark a block as completed."""
-        return await self._timeline_tools.complete_block(
+        block = await self._timeline_tools.complete_block(
             block_id,
             outcome_note=outcome_note,
             completion_ratio=completion_ratio,
         )
+        if block is not None:
+            self.invalidate_cache(block.user_id)
+        return block
 
     async def complete_mission(self, mission_id: str) -> Any:
         """Mark a mission as completed."""
-        return await self._mission_tools.complete_mission(mission_id)
+        mission = await self._mission_tools.complete_mission(mission_id)
+        if mission is not None:
+            self.invalidate_cache(mission.user_id)
+        return mission
+
+    # Cache management
+
+    def invalidate_cache(self, user_id: str | None = None) -> int:
+        """Drop cached repository reads, similar-mission searches and chat replies for a user (or everyone).
+
+        Returns the number of entries removed (0 when caching is disabled).
+        """
+        count = 0
+        lookup_cache = self._router.lookup_cache
+        if lookup_cache is not None:
+            count += lookup_cache.invalidate(user_id)
+        similar_missions_cache = self._router.similar_missions_cache
+        if similar_missions_cache is not None:
+            count += similar_missions_cache.invalidate(user_id)
+        if self._semantic_cache is not None:
+            count += self._semantic_cache.invalidate(user_id)
+        logger.debug("cache_invalidated user_id=%s count=%d", user_id, count)
+        return count
 
     # Session management
 
@@ -71,7 +71,7 @@ class KernelOrchestratorService:
             response_msg = await persona.send_message(message)
             response_content = response_msg.content
         except Exception as exc:
-            logger.warning("kernel_orchestrator_chat_error error=%s", str(exc))
+            logger.warning("kernel_orchestrator_chat_error error=%s", exc)
             response_content = "Kernel Orchestrator is unavailable (LLM service error)."
 
         self._telemetry.log_event(
@@ -9,6 +9,7 @@ MVP: All stubbed. Real implementations will integrate with
 adapters when those systems are connected.
 """
 
+import asyncio
 from datetime import datetime, timedelta
 from typing import Any
 
@@ -25,10 +26,13 @@ class ExternalSignalTools:
         browser_adapter: Any | None = None,
         ide_adapter: Any | None = None,
         calendar_adapter: Any | None = None,
+        *,
+        parallel: bool = True,
     ) -> None:
         self._browser = browser_adapter
         self._ide = ide_adapter
         self._calendar = calendar_adapter
+        self._parallel = parallel
 
     async def get_browser_activity(
         self,
@@ -112,18 +116,29 @@ class ExternalSignalTools:
     ) -> str:
         """Get a text summary of current context for the agent.
 
-        Combines signals from all available sources.
+        Combines signals from all available sources. When parallel execution
+        is enabled the sources are queried concurrently. Either way, a
+        failing source's exception propagates to the caller.
         """
         parts = []
 
-        browser = await self.get_browser_activity(user_id)
+        browser: dict[str, Any]
+        ide: dict[str, Any]
+        if self._parallel:
+            browser, ide = await asyncio.gather(
+                self.get_browser_activity(user_id),
+                self.get_ide_activity(user_id),
+            )
+        else:
+            browser = await self.get_browser_activity(user_id)
+            ide = await self.get_ide_activity(user_id)
+
         if browser.get("available"):
             if browser.get("is_in_scope"):
                 parts.append("Browser activity appears on-task")
             else:
                 parts.append("Browser activity may be off-task")
 
-        ide = await self.get_ide_activity(user_id)
         if ide.get("available") and ide.get("active_project"):
             parts.append(f"Active in {ide['active_project']}")
 
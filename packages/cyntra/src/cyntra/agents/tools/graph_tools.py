@@ -3,6 +3,8 @@
 These tools help Glyph understand and navigate the Outora concept graph.
 """
 
+import heapq
+
 from cyntra.agents.memory.interfaces import GraphRepository
 from cyntra.agents.schemas import (
     EdgeType,
@@ -181,9 +183,8 @@ class GraphTools:
                 seen.add(node.id)
                 unique.append(node)
 
-        # For now, just return by importance
-        unique.sort(key=lambda n: n.importance, reverse=True)
-        return unique[:limit]
+        # For now, just return the most important
+        return heapq.nlargest(limit, unique, key=lambda n: n.importance)
 
     async def build_graph_context(
         self,
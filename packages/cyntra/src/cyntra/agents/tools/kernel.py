@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import os
 import subprocess
 import sys
@@ -11,6 +10,7 @@ from pathlib import Path
 from typing import Any
 
 from cyntra.commons import get_logger
+from cyntra.commons.schema import dumps, loads
 
 logger = get_logger(__name__)
 
@@ -121,8 +121,8 @@ class KernelTools:
         if not content:
             return None
         try:
-            return json.loads(content)
-        except json.JSONDecodeError:
+            return loads(content)
+        except ValueError:  # JSONDecodeError from either backend
             return None
 
     async def kernel_skill_run(
@@ -143,7 +143,7 @@ class KernelTools:
         args = ["skills", "run", skill_id, "--json"]
 
         if inputs is not None:
-            serialized = json.dumps(inputs, default=str)
+            serialized = dumps(inputs)
             args += ["--inputs-json", serialized]
         if inputs_file:
             resolved = self._resolve_repo_path(inputs_file)
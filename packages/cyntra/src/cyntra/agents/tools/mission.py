@@ -154,11 +154,14 @@ class MissionTools:
         user_id: str,
         query: str,
         limit: int = 5,
+        *,
+        status: MissionStatus | None = None,
     ) -> list[Mission]:
         """Find past missions similar to a query/description.
 
-        Uses semantic memory if available.
+        Uses semantic memory if available. Pass status to search only
+        missions in that status.
         """
         if self._semantic:
-            return await self._semantic.search_similar_missions(user_id, query, limit=limit)
+            return await self._semantic.search_similar_missions(user_id, query, limit=limit, status=status)
         return []
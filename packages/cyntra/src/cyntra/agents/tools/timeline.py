@@ -1,9 +1,12 @@
 """Timeline/block management tools for the Glyph agent."""
 
+import asyncio
+import weakref
 from datetime import date, datetime, timedelta
+from operator import attrgetter
 
 from cyntra.agents.memory.interfaces import BlocksRepository, MissionsRepository
-from cyntra.agents.schemas import Block, BlockStatus
+from cyntra.agents.schemas import Block, BlockStatus, Mission
 from cyntra.commons import new_id, now_utc
 
 
@@ -11,15 +14,32 @@ class TimelineTools:
     """Tools for managing blocks and the user's timeline.
 
     Blocks are the atomic units of focused work within missions.
+    Today's-blocks reads are shared by every graph run, so at most
+    max_concurrency of them are in flight at once per event loop.
     """
 
     def __init__(
         self,
         blocks_repo: BlocksRepository,
         missions_repo: MissionsRepository,
+        *,
+        max_concurrency: int = 8,
     ) -> None:
         self._blocks = blocks_repo
         self._missions = missions_repo
+        self._max_concurrency = max_concurrency
+        # One semaphore per loop: a semaphore binds to the loop that first waits
+        # on it, and service-level tools outlive the loops run_batch() creates.
+        self._read_limits: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def _read_limit(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self._read_limits.get(loop)
+        if semaphore is None:
+            semaphore = self._read_limits[loop] = asyncio.Semaphore(self._max_concurrency)
+        return semaphore
 
     async def propose_blocks_for_mission(
         self,
@@ -28,12 +48,15 @@ class TimelineTools:
         start_date: date | None = None,
         num_blocks: int = 5,
         default_duration_minutes: int = 25,
+        mission: Mission | None = None,
     ) -> list[Block]:
         """Propose a set of blocks for a mission.
 
         Returns unsaved Block objects that can be reviewed and committed.
+        Pass the already-loaded mission to skip fetching it again.
         """
-        mission = await self._missions.get(mission_id)
+        if mission is None:
+            mission = await self._missions.get(mission_id)
         if not mission:
             return []
 
@@ -166,7 +189,8 @@ class TimelineTools:
 
     async def get_today_blocks(self, user_id: str) -> list[Block]:
         """Get blocks scheduled for today."""
-        return await self._blocks.list_for_user_date(user_id, date.today())
+        async with self._read_limit():
+            return await self._blocks.list_for_user_date(user_id, date.today())
 
     async def get_current_block(self, user_id: str) -> Block | None:
         """Get the user's currently in-progress block."""
@@ -203,7 +227,7 @@ class TimelineTools:
         # Return the one scheduled earliest
         blocks_with_schedule = [b for b in blocks if b.scheduled_start]
         if blocks_with_schedule:
-            return min(blocks_with_schedule, key=lambda b: b.scheduled_start or datetime.max)
+            return min(blocks_with_schedule, key=attrgetter("scheduled_start"))
 
         return blocks[0]  # Return first by sequence if no scheduled times
 
@@ -4,11 +4,12 @@ Note: DB and Redis helpers require optional dependencies.
 Install with: pip install segrada-commons[db] or segrada-commons[redis]
 """
 
-from cyntra.commons.infra.tasks import fire_and_forget
+from cyntra.commons.infra.tasks import fire_and_forget, uvloop_loop_factory
 
 # DB and Redis helpers are imported lazily due to optional deps
 __all__ = [
     "fire_and_forget",
+    "uvloop_loop_factory",
     # Available with [db] extra:
     # "create_async_engine_from_config",
     # "create_session_factory",
@@ -2,7 +2,7 @@
 
 import asyncio
 import logging
-from collections.abc import Awaitable
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 logger = logging.getLogger(__name__)
@@ -36,3 +36,19 @@ def fire_and_forget(coro: Awaitable[Any]) -> asyncio.Task[Any]:
             return None
 
     return asyncio.create_task(_wrapper())
+
+
+def uvloop_loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Get uvloop's event loop constructor for asyncio.run(loop_factory=...).
+
+    Unlike installing a global event loop policy, this only affects the loop
+    the caller creates. Requires the 'uvloop' extra: pip install cyntra[uvloop]
+
+    Returns:
+        uvloop.new_event_loop, or None when uvloop is not installed.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
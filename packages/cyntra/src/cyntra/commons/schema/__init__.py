@@ -2,10 +2,13 @@
 
 from cyntra.commons.schema.base import BaseSchema
 from cyntra.commons.schema.errors import ErrorCode, ErrorPayload, ServiceError
+from cyntra.commons.schema.serialization import dumps, loads
 
 __all__ = [
     "BaseSchema",
     "ErrorCode",
     "ErrorPayload",
     "ServiceError",
+    "dumps",
+    "loads",
 ]
@@ -0,0 +1,53 @@
+"""Fast JSON encoding for hot serialization paths.
+
+Uses orjson when the 'orjson' extra is installed (pip install cyntra[orjson]),
+falling back to the standard library otherwise. Output is always str.
+"""
+
+import json
+from datetime import date, datetime, time
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS if orjson is not None else 0
+
+
+def _default(obj: Any) -> Any:
+    """Encode types the JSON backend does not know: Pydantic models as their JSON data, anything else as str.
+
+    Datetimes use ISO 8601 so the stdlib fallback matches orjson's output.
+    """
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    model_dump = getattr(obj, "model_dump", None)
+    if model_dump is not None:
+        return model_dump(mode="json")
+    return str(obj)
+
+
+def dumps(obj: Any) -> str:
+    """Encode obj as compact JSON.
+
+    Pydantic models are encoded as their JSON data; other unknown types
+    are stringified.
+
+    Args:
+        obj: JSON-compatible data (dicts, lists, primitives, datetimes, enums, models).
+
+    Returns:
+        JSON string.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=_default, option=_ORJSON_OPTIONS).decode()
+    return json.dumps(obj, default=_default, separators=(",", ":"))
+
+
+def loads(data: str | bytes) -> Any:
+    """Decode a JSON string or bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -4,13 +4,13 @@ Provides structured logging with context variable integration
 for correlation IDs and request tracking.
 """
 
-import json
 import logging
 import sys
 from datetime import UTC, datetime
 from typing import Any
 
 from cyntra.commons.config.telemetry import TelemetryConfig
+from cyntra.commons.schema.serialization import dumps
 from cyntra.commons.telemetry.context import get_context_dict
 
 
@@ -27,7 +27,8 @@ class StructuredFormatter(logging.Formatter):
 
     def format(self, record: logging.LogRecord) -> str:
         log_dict: dict[str, Any] = {
-            "ts": datetime.now(UTC).isoformat(),
+            # When the record was created, not when a handler got to it
+            "ts": datetime.fromtimestamp(record.created, UTC).isoformat(),
             "level": record.levelname,
             "logger": record.name,
             "msg": record.getMessage(),
@@ -50,7 +51,7 @@ class StructuredFormatter(logging.Formatter):
                 if key not in log_dict:
                     log_dict[key] = getattr(record, key)
 
-        return json.dumps(log_dict, default=str)
+        return dumps(log_dict)
 
 
 class HumanReadableFormatter(logging.Formatter):
@@ -0,0 +1,19 @@
+"""Shared fixtures for cyntra tests."""
+
+import pytest
+
+from cyntra.agents.memory import RepositoryBundle, create_in_memory_repos
+
+
+@pytest.fixture
+def repos() -> RepositoryBundle:
+    """A fresh in-memory repository bundle."""
+    missions, blocks, episodes, profiles, semantic_memory, graph = create_in_memory_repos()
+    return RepositoryBundle(
+        missions=missions,
+        blocks=blocks,
+        episodes=episodes,
+        profiles=profiles,
+        semantic_memory=semantic_memory,
+        graph=graph,
+    )
@@ -0,0 +1,76 @@
+"""Tests for the column-buffered browser and IDE adapters."""
+
+from datetime import UTC, datetime, timedelta, timezone
+
+from cyntra.agents.adapters._kernels import from_ns, to_ns
+from cyntra.agents.adapters.browser import BrowserAdapter, BrowsingEvent
+from cyntra.agents.adapters.ide import CodingEvent, IDEAdapter
+
+
+def _browsing_event(timestamp: datetime, domain: str = "docs.python.org") -> BrowsingEvent:
+    return BrowsingEvent(
+        timestamp=timestamp,
+        domain=domain,
+        url=f"https://{domain}/",
+        title="Docs",
+        duration_seconds=30,
+        category="in_scope",
+    )
+
+
+def _coding_event(timestamp: datetime) -> CodingEvent:
+    return CodingEvent(
+        timestamp=timestamp,
+        project="cyntra",
+        file_path="src/app.py",
+        language="python",
+        lines_added=10,
+        lines_removed=2,
+        duration_seconds=60,
+    )
+
+
+def test_ns_round_trip_is_exact() -> None:
+    ts = datetime(2026, 3, 1, 12, 30, 15, 987654, tzinfo=timezone(timedelta(hours=-5)))
+    ns = to_ns(ts)
+
+    assert ns % 1000 == 0
+    assert from_ns(ns) == ts
+    assert from_ns(ns).tzinfo is UTC
+    assert from_ns(ns).microsecond == 987654
+
+
+async def test_browser_recent_events_keep_instant_and_precision() -> None:
+    adapter = BrowserAdapter()
+    ts = datetime.now(timezone(timedelta(hours=9))).replace(microsecond=123456)
+    adapter.record_events("user-1", [_browsing_event(ts)])
+
+    [event] = await adapter.get_recent_events("user-1")
+
+    assert event.timestamp == ts
+    assert event.timestamp.tzinfo is not None
+    assert event.timestamp.microsecond == 123456
+
+
+async def test_ide_recent_events_keep_instant_and_precision() -> None:
+    adapter = IDEAdapter()
+    ts = datetime.now(UTC).replace(microsecond=654321)
+    adapter.record_events("user-1", [_coding_event(ts)])
+
+    [event] = await adapter.get_recent_events("user-1")
+
+    assert event.timestamp == ts
+    assert event.project == "cyntra"
+    assert event.language == "python"
+
+
+async def test_record_events_trims_rows_past_retention() -> None:
+    adapter = BrowserAdapter({"retention_minutes": 10})
+    now = datetime.now(UTC)
+    adapter.record_events("user-1", [_browsing_event(now - timedelta(minutes=30), "old.example")])
+    adapter.record_events("user-1", [_browsing_event(now, "new.example")])
+
+    events = await adapter.get_recent_events("user-1", minutes=60)
+
+    assert [e.domain for e in events] == ["new.example"]
+    assert await adapter.get_time_by_category("user-1", minutes=60) == {"in_scope": 30, "leak": 0, "neutral": 0}
@@ -0,0 +1,81 @@
+"""Tests for GlyphAgentService batch execution."""
+
+import asyncio
+
+import pytest
+
+from cyntra.agents.config import AgentSettings
+from cyntra.agents.memory import RepositoryBundle
+from cyntra.agents.persona import GlyphPersona, Message
+from cyntra.agents.schemas import AgentMessage, AgentMessageRole, AgentResponse, ChatRequest, ChatResponse
+from cyntra.agents.service import GlyphAgentService
+
+
+class _Handler:
+    """Stands in for handle_chat_request and records how many calls overlap."""
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.peak = 0
+        self.order: list[str] = []
+
+    async def __call__(self, user_id: str, request: ChatRequest) -> ChatResponse:
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        self.order.append(request.message)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        conversation_id = request.conversation_id or user_id
+        response = AgentResponse(
+            message=AgentMessage(role=AgentMessageRole.ASSISTANT, content=f"re: {request.message}"),
+            conversation_id=conversation_id,
+        )
+        return ChatResponse(response=response, conversation_id=conversation_id)
+
+
+def _service(repos: RepositoryBundle, handler: _Handler) -> GlyphAgentService:
+    service = GlyphAgentService(AgentSettings(), repos)
+    service.handle_chat_request = handler  # type: ignore[method-assign]
+    return service
+
+
+async def test_run_batch_async_bounds_concurrency_and_keeps_order(repos: RepositoryBundle) -> None:
+    handler = _Handler()
+    service = _service(repos, handler)
+    requests = [(f"user-{i}", ChatRequest(message=f"m{i}")) for i in range(6)]
+
+    responses = await service.run_batch_async(requests, max_concurrency=2)
+
+    assert [r.response.message.content for r in responses] == [f"re: m{i}" for i in range(6)]
+    assert handler.peak == 2
+
+
+async def test_run_batch_async_serializes_turns_of_one_conversation(repos: RepositoryBundle) -> None:
+    handler = _Handler()
+    service = _service(repos, handler)
+    requests = [("user-1", ChatRequest(message=f"turn {i}", conversation_id="c1")) for i in range(3)]
+
+    await service.run_batch_async(requests, max_concurrency=8)
+
+    assert handler.peak == 1
+    assert handler.order == ["turn 0", "turn 1", "turn 2"]
+
+
+async def test_run_batch_async_rejects_non_positive_concurrency(repos: RepositoryBundle) -> None:
+    service = _service(repos, _Handler())
+
+    with pytest.raises(ValueError):
+        await service.run_batch_async([("user-1", ChatRequest(message="hi"))], max_concurrency=0)
+
+
+def test_run_batch_runs_chats_end_to_end(repos: RepositoryBundle, monkeypatch: pytest.MonkeyPatch) -> None:
+    async def send_message(content: str, **kwargs: object) -> Message:
+        return Message.assistant(content.upper())
+
+    monkeypatch.setattr(GlyphPersona, "send_message", staticmethod(send_message))
+    service = GlyphAgentService(AgentSettings(), repos)
+
+    responses = service.run_batch([("user-1", ChatRequest(message="hi")), ("user-2", ChatRequest(message="yo"))])
+
+    assert [r.response.message.content for r in responses] == ["HI", "YO"]
+    assert responses[0].conversation_id != responses[1].conversation_id
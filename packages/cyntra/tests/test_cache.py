@@ -0,0 +1,207 @@
+"""Tests for the in-process and Redis-backed caches."""
+
+import asyncio
+import time
+from typing import Any
+
+import pytest
+
+from cyntra.agents.memory.cache import CacheEntry, SimpleCache, TieredCache
+
+
+class _FakeRedis:
+    """The slice of the redis.asyncio client TieredCache uses."""
+
+    def __init__(self) -> None:
+        self.values: dict[str, str] = {}
+        self.ttls: dict[str, int] = {}
+
+    async def set(self, key: str, value: str, ex: int | None = None) -> None:
+        self.values[key] = value
+        if ex is not None:
+            self.ttls[key] = ex
+
+    async def delete(self, key: str) -> int:
+        self.ttls.pop(key, None)
+        return 1 if self.values.pop(key, None) is not None else 0
+
+    def pipeline(self, transaction: bool = True) -> "_FakePipeline":
+        return _FakePipeline(self)
+
+
+class _FakePipeline:
+    def __init__(self, redis: _FakeRedis) -> None:
+        self._redis = redis
+        self._commands: list[Any] = []
+
+    async def __aenter__(self) -> "_FakePipeline":
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        return None
+
+    def get(self, key: str) -> None:
+        self._commands.append(lambda: self._redis.values.get(key))
+
+    def ttl(self, key: str) -> None:
+        # Redis returns -2 for a missing key and -1 for a key without expiry
+        self._commands.append(lambda: self._redis.ttls.get(key, -1 if key in self._redis.values else -2))
+
+    async def execute(self) -> list[Any]:
+        return [command() for command in self._commands]
+
+
+def _remaining(cache: SimpleCache[Any], key: str) -> float:
+    return cache._cache[key].expires_at - time.monotonic()
+
+
+async def test_get_or_compute_shares_one_load() -> None:
+    cache: SimpleCache[int] = SimpleCache()
+    calls = 0
+
+    async def load() -> int:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return 42
+
+    results = await asyncio.gather(*(cache.get_or_compute("k", load) for _ in range(5)))
+
+    assert results == [42] * 5
+    assert calls == 1
+    assert cache.get("k") == 42
+
+
+async def test_get_or_compute_does_not_cache_failures() -> None:
+    cache: SimpleCache[int] = SimpleCache()
+
+    async def fail() -> int:
+        raise RuntimeError("backend down")
+
+    async def load() -> int:
+        return 7
+
+    with pytest.raises(RuntimeError):
+        await cache.get_or_compute("k", fail)
+    assert cache.get("k") is None
+    assert await cache.get_or_compute("k", load) == 7
+
+
+async def test_tiered_get_or_compute_caps_l1_ttl_at_redis_ttl() -> None:
+    redis = _FakeRedis()
+    await redis.set("p:k", "42", ex=5)
+    cache: TieredCache[int] = TieredCache(redis, "p", default_ttl_seconds=300)
+
+    async def load() -> int:
+        raise AssertionError("should be served from Redis")
+
+    assert await cache.get_or_compute("k", load) == 42
+    assert _remaining(cache, "k") <= 5
+
+
+async def test_tiered_get_or_compute_loads_once_and_writes_through() -> None:
+    redis = _FakeRedis()
+    cache: TieredCache[dict[str, int]] = TieredCache(redis, "p", default_ttl_seconds=300)
+    calls = 0
+
+    async def load() -> dict[str, int]:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"n": 1}
+
+    results = await asyncio.gather(*(cache.get_or_compute("k", load, ttl_seconds=30) for _ in range(3)))
+
+    assert results == [{"n": 1}] * 3
+    assert calls == 1
+    assert redis.ttls["p:k"] == 30
+    assert 0 < _remaining(cache, "k") <= 30
+
+
+async def test_tiered_aget_warms_l1_from_redis() -> None:
+    redis = _FakeRedis()
+    writer: TieredCache[str] = TieredCache(redis, "p")
+    reader: TieredCache[str] = TieredCache(redis, "p")
+
+    await writer.aset("k", "v", ttl_seconds=10)
+
+    assert reader.get("k") is None
+    assert await reader.aget("k") == "v"
+    assert reader.get("k") == "v"
+    assert _remaining(reader, "k") <= 10
+
+    assert await writer.adelete("k")
+    assert await TieredCache(redis, "p").aget("k") is None
+
+
+def test_simple_cache_evicts_least_recently_used() -> None:
+    cache: SimpleCache[int] = SimpleCache(max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "b" is now least recently used
+
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_cleanup_expired_skips_overwritten_deadlines(monkeypatch: pytest.MonkeyPatch) -> None:
+    clock = _Clock()
+    monkeypatch.setattr(time, "monotonic", clock)
+    cache: SimpleCache[int] = SimpleCache()
+    cache.set("short", 1, ttl_seconds=10)
+    cache.set("long", 2, ttl_seconds=100)
+    cache.set("renewed", 3, ttl_seconds=10)
+    cache.set("renewed", 4, ttl_seconds=100)  # leaves a stale 10s deadline in the heap
+
+    clock.now += 50
+
+    assert cache.cleanup_expired() == 1
+    assert cache.get("short") is None
+    assert cache.get("renewed") == 4
+    assert len(cache) == 2
+
+
+async def test_run_reaper_removes_expired_entries() -> None:
+    cache: SimpleCache[int] = SimpleCache()
+    cache.set("expired", 1, ttl_seconds=0)
+    cache.set("fresh", 2, ttl_seconds=60)
+
+    reaper = asyncio.ensure_future(cache.run_reaper(interval_seconds=0.01))
+    await asyncio.sleep(0.05)
+    reaper.cancel()
+
+    assert len(cache) == 1
+    assert cache.get("fresh") == 2
+
+
+def test_entries_expire_on_the_monotonic_clock(monkeypatch: pytest.MonkeyPatch) -> None:
+    clock = _Clock()
+    monkeypatch.setattr(time, "monotonic", clock)
+    cache: SimpleCache[int] = SimpleCache(default_ttl_seconds=10)
+    cache.set("k", 1)
+
+    clock.now += 9
+    assert cache.get("k") == 1
+
+    clock.now += 2
+    assert cache.get("k") is None
+
+
+def test_cache_entry_has_no_instance_dict() -> None:
+    entry = CacheEntry("value", 60)
+
+    assert not hasattr(entry, "__dict__")
+    assert entry.value == "value"
+    assert not entry.is_expired()
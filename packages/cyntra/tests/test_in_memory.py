@@ -0,0 +1,107 @@
+"""Tests for the in-memory repositories and their secondary indexes."""
+
+from datetime import date, datetime, timedelta
+
+from cyntra.agents.memory import InMemoryBlocksRepository, InMemoryMissionsRepository, InMemorySemanticMemory
+from cyntra.agents.schemas import Block, BlockStatus, Mission, MissionStatus
+
+T0 = datetime(2026, 1, 5, 9, 0)
+
+
+def _mission(mission_id: str, *, minutes: int = 0, status: MissionStatus = MissionStatus.ACTIVE) -> Mission:
+    created = T0 + timedelta(minutes=minutes)
+    return Mission(
+        id=mission_id, user_id="user-1", title=mission_id, status=status, created_at=created, updated_at=created
+    )
+
+
+def _block(block_id: str, **fields: object) -> Block:
+    return Block(id=block_id, user_id="user-1", mission_id="m1", **fields)
+
+
+async def test_missions_listed_newest_first_and_by_status() -> None:
+    repo = InMemoryMissionsRepository()
+    for i, status in enumerate([MissionStatus.ACTIVE, MissionStatus.COMPLETED, MissionStatus.ACTIVE]):
+        await repo.create(_mission(f"m{i}", minutes=i, status=status))
+    await repo.create(_mission("other", minutes=9).model_copy(update={"user_id": "user-2"}))
+
+    assert [m.id for m in await repo.list_for_user("user-1")] == ["m2", "m1", "m0"]
+    assert [m.id for m in await repo.list_for_user("user-1", limit=1, offset=1)] == ["m1"]
+    assert [m.id for m in await repo.list_for_user("user-1", status=MissionStatus.ACTIVE)] == ["m2", "m0"]
+
+    assert await repo.delete("m2")
+    assert [m.id for m in await repo.list_for_user("user-1")] == ["m1", "m0"]
+
+
+async def test_mission_update_after_in_place_mutation() -> None:
+    repo = InMemoryMissionsRepository()
+    await repo.create(_mission("m1"))
+    assert (await repo.get_active_mission("user-1")) is not None
+
+    mission = await repo.get("m1")
+    assert mission is not None
+    mission.status = MissionStatus.COMPLETED
+    await repo.update(mission)
+
+    assert await repo.get_active_mission("user-1") is None
+    assert await repo.list_for_user("user-1", status=MissionStatus.ACTIVE) == []
+    assert [m.id for m in await repo.list_for_user("user-1", status=MissionStatus.COMPLETED)] == ["m1"]
+
+
+async def test_block_update_after_in_place_mutation() -> None:
+    repo = InMemoryBlocksRepository()
+    await repo.create(_block("b1", scheduled_start=T0))
+
+    block = await repo.get("b1")
+    assert block is not None
+    block.status = BlockStatus.IN_PROGRESS
+    block.scheduled_start = T0 + timedelta(days=1)
+    await repo.update(block)
+
+    assert await repo.list_for_mission("m1", status=BlockStatus.PLANNED) == []
+    assert [b.id for b in await repo.list_for_mission("m1", status=BlockStatus.IN_PROGRESS)] == ["b1"]
+    assert await repo.list_for_user_date("user-1", T0.date()) == []
+    assert [b.id for b in await repo.list_for_user_date("user-1", date(2026, 1, 6))] == ["b1"]
+    assert await repo.get_current_block("user-1") is block
+
+    block.status = BlockStatus.COMPLETED
+    await repo.update(block)
+    assert await repo.get_current_block("user-1") is None
+
+
+async def test_blocks_ordered_by_sequence_then_start() -> None:
+    repo = InMemoryBlocksRepository()
+    await repo.create(_block("late", sequence_index=1, scheduled_start=T0 + timedelta(hours=2)))
+    await repo.create(_block("unscheduled", sequence_index=1))
+    await repo.create(_block("early", sequence_index=1, scheduled_start=T0))
+    await repo.create(_block("first", sequence_index=0, scheduled_start=T0 + timedelta(hours=5)))
+
+    assert [b.id for b in await repo.list_for_mission("m1")] == ["first", "early", "late", "unscheduled"]
+    assert [b.id for b in await repo.list_for_mission("m1", limit=2)] == ["first", "early"]
+    assert [b.id for b in await repo.list_for_user_date("user-1", T0.date())] == ["early", "late", "first"]
+
+
+async def test_current_block_is_most_recently_started() -> None:
+    repo = InMemoryBlocksRepository()
+    await repo.create(_block("unstarted", status=BlockStatus.IN_PROGRESS))
+    await repo.create(_block("recent", status=BlockStatus.IN_PROGRESS, actual_start=T0 + timedelta(hours=1)))
+    await repo.create(_block("older", status=BlockStatus.IN_PROGRESS, actual_start=T0))
+
+    current = await repo.get_current_block("user-1")
+    assert current is not None
+    assert current.id == "recent"
+
+
+async def test_similar_missions_with_embedder_respect_min_similarity() -> None:
+    vectors = {"rust": [1.0, 0.0], "go": [0.8, 0.6], "baking": [0.0, 1.0]}
+
+    async def embed(text: str) -> list[float]:
+        return vectors[text.split()[0]]
+
+    memory = InMemorySemanticMemory(embedder=embed)
+    for name in vectors:
+        await memory.add_mission(_mission(name).model_copy(update={"title": name}))
+
+    # Cosine to "rust": go 0.8, baking 0.0
+    assert [m.id for m in await memory.search_similar_missions("user-1", "rust")] == ["rust", "go"]
+    assert [m.id for m in await memory.search_similar_missions("user-1", "rust", min_similarity=0.9)] == ["rust"]
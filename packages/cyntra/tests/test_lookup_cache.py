@@ -0,0 +1,92 @@
+"""Tests for repository read caching and its invalidation."""
+
+import asyncio
+
+from cyntra.agents.config import AgentSettings, LookupCacheConfig
+from cyntra.agents.memory import RepositoryBundle
+from cyntra.agents.memory.cache import LookupCache, SimpleCache
+from cyntra.agents.schemas import PlanMissionRequest, RunSessionRequest
+from cyntra.agents.service import GlyphAgentService
+
+
+def _service(repos: RepositoryBundle) -> GlyphAgentService:
+    settings = AgentSettings(lookup_cache=LookupCacheConfig(enabled=True))
+    return GlyphAgentService(settings, repos)
+
+
+async def test_coach_sees_mission_planned_after_cached_miss(repos: RepositoryBundle) -> None:
+    service = _service(repos)
+
+    # Caches "no active mission" and an empty today's block list
+    first = await service.run_session("user-1", RunSessionRequest())
+    assert "No mission or block available" in first.warnings
+
+    plan = await service.plan_mission("user-1", PlanMissionRequest(raw_input="Write the quarterly report"))
+
+    second = await service.run_session("user-1", RunSessionRequest())
+    assert second.warnings == []
+    assert second.block.mission_id == plan.mission.id
+
+
+async def test_router_invalidates_lookup_cache_after_planning(repos: RepositoryBundle) -> None:
+    service = _service(repos)
+    lookup_cache = service._router.lookup_cache
+    assert lookup_cache is not None
+
+    await service._router.run_session("user-1", RunSessionRequest())
+    assert len(lookup_cache) > 0
+
+    await service._router.plan_mission("user-1", PlanMissionRequest(raw_input="Learn Rust"))
+    assert len(lookup_cache) == 0
+
+
+async def test_lookup_cache_single_flight() -> None:
+    cache = LookupCache()
+    calls = 0
+
+    async def load() -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "profile"
+
+    results = await asyncio.gather(*(cache.get_or_load("user-1", ("profile",), load) for _ in range(10)))
+
+    assert results == ["profile"] * 10
+    assert calls == 1
+    assert await cache.get_or_load("user-1", ("profile",), load) == "profile"
+    assert calls == 1
+
+
+async def test_lookup_cache_drops_load_finishing_after_invalidation() -> None:
+    cache = LookupCache()
+    release = asyncio.Event()
+
+    async def load() -> str:
+        await release.wait()
+        return "stale"
+
+    pending = asyncio.ensure_future(cache.get_or_load("user-1", ("active_mission",), load))
+    await asyncio.sleep(0)
+    cache.invalidate("user-1")
+    release.set()
+
+    assert await pending == "stale"
+    assert len(cache) == 0
+
+
+async def test_simple_cache_single_flight() -> None:
+    cache: SimpleCache[int] = SimpleCache()
+    calls = 0
+
+    async def load() -> int:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return 42
+
+    results = await asyncio.gather(*(cache.get_or_compute("answer", load) for _ in range(10)))
+
+    assert results == [42] * 10
+    assert calls == 1
+    assert cache.get("answer") == 42
@@ -0,0 +1,59 @@
+"""Tests for GlyphPersona agent runs."""
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from cyntra.agents.config import AgentSettings
+from cyntra.agents.persona import GlyphPersona, ToolRegistry, agent_factory, create_glyph_persona
+
+
+class _Runner:
+    """Stands in for agents.Runner; fails on prompts starting with "fail"."""
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.peak = 0
+        self.sessions: list[Any] = []
+
+    async def run(self, agent: Any, content: str, *, session: Any) -> SimpleNamespace:
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        self.sessions.append(session)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        if content.startswith("fail"):
+            raise RuntimeError(content)
+        return SimpleNamespace(final_output=f"re: {content}", new_items=[])
+
+
+@pytest.fixture
+def runner(monkeypatch: pytest.MonkeyPatch) -> _Runner:
+    runner = _Runner()
+    monkeypatch.setattr(agent_factory, "Runner", runner)
+    return runner
+
+
+def _persona() -> GlyphPersona:
+    return create_glyph_persona(AgentSettings(), ToolRegistry())
+
+
+async def test_send_message_batch_keeps_order_and_returns_errors(runner: _Runner) -> None:
+    persona = _persona()
+
+    results = await persona.send_message_batch(["a", "fail b", "c"], max_concurrency=2)
+
+    assert [getattr(r, "content", None) for r in results] == ["re: a", None, "re: c"]
+    assert isinstance(results[1], RuntimeError)
+    assert runner.peak == 2
+
+
+async def test_send_message_batch_uses_ephemeral_sessions(runner: _Runner) -> None:
+    persona = _persona()
+
+    await persona.send_message_batch(["a", "b"])
+
+    assert len({id(s) for s in runner.sessions}) == 2
+    assert persona.session not in runner.sessions
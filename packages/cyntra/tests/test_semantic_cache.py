@@ -0,0 +1,96 @@
+"""Tests for the semantic chat response cache."""
+
+from collections.abc import Sequence
+
+import pytest
+
+from cyntra.agents.config import AgentSettings, SemanticCacheConfig
+from cyntra.agents.memory import RepositoryBundle
+from cyntra.agents.memory.cache import SemanticCache
+from cyntra.agents.persona import GlyphPersona, Message, ToolCall
+from cyntra.agents.service import GlyphAgentService
+
+
+def test_semantic_cache_returns_best_match_above_threshold() -> None:
+    cache: SemanticCache[str] = SemanticCache(threshold=0.9)
+    cache.set("user-1", "chat", [1.0, 0.0], "east")
+    cache.set("user-1", "chat", [0.0, 1.0], "north")
+
+    assert cache.get("user-1", "chat", [0.99, 0.05]) == "east"
+    assert cache.get("user-1", "chat", [1.0, 1.0]) is None  # cosine ~0.71
+    assert cache.get("user-2", "chat", [1.0, 0.0]) is None
+    assert cache.get("user-1", "other", [1.0, 0.0]) is None
+
+
+def test_semantic_cache_evicts_least_recently_used() -> None:
+    cache: SemanticCache[str] = SemanticCache(threshold=0.9, max_entries=2)
+    cache.set("user-1", "chat", [1.0, 0.0], "east")
+    cache.set("user-1", "chat", [0.0, 1.0], "north")
+    assert cache.get("user-1", "chat", [1.0, 0.0]) == "east"
+
+    cache.set("user-1", "chat", [-1.0, 0.0], "west")
+
+    assert cache.get("user-1", "chat", [0.0, 1.0]) is None
+    assert cache.get("user-1", "chat", [1.0, 0.0]) == "east"
+    assert cache.invalidate("user-1") == 2
+    assert len(cache) == 0
+
+
+class _Replies:
+    """Stands in for GlyphPersona.send_message and counts agent runs."""
+
+    def __init__(self, tool_calls: Sequence[ToolCall] = ()) -> None:
+        self.tool_calls = list(tool_calls)
+        self.runs = 0
+
+    async def send_message(self, content: str, **kwargs: object) -> Message:
+        self.runs += 1
+        return Message.assistant(f"reply {self.runs}", tool_calls=self.tool_calls)
+
+
+async def _embed(text: str) -> list[float]:
+    return [1.0, float(len(text) % 2)]
+
+
+def _service(repos: RepositoryBundle, embedder=_embed) -> GlyphAgentService:
+    settings = AgentSettings(semantic_cache=SemanticCacheConfig(enabled=True))
+    return GlyphAgentService(settings, repos, embedder=embedder)
+
+
+async def test_chat_replays_cached_reply(repos: RepositoryBundle, monkeypatch: pytest.MonkeyPatch) -> None:
+    replies = _Replies()
+    monkeypatch.setattr(GlyphPersona, "send_message", replies.send_message)
+    service = _service(repos)
+
+    first = await service.chat("user-1", "hello there")
+    second = await service.chat("user-1", "hello there")
+
+    assert replies.runs == 1
+    assert second.message.content == first.message.content
+    assert second.session_id != first.session_id
+
+
+async def test_chat_does_not_cache_replies_that_used_tools(
+    repos: RepositoryBundle, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    replies = _Replies([ToolCall(id="call-1", name="create_mission", arguments={"title": "Rust"})])
+    monkeypatch.setattr(GlyphPersona, "send_message", replies.send_message)
+    service = _service(repos)
+
+    await service.chat("user-1", "start a Rust mission")
+    await service.chat("user-1", "start a Rust mission")
+
+    assert replies.runs == 2
+
+
+async def test_chat_falls_back_when_embedder_fails(repos: RepositoryBundle, monkeypatch: pytest.MonkeyPatch) -> None:
+    async def _broken(text: str) -> list[float]:
+        raise RuntimeError("embedding service down")
+
+    replies = _Replies()
+    monkeypatch.setattr(GlyphPersona, "send_message", replies.send_message)
+    service = _service(repos, embedder=_broken)
+
+    response = await service.chat("user-1", "hello there")
+
+    assert response.message.content == "reply 1"
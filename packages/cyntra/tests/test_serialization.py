@@ -0,0 +1,26 @@
+"""Tests for the JSON encoding helpers."""
+
+from datetime import UTC, date, datetime
+
+import pytest
+
+from cyntra.commons.schema import serialization
+
+VALUE = {
+    "naive": datetime(2026, 1, 2, 3, 4, 5, 6),
+    "aware": datetime(2026, 1, 2, tzinfo=UTC),
+    "day": date(2026, 1, 2),
+}
+
+EXPECTED = '{"naive":"2026-01-02T03:04:05.000006","aware":"2026-01-02T00:00:00+00:00","day":"2026-01-02"}'
+
+
+def test_dumps_encodes_datetimes_as_iso_8601() -> None:
+    assert serialization.dumps(VALUE) == EXPECTED
+
+
+def test_stdlib_fallback_matches_orjson_for_datetimes(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(serialization, "orjson", None)
+
+    assert serialization.dumps(VALUE) == EXPECTED
+    assert serialization.loads(EXPECTED)["day"] == "2026-01-02"